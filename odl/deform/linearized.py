@@ -9,12 +9,15 @@
 """Operators and functions for linearized deformation."""
 
 from __future__ import print_function, division, absolute_import
+from itertools import product
 import numpy as np
 
 from odl.discr import DiscreteLp, Gradient, Divergence
+from odl.discr.discr_mappings import _create_weight_edge_lists
 from odl.operator import Operator, PointwiseInner
 from odl.space import ProductSpace
-from odl.util import signature_string, indent
+from odl.util import signature_string, indent, writable_array
+from odl.util.numerics import _block_slices
 
 
 __all__ = ('LinDeformFixedTempl', 'LinDeformFixedDisp', 'linear_deform')
@@ -70,11 +73,85 @@ def linear_deform(template, displacement, out=None):
     >>> linear_deform(template, displacement_field)
     array([ 0. ,  0. ,  1. ,  0.5,  0. ])
     """
-    image_pts = template.space.points()
+    space = template.space
+    if space.is_uniform and all(n > 1 for n in space.shape):
+        return _linear_deform_uniform(template, displacement, out)
+
+    image_pts = space.points()
     for i, vi in enumerate(displacement):
         image_pts[:, i] += vi.asarray().ravel()
     values = template.interpolation(image_pts.T, out=out, bounds_check=False)
-    return values.reshape(template.space.shape)
+    return values.reshape(space.shape)
+
+
+def _linear_deform_uniform(template, displacement, out=None):
+    """Linearized deformation on a uniform grid, computed in blocks.
+
+    Instead of creating the full ``(N, ndim)`` array of deformed points,
+    the points are processed block by block. On a uniform grid, the
+    indices and normalized distances of the deformed points are computed
+    directly from the grid index and the displacement, without a search
+    in the coordinate vectors. The treatment of points outside the grid
+    is the same as for `DiscreteLp.interpolation`.
+    """
+    space = template.space
+    shape = space.shape
+    ndim = space.ndim
+    schemes = space.interp_byaxis
+    variants = ['left' if scm == 'nearest' else None for scm in schemes]
+    # Displacement in units of the cell sides
+    inv_sides = 1 / space.cell_sides
+
+    templ_flat = template.asarray().ravel()
+    disp_flat = [vi.asarray().ravel() for vi in displacement]
+    strides = [int(np.prod(shape[i + 1:])) for i in range(ndim)]
+
+    if out is None:
+        out = np.empty(shape, dtype=template.dtype)
+
+    with writable_array(out) as out_arr:
+        if out_arr.shape != shape:
+            raise ValueError('`out` must have shape {}, got {}'
+                             ''.format(shape, out_arr.shape))
+        out_flat = out_arr.reshape(-1)
+
+        for blk in _block_slices(templ_flat.size):
+            flat_idx = np.arange(blk.start, blk.stop)
+
+            indices = []
+            norm_distances = []
+            for i in range(ndim):
+                # Grid index along axis i plus displacement in cell units
+                pos = (flat_idx // strides[i]) % shape[i]
+                pos = pos + disp_flat[i][blk] * inv_sides[i]
+                idcs = np.floor(pos).astype(int)
+                np.clip(idcs, 0, shape[i] - 2, out=idcs)
+                indices.append(idcs)
+                norm_distances.append(pos - idcs)
+
+            low_weights, high_weights, edge_indices = (
+                _create_weight_edge_lists(indices, norm_distances, schemes,
+                                          variants))
+
+            # Sum over the 2**ndim neighbors of each point
+            result = np.zeros(flat_idx.size, dtype=out_flat.dtype)
+            for lo_hi in product(*([(0, 1)] * ndim)):
+                weight = 1.0
+                index = 0
+                for i, lh in enumerate(lo_hi):
+                    if lh == 0:
+                        weight = weight * low_weights[i]
+                    else:
+                        weight = weight * high_weights[i]
+                    edge = edge_indices[i][lh] % shape[i]
+                    index = index + edge * strides[i]
+                result += weight * templ_flat[index]
+            out_flat[blk] = result
+
+        if not np.may_share_memory(out_flat, out_arr):
+            out_arr[:] = out_flat.reshape(shape)
+
+    return out
 
 
 class LinDeformFixedTempl(Operator):
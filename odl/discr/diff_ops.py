@@ -15,6 +15,7 @@ from odl.discr.lp_discr import DiscreteLp
 from odl.operator.tensor_ops import PointwiseTensorFieldOperator
 from odl.space import ProductSpace
 from odl.util import writable_array, signature_string, indent
+from odl.util.numerics import _block_slices
 
 
 __all__ = ('PartialDerivative', 'Gradient', 'Divergence', 'Laplacian')
@@ -351,12 +352,13 @@ class Gradient(PointwiseTensorFieldOperator):
         ndim = self.domain.ndim
         dx = self.domain.cell_sides
 
-        for axis in range(ndim):
-            with writable_array(out[axis]) as out_arr:
-                finite_diff(x_arr, axis=axis, dx=dx[axis], method=self.method,
-                            pad_mode=self.pad_mode,
-                            pad_const=self.pad_const,
-                            out=out_arr)
+        _check_diff_shape(x_arr.shape, self.pad_mode)
+
+        terms = [(axis, x_arr, axis, dx[axis], self.method, 1)
+                 for axis in range(ndim)]
+        with _writable_arrays(out) as out_arrs:
+            _stencil_pass(terms, out_arrs, self.pad_mode,
+                          x_arr.dtype.type(self.pad_const))
         return out
 
     def derivative(self, point=None):
@@ -560,17 +562,14 @@ class Divergence(PointwiseTensorFieldOperator):
         ndim = self.range.ndim
         dx = self.range.cell_sides
 
-        tmp = np.empty(out.shape, out.dtype, order=out.space.default_order)
-        with writable_array(out) as out_arr:
-            for axis in range(ndim):
-                finite_diff(x[axis], axis=axis, dx=dx[axis],
-                            method=self.method, pad_mode=self.pad_mode,
-                            pad_const=self.pad_const,
-                            out=tmp)
-                if axis == 0:
-                    out_arr[:] = tmp
-                else:
-                    out_arr += tmp
+        _check_diff_shape(out.shape, self.pad_mode)
+
+        x_arrs = [xi.asarray() for xi in x]
+        terms = [(0, x_arrs[axis], axis, dx[axis], self.method, 1)
+                 for axis in range(ndim)]
+        with _writable_arrays([out]) as out_arrs:
+            _stencil_pass(terms, out_arrs, self.pad_mode,
+                          x_arrs[0].dtype.type(self.pad_const))
 
         return out
 
@@ -710,33 +709,21 @@ class Laplacian(PointwiseTensorFieldOperator):
     def _call(self, x, out=None):
         """Calculate the spatial Laplacian of ``x``."""
         if out is None:
-            out = self.range.zero()
-        else:
-            out.set_zero()
+            out = self.range.element()
 
         x_arr = x.asarray()
-        out_arr = out.asarray()
-        tmp = np.empty(out.shape, out.dtype, order=out.space.default_order)
-
         ndim = self.domain.ndim
         dx = self.domain.cell_sides
 
-        with writable_array(out) as out_arr:
-            for axis in range(ndim):
-                # TODO: this can be optimized
-                finite_diff(x_arr, axis=axis, dx=dx[axis] ** 2,
-                            method='forward',
-                            pad_mode=self.pad_mode,
-                            pad_const=self.pad_const, out=tmp)
+        _check_diff_shape(x_arr.shape, self.pad_mode)
 
-                out_arr += tmp
-
-                finite_diff(x_arr, axis=axis, dx=dx[axis] ** 2,
-                            method='backward',
-                            pad_mode=self.pad_mode,
-                            pad_const=self.pad_const, out=tmp)
-
-                out_arr -= tmp
+        terms = []
+        for axis in range(ndim):
+            terms.append((0, x_arr, axis, dx[axis] ** 2, 'forward', 1))
+            terms.append((0, x_arr, axis, dx[axis] ** 2, 'backward', -1))
+        with _writable_arrays([out]) as out_arrs:
+            _stencil_pass(terms, out_arrs, self.pad_mode,
+                          x_arr.dtype.type(self.pad_const))
 
         return out
 
@@ -929,6 +916,15 @@ def finite_diff(f, axis, dx=1.0, method='forward', out=None, **kwargs):
     if kwargs:
         raise ValueError('unkown keyword argument(s): {}'.format(kwargs))
 
+    return _finite_diff_impl(f_arr, axis, dx, method, pad_mode, pad_const,
+                             out)
+
+
+def _finite_diff_impl(f_arr, axis, dx, method, pad_mode, pad_const, out):
+    """Implementation of `finite_diff` without argument checks."""
+    if out is None:
+        out = np.empty_like(f_arr)
+
     # create slice objects: initially all are [:, :, ..., :]
 
     # Swap axes so that the axis of interest is first. This is a O(1)
@@ -1134,6 +1130,176 @@ def finite_diff(f, axis, dx=1.0, method='forward', out=None, **kwargs):
     return out_in
 
 
+def _check_diff_shape(shape, pad_mode):
+    """Raise if ``shape`` is too small for differences with ``pad_mode``."""
+    for axis, n in enumerate(shape):
+        if n < 2:
+            raise ValueError('in axis {}: at least two elements required, '
+                             'got {}'.format(axis, n))
+        if n < 3 and pad_mode == 'order2':
+            raise ValueError("size of array to small to use 'order2', needs "
+                             "at least 3 elements along axis {}.".format(axis))
+
+
+class _writable_arrays(object):
+
+    """Context manager giving writable arrays for a sequence of elements.
+
+    Unlike `writable_array`, results are only copied back if the arrays
+    do not share memory with the elements.
+    """
+
+    def __init__(self, elements):
+        self.elements = elements
+        self.arrays = None
+
+    def __enter__(self):
+        self.arrays = [el.asarray() for el in self.elements]
+        return self.arrays
+
+    def __exit__(self, type, value, traceback):
+        for el, arr in zip(self.elements, self.arrays):
+            if not np.may_share_memory(arr, el.asarray()):
+                el[:] = arr
+        self.arrays = None
+
+
+class _SlabDiff(object):
+
+    """Finite difference of an array along one axis, computed in slabs.
+
+    The slabs are taken along axis 0, i.e., ``compute(start, stop, out)``
+    writes ``finite_diff(f)[start:stop]`` to ``out``. For ``axis == 0``,
+    the interior rows are computed directly from the neighboring rows,
+    and the 3 rows at each end, which are affected by the boundary
+    treatment, are computed once from small views at the boundaries.
+    """
+
+    # Number of rows at each end of axis 0 affected by padding
+    num_edge = 3
+
+    def __init__(self, f_arr, axis, dx, method, pad_mode, pad_const):
+        self.f_arr = f_arr
+        self.axis = axis
+        self.dx = dx
+        self.method = method
+        self.pad_mode = pad_mode
+        self.pad_const = pad_const
+        self.full = self.head = self.tail = None
+
+        if axis != 0:
+            return
+
+        n, k = f_arr.shape[0], self.num_edge
+        args = (0, dx, method, pad_mode, pad_const)
+        if n < 2 * k:
+            self.full = _finite_diff_impl(f_arr, *(args + (None,)))
+        elif pad_mode == 'periodic':
+            # Use the interior formula with the wrapped-around neighbors
+            head = np.concatenate([f_arr[-1:], f_arr[:k + 1]])
+            tail = np.concatenate([f_arr[-k - 1:], f_arr[:1]])
+            self.head = _finite_diff_impl(head, *(args + (None,)))[1:k + 1]
+            self.tail = _finite_diff_impl(tail, *(args + (None,)))[1:k + 1]
+        else:
+            # The first and last `k` rows are only influenced by the
+            # boundary on the respective side
+            self.head = _finite_diff_impl(f_arr[:2 * k],
+                                          *(args + (None,)))[:k]
+            self.tail = _finite_diff_impl(f_arr[-2 * k:],
+                                          *(args + (None,)))[k:]
+
+    def compute(self, start, stop, out):
+        """Write the rows ``start:stop`` of the difference to ``out``."""
+        f = self.f_arr
+        if self.axis != 0:
+            _finite_diff_impl(f[start:stop], self.axis, self.dx, self.method,
+                              self.pad_mode, self.pad_const, out)
+            return
+        elif self.full is not None:
+            out[:] = self.full[start:stop]
+            return
+
+        n, k = f.shape[0], self.num_edge
+        lo, hi = max(start, k), min(stop, n - k)
+        if lo < hi:
+            out_int = out[lo - start:hi - start]
+            if self.method == 'central':
+                np.subtract(f[lo + 1:hi + 1], f[lo - 1:hi - 1], out=out_int)
+                out_int /= 2.0
+            elif self.method == 'forward':
+                np.subtract(f[lo + 1:hi + 1], f[lo:hi], out=out_int)
+            else:
+                np.subtract(f[lo:hi], f[lo - 1:hi - 1], out=out_int)
+            out_int /= self.dx
+
+        if start < k:
+            out[:k - start] = self.head[start:min(stop, k)]
+        if stop > n - k:
+            first = max(start, n - k)
+            out[first - start:] = self.tail[first - (n - k):stop - (n - k)]
+
+
+def _stencil_pass(terms, out_arrs, pad_mode, pad_const):
+    """Evaluate sums of finite differences in one cache-blocked pass.
+
+    All arrays are processed in slabs along their slowest varying axis.
+    In each slab, all terms are evaluated before moving on to the next
+    one, such that inputs and outputs are only read or written once
+    from main memory (apart from the boundary rows), and only a
+    slab-sized temporary is needed.
+
+    Parameters
+    ----------
+    terms : sequence of tuple
+        Terms ``(out_idx, f_arr, axis, dx, method, sign)``, each
+        standing for ``sign * finite_diff(f_arr, axis, dx, method)``,
+        to be added to ``out_arrs[out_idx]``. All arrays must have the
+        same shape, and terms for the same output must be consecutive.
+    out_arrs : sequence of `numpy.ndarray`
+        Arrays to which the results are written.
+    pad_mode : str
+        Padding mode used for all terms, see `finite_diff`.
+    pad_const : scalar
+        Constant used for ``pad_mode == 'constant'``.
+    """
+    shape = out_arrs[0].shape
+    ndim = len(shape)
+
+    # Process slabs along the slowest axis. For Fortran ordering, use
+    # transposed views with reversed axes.
+    if all(arr.flags.f_contiguous and not arr.flags.c_contiguous
+           for arr in out_arrs):
+        out_arrs = [arr.T for arr in out_arrs]
+        terms = [(oi, f.T, ndim - 1 - axis, dx, method, sign)
+                 for oi, f, axis, dx, method, sign in terms]
+        shape = shape[::-1]
+
+    diffs = [_SlabDiff(f, axis, dx, method, pad_mode, pad_const)
+             for _, f, axis, dx, method, _ in terms]
+
+    slabs = _block_slices(shape[0], unit_size=int(np.prod(shape[1:])))
+    tmp = np.empty((slabs[0].stop if slabs else 0,) + tuple(shape[1:]),
+                   dtype=out_arrs[0].dtype)
+
+    for slab in slabs:
+        start, stop = slab.start, slab.stop
+        tmp_slab = tmp[:stop - start]
+        written = set()
+        for (oi, _, _, _, _, sign), diff in zip(terms, diffs):
+            out_slab = out_arrs[oi][start:stop]
+            if oi not in written and sign == 1:
+                diff.compute(start, stop, out_slab)
+            else:
+                diff.compute(start, stop, tmp_slab)
+                if oi not in written:
+                    np.negative(tmp_slab, out=out_slab)
+                elif sign == 1:
+                    out_slab += tmp_slab
+                else:
+                    out_slab -= tmp_slab
+            written.add(oi)
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()
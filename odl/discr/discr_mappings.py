@@ -25,11 +25,13 @@ from odl.util import (
     is_valid_input_meshgrid, out_shape_from_array, out_shape_from_meshgrid,
     is_string, is_numeric_dtype, signature_string, indent, dtype_repr,
     writable_array)
+from odl.util.numerics import _BLOCK_SIZE, _block_slices
+from odl.util.utility import _cpu_count, _thread_pool
 
 
 __all__ = ('FunctionSpaceMapping',
            'PointCollocation', 'NearestInterpolation', 'LinearInterpolation',
-           'PerAxisInterpolation')
+           'PerAxisInterpolation', 'PreparedInterpolation')
 
 _SUPPORTED_INTERP_SCHEMES = ['nearest', 'linear']
 
@@ -151,7 +153,8 @@ class PointCollocation(FunctionSpaceMapping):
     core discretization classes.
     """
 
-    def __init__(self, fspace, partition, tspace):
+    def __init__(self, fspace, partition, tspace, block_size=None,
+                 num_threads=1):
         """Initialize a new instance.
 
         Parameters
@@ -167,6 +170,17 @@ class PointCollocation(FunctionSpaceMapping):
             Space providing containers for the values/coefficients of a
             discretized object. Its `TensorSpace.shape` must be equal
             to ``partition.shape``.
+        block_size : positive int, optional
+            Maximum number of points at which a function is evaluated
+            at once. Larger grids are split into slabs along the first
+            axis, which bounds the size of temporary arrays created by
+            the function. Grids with at most ``block_size`` points are
+            evaluated on the full sparse meshgrid in one call.
+            Default: ``2 ** 16``
+        num_threads : positive int, optional
+            Number of threads used to evaluate the slabs, at most the
+            number of CPUs. Apart from the calling thread, they are
+            taken from a pool that is shared by all evaluations.
 
         Examples
         --------
@@ -253,20 +267,78 @@ vectorization_guide.html
         super(PointCollocation, self).__init__(
             'sampling', fspace, partition, tspace, linear)
 
+        if block_size is None:
+            block_size = _BLOCK_SIZE
+        self.__block_size, block_size_in = int(block_size), block_size
+        if self.block_size != block_size_in or self.block_size <= 0:
+            raise ValueError('`block_size` must be a positive integer, got '
+                             '{}'.format(block_size_in))
+        self.__num_threads, num_threads_in = int(num_threads), num_threads
+        if self.num_threads != num_threads_in or self.num_threads <= 0:
+            raise ValueError('`num_threads` must be a positive integer, '
+                             'got {}'.format(num_threads_in))
+
+    @property
+    def block_size(self):
+        """Maximum number of points evaluated at once."""
+        return self.__block_size
+
+    @property
+    def num_threads(self):
+        """Number of threads used for the evaluation."""
+        return self.__num_threads
+
     def _call(self, func, out=None, **kwargs):
         """Return ``self(func[, out, **kwargs])``."""
         mesh = self.grid.meshgrid
+        if self.grid.size <= self.block_size:
+            if out is None:
+                out = func(mesh, **kwargs)
+            else:
+                with writable_array(out) as out_arr:
+                    func(mesh, out=out_arr, **kwargs)
+            return out
+
+        # Evaluate slab by slab along the first axis
+        row_size = self.grid.size // self.grid.shape[0]
+        slabs = _block_slices(self.grid.shape[0], row_size, self.block_size)
+
+        def eval_slab(out_arr, slab):
+            """Evaluate ``func`` in the points of ``slab``."""
+            slab_mesh = (mesh[0][slab],) + tuple(mesh[1:])
+            func(slab_mesh, out=out_arr[slab], **kwargs)
+
         if out is None:
-            out = func(mesh, **kwargs)
-        else:
-            with writable_array(out) as out_arr:
-                func(mesh, out=out_arr, **kwargs)
+            out = np.empty(self.range.shape, dtype=self.range.dtype)
+
+        with writable_array(out) as out_arr:
+            # Every thread evaluates every `num_threads`-th slab. The first
+            # thread is the calling one, the others are taken from the
+            # shared pool.
+            from concurrent.futures import wait
+            num_threads = min(self.num_threads, len(slabs), _cpu_count())
+
+            def eval_slabs(first):
+                for slab in slabs[first::num_threads]:
+                    eval_slab(out_arr, slab)
+
+            futures = [_thread_pool().submit(eval_slabs, first)
+                       for first in range(1, num_threads)]
+            try:
+                eval_slabs(0)
+            finally:
+                # Do not leave the context while other threads write
+                wait(futures)
+            for future in futures:
+                future.result()
         return out
 
     def __repr__(self):
         """Return ``repr(self)``."""
         posargs = [self.range, self.grid, self.domain]
-        inner_str = signature_string(posargs, [],
+        optargs = [('block_size', self.block_size, _BLOCK_SIZE),
+                   ('num_threads', self.num_threads, 1)]
+        inner_str = signature_string(posargs, optargs,
                                      sep=[',\n', ', ', ',\n'],
                                      mod=['!r', ''])
         return '{}(\n{}\n)'.format(self.__class__.__name__, indent(inner_str))
@@ -967,6 +1039,294 @@ class _LinearInterpolator(_PerAxisInterpolator):
             nn_variants=[None] * len(coord_vecs))
 
 
+class PreparedInterpolation(object):
+
+    """Interpolation with precomputed indices and weights.
+
+    The evaluation of an interpolator first has to locate the points
+    in the grid and compute the interpolation weights, which is usually
+    more expensive than the interpolation itself. If the same points
+    are used with many different grid values, e.g., in `Resampling` or
+    `LinDeformFixedDisp`, this object does the first part only once.
+
+    The interpolation is stored as sparse matrix, which also gives the
+    exact transpose (adjoint with respect to the unweighted inner
+    products) of the interpolation.
+    """
+
+    def __init__(self, grid, points, schemes='linear', nn_variants='left'):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        grid : `RectGrid`
+            Grid on which the interpolated values are given.
+        points : `array-like` or `meshgrid`
+            Points at which to interpolate. An array needs to have shape
+            ``(grid.ndim, n)`` (or ``(n,)`` for ``grid.ndim == 1``).
+            For a meshgrid, the interpolation is applied separably, i.e.,
+            one sparse matrix per axis is stored.
+        schemes : string or sequence of strings, optional
+            Interpolation scheme (``'nearest'`` or ``'linear'``) for
+            each axis. A single string is used for all axes.
+        nn_variants : string or sequence of strings, optional
+            Variant (``'left'`` or ``'right'``) used in nearest neighbor
+            interpolation for each axis. A single string is used for all
+            axes.
+
+        Examples
+        --------
+        Interpolate different functions at the same points:
+
+        >>> grid = odl.uniform_grid(0, 1, 3)
+        >>> interp = PreparedInterpolation(grid, [0.25, 0.75])
+        >>> interp([0, 1, 0])
+        array([ 0.5,  0.5])
+        >>> interp([1, 2, 3])
+        array([ 1.5,  2.5])
+
+        The transpose maps values at the points back to the grid:
+
+        >>> interp.transpose([1, 1])
+        array([ 0.5,  1. ,  0.5])
+        """
+        ndim = grid.ndim
+        if is_string(schemes):
+            schemes = [schemes] * ndim
+        if is_string(nn_variants) or nn_variants is None:
+            nn_variants = [nn_variants] * ndim
+        schemes = [str(scm).lower() for scm in schemes]
+        nn_variants = [None if scm != 'nearest' else str(var).lower()
+                       for scm, var in zip(schemes, nn_variants)]
+        if len(schemes) != ndim or len(nn_variants) != ndim:
+            raise ValueError('expected {} entries in `schemes` and '
+                             '`nn_variants`, got {} and {}'
+                             ''.format(ndim, len(schemes), len(nn_variants)))
+        for i, (scm, var) in enumerate(zip(schemes, nn_variants)):
+            if scm not in _SUPPORTED_INTERP_SCHEMES:
+                raise ValueError('`schemes[{}]` {!r} not understood'
+                                 ''.format(i, scm))
+            if scm == 'nearest' and var not in ('left', 'right'):
+                raise ValueError('`nn_variants[{}]` {!r} not understood'
+                                 ''.format(i, var))
+
+        self.__grid = grid
+        self.__schemes = tuple(schemes)
+        self.__nn_variants = tuple(nn_variants)
+
+        if is_valid_input_meshgrid(points, ndim):
+            self.__input_type = 'meshgrid'
+            self.__out_shape = out_shape_from_meshgrid(points)
+            # One matrix per axis, mapping grid axis to points axis
+            self.__matrices = tuple(
+                _interp_matrix(cvec, np.asarray(pts).ravel(), scm, var)
+                for cvec, pts, scm, var in zip(
+                    grid.coord_vectors, points, schemes, nn_variants))
+        else:
+            points = np.asarray(points, dtype=float)
+            if points.ndim == 1 and ndim == 1:
+                points = points[None, :]
+            if points.ndim != 2 or points.shape[0] != ndim:
+                raise ValueError('`points` must have shape ({}, n), got '
+                                 'array of shape {}'
+                                 ''.format(ndim, points.shape))
+            self.__input_type = 'array'
+            self.__out_shape = out_shape_from_array(points)
+            self.__matrices = (_interp_matrix_nd(
+                grid.coord_vectors, points, schemes, nn_variants),)
+
+    @property
+    def grid(self):
+        """Grid on which the interpolated values are given."""
+        return self.__grid
+
+    @property
+    def schemes(self):
+        """Interpolation scheme for each axis."""
+        return self.__schemes
+
+    @property
+    def nn_variants(self):
+        """Nearest neighbor variant for each axis."""
+        return self.__nn_variants
+
+    @property
+    def input_type(self):
+        """Type of the points, ``'array'`` or ``'meshgrid'``."""
+        return self.__input_type
+
+    @property
+    def out_shape(self):
+        """Shape of the interpolated values."""
+        return self.__out_shape
+
+    @property
+    def matrix(self):
+        """Interpolation as ``scipy.sparse.csr_matrix``.
+
+        The matrix has shape ``(prod(out_shape), grid.size)`` and acts
+        on C-ordered flattened arrays. For meshgrid points, it is the
+        Kronecker product of the per-axis matrices.
+        """
+        try:
+            return self.__matrix
+        except AttributeError:
+            import scipy.sparse
+            matrix = self.__matrices[0]
+            for mat in self.__matrices[1:]:
+                matrix = scipy.sparse.kron(matrix, mat, format='csr')
+            self.__matrix = matrix.tocsr()
+            return self.__matrix
+
+    def __call__(self, values, out=None):
+        """Interpolate ``values`` at the prepared points.
+
+        Parameters
+        ----------
+        values : `array-like`
+            Values on `grid`, with shape ``grid.shape``.
+        out : `numpy.ndarray`, optional
+            Array of shape `out_shape` to which the result is written.
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Interpolated values. If ``out`` was given, the returned
+            object is a reference to it.
+        """
+        return self.__apply(values, self.grid.shape, self.out_shape, out,
+                            transpose=False)
+
+    def transpose(self, values, out=None):
+        """Apply the transposed interpolation to ``values``.
+
+        Parameters
+        ----------
+        values : `array-like`
+            Values at the points, with shape `out_shape`.
+        out : `numpy.ndarray`, optional
+            Array of shape ``grid.shape`` to which the result is written.
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Result of the transposed interpolation. If ``out`` was given,
+            the returned object is a reference to it.
+        """
+        return self.__apply(values, self.out_shape, self.grid.shape, out,
+                            transpose=True)
+
+    def __apply(self, values, in_shape, out_shape, out, transpose):
+        """Apply the (transposed) matrices."""
+        values = np.asarray(values)
+        if values.shape != in_shape:
+            raise ValueError('`values` must have shape {}, got {}'
+                             ''.format(in_shape, values.shape))
+        if out is not None and out.shape != out_shape:
+            raise ValueError('output shape {} not equal to expected '
+                             'shape {}'.format(out.shape, out_shape))
+
+        if transpose:
+            mats = [mat.T for mat in self.__matrices]
+        else:
+            mats = self.__matrices
+
+        if self.input_type == 'array':
+            result = mats[0].dot(values.ravel())
+        else:
+            # Apply the per-axis matrices along the respective axis
+            result = values
+            for axis, mat in enumerate(mats):
+                moved = np.moveaxis(result, axis, 0)
+                res_shape = (mat.shape[0],) + moved.shape[1:]
+                result = mat.dot(moved.reshape(moved.shape[0], -1))
+                result = np.moveaxis(result.reshape(res_shape), 0, axis)
+
+        result = np.reshape(result, out_shape)
+        if out is None:
+            if all(scm == 'nearest' for scm in self.schemes):
+                dtype = values.dtype
+            else:
+                dtype = np.result_type(values.dtype, float)
+            return np.array(result, dtype=dtype, copy=False, ndmin=1)
+        else:
+            out[:] = result
+            return out
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        posargs = [self.grid]
+        optargs = [('schemes', self.schemes, ()),
+                   ('nn_variants', self.nn_variants, ())]
+        inner_str = signature_string(posargs, optargs,
+                                     sep=[',\n', ', ', ',\n'],
+                                     mod=['!r', ''])
+        return '{}(\n{}\n)'.format(self.__class__.__name__, indent(inner_str))
+
+
+def _interp_weights_edges(coord_vecs, x, schemes, variants):
+    """Return per-axis low/high weights and edge indices for points ``x``.
+
+    This is the same computation as in `_PerAxisInterpolator`, including
+    the treatment of out-of-bounds points.
+    """
+    interp = _Interpolator(coord_vecs, np.empty([len(c) for c in coord_vecs]),
+                           input_type='array')
+    indices, norm_distances = interp._find_indices(x)
+    return _create_weight_edge_lists(indices, norm_distances, schemes,
+                                     variants)
+
+
+def _interp_matrix(cvec, pts, scheme, variant):
+    """Return the 1D interpolation matrix from ``cvec`` to ``pts``."""
+    import scipy.sparse
+    n = len(cvec)
+    if n == 1:
+        # Degenerate axis, only nearest neighbor makes sense
+        data = np.ones(len(pts))
+        cols = np.zeros(len(pts), dtype=int)
+    else:
+        w_lo, w_hi, edge = _interp_weights_edges([cvec], [pts], [scheme],
+                                                 [variant])
+        data = np.concatenate([w_lo[0], w_hi[0]])
+        cols = np.concatenate(edge[0]) % n
+
+    rows = np.tile(np.arange(len(pts)), len(data) // max(len(pts), 1))
+    return scipy.sparse.csr_matrix((data, (rows, cols)),
+                                   shape=(len(pts), n))
+
+
+def _interp_matrix_nd(coord_vecs, points, schemes, variants):
+    """Return the interpolation matrix from a grid to scattered points."""
+    import scipy.sparse
+    shape = tuple(len(cvec) for cvec in coord_vecs)
+    npts = points.shape[1]
+    axes = [i for i, n in enumerate(shape) if n > 1]
+    low_weights, high_weights, edge_indices = _interp_weights_edges(
+        [coord_vecs[i] for i in axes], [points[i] for i in axes],
+        [schemes[i] for i in axes], [variants[i] for i in axes])
+
+    # All 2**ndim combinations of lower and upper neighbors
+    data = []
+    cols = []
+    for lo_hi in product(*([(0, 1)] * len(axes))):
+        weight = np.ones(npts)
+        multi_index = [np.zeros(npts, dtype=int)] * len(shape)
+        for lh, i, w_lo, w_hi, edge in zip(lo_hi, axes, low_weights,
+                                           high_weights, edge_indices):
+            weight = weight * (w_hi if lh else w_lo)
+            multi_index[i] = edge[lh] % shape[i]
+        data.append(weight)
+        cols.append(np.ravel_multi_index(multi_index, shape))
+
+    data = np.concatenate(data)
+    cols = np.concatenate(cols)
+    rows = np.tile(np.arange(npts), len(data) // max(npts, 1))
+    # Duplicates (e.g. from nearest neighbor) are summed up
+    return scipy.sparse.csr_matrix((data, (rows, cols)),
+                                   shape=(npts, int(np.prod(shape))))
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()
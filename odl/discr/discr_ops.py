@@ -12,6 +12,7 @@ from __future__ import print_function, division, absolute_import
 import numpy as np
 
 from odl.discr import DiscreteLp, uniform_partition
+from odl.discr.discr_mappings import PreparedInterpolation
 from odl.operator import Operator
 from odl.set import IntervalProd
 from odl.space import FunctionSpace, tensor_space
@@ -36,7 +37,7 @@ class Resampling(Operator):
     steps.
     """
 
-    def __init__(self, domain, range):
+    def __init__(self, domain, range, precomputed=False):
         """Initialize a new instance.
 
         Parameters
@@ -45,6 +46,12 @@ class Resampling(Operator):
             Set of elements that are to be resampled.
         range : `DiscretizedSpace`
             Set in which the resampled elements lie.
+        precomputed : bool, optional
+            If ``True``, the interpolation from the ``domain`` grid to the
+            ``range`` grid is computed once and stored as one sparse
+            matrix per axis, which are applied axis by axis. This is much
+            faster for repeated evaluation, and `adjoint` is then the
+            exact adjoint. Both spaces need to be `DiscreteLp` spaces.
 
         Examples
         --------
@@ -71,6 +78,13 @@ class Resampling(Operator):
         >>> linear_resampling = odl.Resampling(coarse_discr, fine_discr)
         >>> print(linear_resampling([0, 1, 0]))
         [ 0.  ,  0.25,  0.75,  0.75,  0.25,  0.  ]
+
+        The precomputed variant gives the same result:
+
+        >>> linear_resampling = odl.Resampling(coarse_discr, fine_discr,
+        ...                                    precomputed=True)
+        >>> print(linear_resampling([0, 1, 0]))
+        [ 0.  ,  0.25,  0.75,  0.75,  0.25,  0.  ]
         """
         if domain.fspace != range.fspace:
             raise ValueError('`domain.fspace` ({}) does not match '
@@ -80,13 +94,34 @@ class Resampling(Operator):
         super(Resampling, self).__init__(
             domain=domain, range=range, linear=True)
 
+        self.__precomputed = bool(precomputed)
+        if self.precomputed:
+            if not (isinstance(domain, DiscreteLp) and
+                    isinstance(range, DiscreteLp)):
+                raise TypeError('`precomputed=True` requires `DiscreteLp` '
+                                'spaces, got {!r} and {!r}'
+                                ''.format(domain, range))
+            self.__interp = PreparedInterpolation(
+                domain.grid, range.meshgrid, schemes=domain.interp_byaxis)
+
+    @property
+    def precomputed(self):
+        """``True`` if the resampling uses precomputed sparse matrices."""
+        return self.__precomputed
+
     def _call(self, x, out=None):
         """Apply resampling operator.
 
         The element ``x`` is resampled using the sampling and interpolation
-        operators of the underlying spaces.
+        operators of the underlying spaces, or the precomputed
+        interpolation matrices.
         """
-        if out is None:
+        if self.precomputed:
+            if out is None:
+                return self.__interp(x.asarray())
+            with writable_array(out) as out_arr:
+                self.__interp(x.asarray(), out=out_arr)
+        elif out is None:
             return x.interpolation
         else:
             out.sampling(x.interpolation)
@@ -102,19 +137,22 @@ class Resampling(Operator):
         --------
         adjoint : resampling is unitary, so the adjoint is the inverse.
         """
-        return Resampling(self.range, self.domain)
+        return Resampling(self.range, self.domain,
+                          precomputed=self.precomputed)
 
     @property
     def adjoint(self):
         """Return an (approximate) adjoint.
 
         The result is only exact if the interpolation and sampling
-        operators of the underlying spaces match exactly.
+        operators of the underlying spaces match exactly, or if the
+        resampling is `precomputed`.
 
         Returns
         -------
-        adjoint : Resampling
-            Resampling operator defined in the opposite direction.
+        adjoint : `Operator`
+            Resampling operator defined in the opposite direction, or
+            the exact adjoint for precomputed resampling.
 
         Examples
         --------
@@ -137,8 +175,56 @@ class Resampling(Operator):
         >>> y = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0]
         >>> print(resampling(resampling_inv(y)))
         [ 0.,  0.,  0.,  0.,  0.,  0.]
+
+        The adjoint of the precomputed resampling is exact:
+
+        >>> resampling = odl.Resampling(coarse_discr, fine_discr,
+        ...                             precomputed=True)
+        >>> print(resampling.adjoint(y))
+        [ 0. ,  0.5,  0. ]
         """
-        return self.inverse
+        if not self.precomputed:
+            return self.inverse
+
+        op = self
+        interp = self.__interp
+        # Weighting correction W_dom^(-1) M^T W_ran
+        ran_weight = _weighting_factor(self.range)
+        dom_weight = _weighting_factor(self.domain)
+
+        class ResamplingAdjoint(Operator):
+
+            """Exact adjoint of the precomputed resampling."""
+
+            def __init__(self):
+                """Initialize a new instance."""
+                super(ResamplingAdjoint, self).__init__(
+                    op.range, op.domain, linear=True)
+
+            def _call(self, x, out):
+                """Return ``self(x, out=out)``."""
+                with writable_array(out) as out_arr:
+                    interp.transpose(x.asarray() * ran_weight, out=out_arr)
+                    out_arr /= dom_weight
+
+            @property
+            def adjoint(self):
+                """Adjoint of the adjoint, the resampling operator."""
+                return op
+
+        return ResamplingAdjoint()
+
+
+def _weighting_factor(space):
+    """Return the weighting constant or array of ``space``."""
+    weighting = space.tspace.weighting
+    if hasattr(weighting, 'const'):
+        return weighting.const
+    elif hasattr(weighting, 'array'):
+        return np.asarray(weighting.array)
+    else:
+        raise NotImplementedError('no exact adjoint for weighting {!r}'
+                                  ''.format(weighting))
 
 
 class ResizingOperatorBase(Operator):
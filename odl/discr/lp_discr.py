@@ -1878,9 +1878,10 @@ def uniform_discr_fromdiscr(discr, min_pt=None, max_pt=None,
                                  cell_sides=new_csides,
                                  nodes_on_bdry=nodes_on_bdry)
 
+    kwargs.setdefault('interp', discr.interp)
+    kwargs.setdefault('dtype', discr.dtype)
     return uniform_discr_frompartition(new_part, exponent=discr.exponent,
-                                       interp=discr.interp, impl=discr.impl,
-                                       **kwargs)
+                                       impl=discr.impl, **kwargs)
 
 
 def _scaling_func_list(bdry_fracs, exponent):
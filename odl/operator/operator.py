@@ -13,13 +13,15 @@ from builtins import object
 import inspect
 from numbers import Number, Integral
 import sys
+import threading
 
 from odl.set import LinearSpace, Set, Field
 from odl.set.space import LinearSpaceElement
 from odl.util import cache_arguments
 
 
-__all__ = ('Operator', 'OperatorComp', 'OperatorSum', 'OperatorVectorSum',
+__all__ = ('Operator', 'OperatorComp', 'OperatorSum', 'OperatorLinComb',
+           'OperatorVectorSum',
            'OperatorLeftScalarMult', 'OperatorRightScalarMult',
            'FunctionalLeftVectorMult',
            'OperatorLeftVectorMult', 'OperatorRightVectorMult',
@@ -288,6 +290,42 @@ def _dispatch_call_args(cls=None, bound_call=None, unbound_call=None,
     return has_out, out_optional, spec
 
 
+class _TemporaryCache(object):
+
+    """Lazily allocated temporaries of an operator expression.
+
+    The temporaries are created on first request and stored per thread,
+    such that an operator can be evaluated concurrently from several
+    threads without the evaluations interfering with each other.
+    """
+
+    def __init__(self, enabled=True):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            If ``False``, a new temporary is created on each request.
+        """
+        self.enabled = bool(enabled)
+        self.__local = threading.local()
+
+    def __reduce__(self):
+        """Return data for pickling, leaving out the temporaries."""
+        return type(self), (self.enabled,)
+
+    def element(self, key, space):
+        """Return the temporary ``key``, creating it in ``space`` if needed."""
+        if not self.enabled:
+            return space.element()
+
+        tmps = self.__local.__dict__
+        tmp = tmps.get(key, None)
+        if tmp is None:
+            tmp = tmps[key] = space.element()
+        return tmp
+
+
 class Operator(object):
 
     """Abstract mathematical operator.
@@ -458,6 +496,9 @@ class Operator(object):
         # Cache for efficiency since this is done in each call.
         self.__is_functional = isinstance(range, Field)
 
+        # Approximate maximizer from the last estimate of the norm
+        self.__norm_vector = None
+
         # Mandatory out makes no sense for functionals.
         # However, we need to allow optional out to support vectorized
         # functions (which are functionals in the duck-typing sense).
@@ -567,6 +608,18 @@ class Operator(object):
         """``True`` if this operator's range is a `Field`."""
         return self.__is_functional
 
+    @property
+    def norm_vector(self):
+        """Approximate maximizer of ``||A(x)|| / ||x||``, or ``None``.
+
+        It is stored by `norm` when the norm is estimated with
+        `lanczos_opnorm`, and used as a warm start by later estimates.
+        It can also be passed as ``xstart`` to the estimate of the norm
+        of a related operator, e.g., one with slightly changed
+        parameters.
+        """
+        return self.__norm_vector
+
     @property
     def adjoint(self):
         """Adjoint of this operator (abstract).
@@ -703,8 +756,9 @@ class Operator(object):
         ----------
         estimate : bool
             If true, estimate the operator norm. By default, it is estimated
-            using `power_method_opnorm`, which is only applicable for linear
-            operators.
+            using `lanczos_opnorm` if the operator is linear and has an
+            `adjoint`, otherwise using `power_method_opnorm`, which is only
+            applicable for linear operators.
             Subclasses are allowed to ignore this parameter if they can provide
             an exact value.
 
@@ -712,7 +766,7 @@ class Operator(object):
         ----------------
         kwargs :
             If ``estimate`` is True, pass these arguments to the
-            `power_method_opnorm` call.
+            `lanczos_opnorm` or `power_method_opnorm` call.
 
         Returns
         -------
@@ -733,19 +787,44 @@ class Operator(object):
         >>> spc = odl.uniform_discr(0, 1, 3)
         >>> grad = odl.Gradient(spc)
         >>> opnorm = grad.norm(estimate=True)
+
+        The estimate is stored, hence subsequent calls without further
+        arguments return the same value without evaluating the operator:
+
+        >>> grad.norm(estimate=True) == opnorm
+        True
+
+        The vector of the estimate can be used as starting point for the
+        estimate of a related operator:
+
+        >>> opnorm_2 = (2 * grad).norm(estimate=True, xstart=grad.norm_vector)
         """
         if not estimate:
             raise NotImplementedError('`Operator.norm()` not implemented, use '
                                       '`Operator.norm(estimate=True)` to '
                                       'obtain an estimate.')
-        else:
-            norm = getattr(self, '__norm', None)
-            if norm is not None:
-                return norm
-            else:
-                from odl.operator.oputils import power_method_opnorm
-                self.__norm = power_method_opnorm(self, **kwargs)
+
+        if not kwargs:
+            try:
                 return self.__norm
+            except AttributeError:
+                pass
+
+        from odl.operator.oputils import lanczos_opnorm, power_method_opnorm
+        try:
+            use_lanczos = self.is_linear and self.adjoint is not None
+        except NotImplementedError:
+            use_lanczos = False
+
+        if use_lanczos:
+            if 'xstart' not in kwargs:
+                # Warm start from a previous estimate, if available
+                kwargs['xstart'] = self.norm_vector
+            self.__norm, self.__norm_vector = lanczos_opnorm(
+                self, return_vector=True, **kwargs)
+        else:
+            self.__norm = power_method_opnorm(self, **kwargs)
+        return self.__norm
 
     def __add__(self, other):
         """Return ``self + other``.
@@ -1079,7 +1158,8 @@ class OperatorSum(Operator):
 
     """
 
-    def __init__(self, left, right, tmp_ran=None, tmp_dom=None):
+    def __init__(self, left, right, tmp_ran=None, tmp_dom=None,
+                 cache_tmp=True):
         """Initialize a new instance.
 
         Parameters
@@ -1096,6 +1176,11 @@ class OperatorSum(Operator):
         tmp_dom : `Operator.domain` element, optional
             Used to avoid the creation of a temporary when applying the
             operator adjoint.
+        cache_tmp : bool, optional
+            If ``True``, temporaries that are not given are allocated on
+            the first in-place evaluation and reused in subsequent ones.
+            They are stored per thread. Use ``False`` to save memory if
+            the operator is evaluated only a few times.
 
         Examples
         --------
@@ -1135,6 +1220,7 @@ class OperatorSum(Operator):
         self.__right = right
         self.__tmp_ran = tmp_ran
         self.__tmp_dom = tmp_dom
+        self.__tmp_cache = _TemporaryCache(cache_tmp)
 
     @property
     def left(self):
@@ -1146,13 +1232,18 @@ class OperatorSum(Operator):
         """The left/second part of this sum."""
         return self.__right
 
+    @property
+    def cache_tmp(self):
+        """``True`` if temporaries are reused between evaluations."""
+        return self.__tmp_cache.enabled
+
     def _call(self, x, out=None):
         """Implement ``self(x[, out])``."""
         if out is None:
             return self.left(x) + self.right(x)
         else:
             tmp = (self.__tmp_ran if self.__tmp_ran is not None
-                   else self.range.element())
+                   else self.__tmp_cache.element('ran', self.range))
             # Write to `tmp` first, otherwise aliased `x` and `out` lead
             # to wrong result
             self.left(x, out=tmp)
@@ -1175,7 +1266,8 @@ class OperatorSum(Operator):
         else:
             return OperatorSum(self.left.derivative(x),
                                self.right.derivative(x),
-                               self.__tmp_dom, self.__tmp_ran)
+                               self.__tmp_ran, self.__tmp_dom,
+                               cache_tmp=self.cache_tmp)
 
     @property
     def adjoint(self):
@@ -1200,7 +1292,8 @@ class OperatorSum(Operator):
             raise OpNotImplementedError('nonlinear operators have no adjoint')
 
         return OperatorSum(self.left.adjoint, self.right.adjoint,
-                           self.__tmp_dom, self.__tmp_ran)
+                           self.__tmp_dom, self.__tmp_ran,
+                           cache_tmp=self.cache_tmp)
 
     def __repr__(self):
         """Return ``repr(self)``."""
@@ -1212,6 +1305,176 @@ class OperatorSum(Operator):
         return '({} + {})'.format(self.left, self.right)
 
 
+class OperatorLinComb(Operator):
+
+    """Expression type for a linear combination of several operators.
+
+        ``OperatorLinComb([A_1, ..., A_n], [a_1, ..., a_n])(x) ==
+        a_1 * A_1(x) + ... + a_n * A_n(x)``
+
+    In contrast to nested `OperatorSum` and `OperatorLeftScalarMult`
+    expressions, all terms are accumulated in a single pass using at most
+    two temporaries, regardless of the number of terms.
+    """
+
+    def __init__(self, operators, scalars=None, cache_tmp=True):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        operators : sequence of `Operator`
+            Operators in the linear combination. All must have the same
+            `Operator.domain` and `Operator.range`, and the range must be
+            a `LinearSpace` or `Field`.
+        scalars : sequence of ``range.field`` elements, optional
+            Coefficients of the operators in the linear combination.
+            Default: all ones
+        cache_tmp : bool, optional
+            If ``True``, temporaries are allocated on the first in-place
+            evaluation and reused in subsequent ones.
+            They are stored per thread.
+
+        Examples
+        --------
+        >>> r3 = odl.rn(3)
+        >>> op = odl.IdentityOperator(r3)
+        >>> lincomb_op = OperatorLinComb([op, 2 * op, op], [1, 2, -1])
+        >>> lincomb_op([1, 2, 3])
+        rn(3).element([  4.,   8.,  12.])
+        """
+        operators = list(operators)
+        if not operators:
+            raise ValueError('`operators` cannot be empty')
+        if scalars is None:
+            scalars = [1] * len(operators)
+        scalars = list(scalars)
+        if len(scalars) != len(operators):
+            raise ValueError('number of scalars {} does not match number of '
+                             'operators {}'.format(len(scalars),
+                                                   len(operators)))
+
+        domain, range = operators[0].domain, operators[0].range
+        if not isinstance(range, (LinearSpace, Field)):
+            raise OpTypeError('range {!r} not a `LinearSpace` or `Field` '
+                              'instance'.format(range))
+        for op, scalar in zip(operators, scalars):
+            if op.domain != domain:
+                raise OpTypeError('operator domains {!r} and {!r} do not '
+                                  'match'.format(domain, op.domain))
+            if op.range != range:
+                raise OpTypeError('operator ranges {!r} and {!r} do not '
+                                  'match'.format(range, op.range))
+            if scalar not in range.field:
+                raise TypeError('`scalar` {!r} not in the field {!r} of the '
+                                'operator range {!r}'
+                                ''.format(scalar, range.field, range))
+
+        super(OperatorLinComb, self).__init__(
+            domain, range, linear=all(op.is_linear for op in operators))
+        self.__operators = tuple(operators)
+        self.__scalars = tuple(scalars)
+        self.__tmp_cache = _TemporaryCache(cache_tmp)
+
+    @property
+    def operators(self):
+        """Tuple of operators in this linear combination."""
+        return self.__operators
+
+    @property
+    def scalars(self):
+        """Tuple of coefficients in this linear combination."""
+        return self.__scalars
+
+    @property
+    def cache_tmp(self):
+        """``True`` if temporaries are reused between evaluations."""
+        return self.__tmp_cache.enabled
+
+    def _call(self, x, out=None):
+        """Implement ``self(x[, out])``."""
+        terms = list(zip(self.scalars, self.operators))
+        if out is None:
+            result = terms[0][0] * terms[0][1](x)
+            for scalar, op in terms[1:]:
+                result += scalar * op(x)
+            return result
+
+        if len(terms) == 1:
+            scalar, op = terms[0]
+            op(x, out=out)
+            out *= scalar
+            return out
+
+        # Accumulate all but the last term in `acc`, otherwise aliased
+        # `x` and `out` lead to wrong result
+        acc = self.__tmp_cache.element('acc', self.range)
+        scalar, op = terms[0]
+        op(x, out=acc)
+        acc *= scalar
+        if len(terms) > 2:
+            tmp = self.__tmp_cache.element('tmp', self.range)
+            for scalar, op in terms[1:-1]:
+                op(x, out=tmp)
+                acc.lincomb(1, acc, scalar, tmp)
+
+        scalar, op = terms[-1]
+        op(x, out=out)
+        out.lincomb(scalar, out, 1, acc)
+        return out
+
+    def derivative(self, x):
+        """Return the operator derivative at ``x``.
+
+        The derivative of a linear combination of operators is equal to
+        the linear combination of the derivatives.
+
+        Parameters
+        ----------
+        x : `domain` `element-like`
+            Evaluation point of the derivative
+        """
+        if self.is_linear:
+            return self
+        else:
+            return OperatorLinComb([op.derivative(x) for op in self.operators],
+                                   self.scalars, cache_tmp=self.cache_tmp)
+
+    @property
+    def adjoint(self):
+        """Adjoint of this operator.
+
+        The adjoint of the linear combination is the linear combination
+        of the operator adjoints with conjugated coefficients.
+
+        Returns
+        -------
+        adjoint : `OperatorLinComb`
+
+        Raises
+        ------
+        OpNotImplementedError
+            If any of the underlying operators are non-linear.
+        """
+        if not self.is_linear:
+            raise OpNotImplementedError('nonlinear operators have no adjoint')
+
+        return OperatorLinComb([op.adjoint for op in self.operators],
+                               [s.conjugate() for s in self.scalars],
+                               cache_tmp=self.cache_tmp)
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return '{}({!r}, {!r})'.format(self.__class__.__name__,
+                                       list(self.operators),
+                                       list(self.scalars))
+
+    def __str__(self):
+        """Return ``str(self)``."""
+        return '({})'.format(' + '.join(
+            '{} * {}'.format(s, op)
+            for s, op in zip(self.scalars, self.operators)))
+
+
 class OperatorVectorSum(Operator):
 
     """Operator that computes ``op(x) + y``.
@@ -1315,7 +1578,7 @@ class OperatorComp(Operator):
     The composition is only well-defined if ``left.domain == right.range``.
     """
 
-    def __init__(self, left, right, tmp=None):
+    def __init__(self, left, right, tmp=None, cache_tmp=True):
         """Initialize a new `OperatorComp` instance.
 
         Parameters
@@ -1328,6 +1591,22 @@ class OperatorComp(Operator):
         tmp : element of the range of ``right``, optional
             Used to avoid the creation of a temporary when applying the
             operator.
+        cache_tmp : bool, optional
+            If ``True`` and ``tmp`` is not given, the temporary is allocated
+            on the first in-place evaluation and reused in subsequent ones.
+            It is stored per thread. Use ``False`` to save memory if
+            the operator is evaluated only a few times.
+
+        Examples
+        --------
+        >>> r3 = odl.rn(3)
+        >>> op = odl.ScalingOperator(r3, 2.0)
+        >>> comp = OperatorComp(op, op)
+        >>> out = r3.element()
+        >>> comp([1, 2, 3], out=out)  # Allocates the temporary
+        rn(3).element([  4.,   8.,  12.])
+        >>> comp([1, 1, 1], out=out)  # Reuses it
+        rn(3).element([ 4.,  4.,  4.])
         """
         if right.range != left.domain:
             raise OpTypeError('`range` {!r} of the right operator {!r} not '
@@ -1347,6 +1626,7 @@ class OperatorComp(Operator):
         self.__left = left
         self.__right = right
         self.__tmp = tmp
+        self.__tmp_cache = _TemporaryCache(cache_tmp)
 
     @property
     def left(self):
@@ -1358,13 +1638,18 @@ class OperatorComp(Operator):
         """The left/second part of this composition."""
         return self.__right
 
+    @property
+    def cache_tmp(self):
+        """``True`` if temporaries are reused between evaluations."""
+        return self.__tmp_cache.enabled
+
     def _call(self, x, out=None):
         """Implement ``self(x[, out])``."""
         if out is None:
             return self.left(self.right(x))
         else:
             tmp = (self.__tmp if self.__tmp is not None
-                   else self.right.range.element())
+                   else self.__tmp_cache.element('tmp', self.right.range))
             self.right(x, out=tmp)
             return self.left(tmp, out=out)
 
@@ -1379,7 +1664,7 @@ class OperatorComp(Operator):
             ``OperatorComp(right.inverse, left.inverse)``
         """
         return OperatorComp(self.right.inverse, self.left.inverse,
-                            self.__tmp)
+                            self.__tmp, cache_tmp=self.cache_tmp)
 
     def derivative(self, x):
         """Return the operator derivative.
@@ -1407,7 +1692,7 @@ class OperatorComp(Operator):
             right_deriv = self.right.derivative(x)
 
             return OperatorComp(left_deriv, right_deriv,
-                                self.__tmp)
+                                self.__tmp, cache_tmp=self.cache_tmp)
 
     @property
     def adjoint(self):
@@ -1432,7 +1717,7 @@ class OperatorComp(Operator):
             raise OpNotImplementedError('nonlinear operators have no adjoint')
 
         return OperatorComp(self.right.adjoint, self.left.adjoint,
-                            self.__tmp)
+                            self.__tmp, cache_tmp=self.cache_tmp)
 
     def __repr__(self):
         """Return ``repr(self)``."""
@@ -1691,7 +1976,7 @@ class OperatorRightScalarMult(Operator):
     a `LinearSpace`.
     """
 
-    def __init__(self, operator, scalar, tmp=None):
+    def __init__(self, operator, scalar, tmp=None, cache_tmp=True):
         """Initialize a new `OperatorLeftScalarMult` instance.
 
         Parameters
@@ -1705,6 +1990,10 @@ class OperatorRightScalarMult(Operator):
         tmp : `domain` element, optional
             Used to avoid the creation of a temporary when applying the
             operator.
+        cache_tmp : bool, optional
+            If ``True`` and ``tmp`` is not given, the temporary is allocated
+            on the first in-place evaluation and reused in subsequent ones.
+            It is stored per thread.
 
         Examples
         --------
@@ -1739,6 +2028,7 @@ class OperatorRightScalarMult(Operator):
         self.__operator = operator
         self.__scalar = scalar
         self.__tmp = tmp
+        self.__tmp_cache = _TemporaryCache(cache_tmp)
 
     @property
     def operator(self):
@@ -1750,6 +2040,11 @@ class OperatorRightScalarMult(Operator):
         """The scalar part of this multiplication."""
         return self.__scalar
 
+    @property
+    def cache_tmp(self):
+        """``True`` if temporaries are reused between evaluations."""
+        return self.__tmp_cache.enabled
+
     def _call(self, x, out=None):
         """Implement ``self(x[, out])``."""
         if out is None:
@@ -1758,7 +2053,7 @@ class OperatorRightScalarMult(Operator):
             if self.__tmp is not None:
                 tmp = self.__tmp
             else:
-                tmp = self.domain.element()
+                tmp = self.__tmp_cache.element('tmp', self.domain)
             tmp.lincomb(self.scalar, x)
             self.operator(tmp, out=out)
 
@@ -1770,7 +2065,8 @@ class OperatorRightScalarMult(Operator):
 
         if other in self.range.field:
             return OperatorRightScalarMult(self.operator, self.scalar * other,
-                                           self.__tmp)
+                                           self.__tmp,
+                                           cache_tmp=self.cache_tmp)
         else:
             return super(OperatorRightScalarMult, self).__rmul__(other)
 
@@ -9,19 +9,30 @@
 """Convenience functions for operators."""
 
 from __future__ import print_function, division, absolute_import
+from collections import OrderedDict
 from future.utils import native
 import numpy as np
-
+import threading
+
+from odl.operator.default_ops import (
+    IdentityOperator, MultiplyOperator, ScalingOperator, ZeroOperator)
+from odl.operator.operator import (
+    Operator, OperatorComp, OperatorLeftScalarMult, OperatorLinComb,
+    OperatorRightScalarMult, OperatorSum, OperatorVectorSum)
+from odl.operator.tensor_ops import MatrixOperator, SamplingOperator
+from odl.set import LinearSpace
 from odl.space.base_tensors import TensorSpace
-from odl.space import ProductSpace
+from odl.space.pspace import ProductSpace, ProductSpaceElement
 from odl.util import nd_iterator
 from odl.util.testutils import noise_element
 
-__all__ = ('matrix_representation', 'power_method_opnorm', 'as_scipy_operator',
-           'as_scipy_functional', 'as_proximal_lang_operator')
+__all__ = ('matrix_representation', 'power_method_opnorm', 'lanczos_opnorm',
+           'as_scipy_operator', 'as_scipy_functional',
+           'as_proximal_lang_operator', 'simplify', 'CachedOperator',
+           'cached')
 
 
-def matrix_representation(op):
+def matrix_representation(op, sparse=False, num_threads=None):
     """Return a matrix representation of a linear operator.
 
     Parameters
@@ -29,14 +40,23 @@ def matrix_representation(op):
     op : `Operator`
         The linear operator of which one wants a matrix representation.
         If the domain or range is a `ProductSpace`, it must be a power-space.
+    sparse : bool, optional
+        If ``True``, return the matrix in `scipy.sparse.csr_matrix` format.
+        This is the only feasible option for large operators.
+    num_threads : positive int, optional
+        Number of threads used for the column-wise evaluation in the
+        sparse case. By default, the number of CPUs is used.
 
     Returns
     -------
-    matrix : `numpy.ndarray`
+    matrix : `numpy.ndarray` or `scipy.sparse.csr_matrix`
         The matrix representation of the operator.
 
-        The shape will be ``op.domain.shape + op.range.shape`` and the dtype
-        is the promoted (greatest) dtype of the domain and range.
+        In the dense case, the shape will be
+        ``op.range.shape + op.domain.shape``. In the sparse case, the shape
+        is ``(op.range.size, op.domain.size)``, where the flattening is
+        done in "C" order. The dtype is the promoted (greatest) dtype of
+        the domain and range.
 
     Examples
     --------
@@ -80,10 +100,39 @@ def matrix_representation(op):
            [[ 4.  , -4.75],
             [ 4.  , -6.75]]])
 
+    For large operators with few nonzero entries, a sparse matrix can
+    be computed:
+
+    >>> space = odl.uniform_discr(0, 1, 1000)
+    >>> lap = odl.Laplacian(space)
+    >>> matrix = matrix_representation(lap, sparse=True)
+    >>> matrix.shape
+    (1000, 1000)
+    >>> matrix.nnz
+    2998
+
     Notes
     ----------
     The algorithm works by letting the operator act on all unit vectors, and
     stacking the output as a matrix.
+
+    In the sparse case, the number of evaluations is reduced for operators
+    with known local structure, e.g., `Gradient`, `Laplacian`,
+    `SamplingOperator` and sums and compositions thereof. Their columns
+    are grouped such that columns in the same group have non-overlapping
+    nonzero patterns, and the operator is evaluated on the sum of the
+    unit vectors in each group (see `[CM1983]`_). The result is checked
+    against an evaluation on a random element. For all other operators,
+    the columns are evaluated one by one in blocks distributed over
+    ``num_threads`` threads.
+
+    References
+    ----------
+    [CM1983] Coleman, T F, and More, J J. *Estimation of sparse Jacobian
+    matrices and graph coloring problems*. SIAM Journal on Numerical
+    Analysis, 20 (1983), pp 187--209.
+
+    .. _[CM1983]: https://doi.org/10.1137/0720013
     """
 
     if not op.is_linear:
@@ -105,6 +154,9 @@ def matrix_representation(op):
                         'nor `ProductSpace` with only equal `TensorSpace` '
                         'components'.format(op.range))
 
+    if sparse:
+        return _sparse_matrix_representation(op, num_threads)
+
     # Generate the matrix
     dtype = np.promote_types(op.domain.dtype, op.range.dtype)
     matrix = np.zeros(op.range.shape + op.domain.shape, dtype=dtype)
@@ -122,9 +174,217 @@ def matrix_representation(op):
     return matrix
 
 
+def _sparse_matrix_representation(op, num_threads=None):
+    """Return a CSR matrix representing the linear operator ``op``."""
+    import scipy.sparse
+
+    dtype = np.promote_types(op.domain.dtype, op.range.dtype)
+    shape = (op.range.size, op.domain.size)
+
+    probing = _probing_structure(op)
+    if probing is not None:
+        colors, ncolors, resolve = probing
+        rows, cols, data = [], [], []
+        tmp_dom = np.zeros(op.domain.size, dtype=op.domain.dtype)
+        tmp_ran = op.range.element()
+        for color in range(ncolors):
+            tmp_dom[:] = colors == color
+            op(tmp_dom.reshape(op.domain.shape), out=tmp_ran)
+            values = tmp_ran.asarray().reshape(-1)
+            nz_rows = np.flatnonzero(values)
+            nz_cols = resolve(color, nz_rows)
+            if np.any(nz_cols < 0):
+                # Nonzero outside the assumed pattern
+                probing = None
+                break
+            rows.append(nz_rows)
+            cols.append(nz_cols)
+            data.append(values[nz_rows])
+
+    if probing is not None:
+        matrix = scipy.sparse.coo_matrix(
+            (np.concatenate(data).astype(dtype, copy=False),
+             (np.concatenate(rows), np.concatenate(cols))),
+            shape=shape).tocsr()
+        if _is_representation(op, matrix):
+            return matrix
+
+    # Fall back to column-wise evaluation, distributed over threads
+    if num_threads is None:
+        try:
+            from os import cpu_count
+        except ImportError:  # Python 2
+            from multiprocessing import cpu_count
+        num_threads = cpu_count() or 1
+    num_threads, num_threads_in = int(num_threads), num_threads
+    if num_threads <= 0:
+        raise ValueError('`num_threads` must be positive, got {}'
+                         ''.format(num_threads_in))
+
+    blocks = np.array_split(np.arange(op.domain.size),
+                            min(num_threads, op.domain.size))
+
+    def eval_block(block):
+        rows, cols, data = [], [], []
+        tmp_dom = np.zeros(op.domain.size, dtype=op.domain.dtype)
+        tmp_ran = op.range.element()
+        for j in block:
+            tmp_dom[j] = 1
+            op(tmp_dom.reshape(op.domain.shape), out=tmp_ran)
+            tmp_dom[j] = 0
+            values = tmp_ran.asarray().reshape(-1)
+            nz_rows = np.flatnonzero(values)
+            rows.append(nz_rows)
+            cols.append(np.full(nz_rows.size, j, dtype=int))
+            data.append(values[nz_rows])
+        return rows, cols, data
+
+    if len(blocks) == 1:
+        results = [eval_block(blocks[0])]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(blocks)) as pool:
+            results = list(pool.map(eval_block, blocks))
+
+    rows = [r for res in results for r in res[0]]
+    cols = [c for res in results for c in res[1]]
+    data = [d for res in results for d in res[2]]
+    return scipy.sparse.coo_matrix(
+        (np.concatenate(data).astype(dtype, copy=False),
+         (np.concatenate(rows), np.concatenate(cols))),
+        shape=shape).tocsr()
+
+
+def _is_representation(op, matrix):
+    """Return ``True`` if ``matrix`` acts like ``op`` on a random input."""
+    x = noise_element(op.domain)
+    expected = op(x).asarray().reshape(-1)
+    result = matrix.dot(x.asarray().reshape(-1))
+    tol = np.sqrt(np.finfo(matrix.dtype).eps)
+    return (np.linalg.norm(result - expected) <=
+            tol * (np.linalg.norm(expected) +
+                   abs(matrix).max() * np.linalg.norm(x.asarray()) + 1))
+
+
+def _grid_shape(space):
+    """Return the shape of the underlying grid of ``space``, or ``None``."""
+    if isinstance(space, TensorSpace):
+        return space.shape
+    elif (isinstance(space, ProductSpace) and space.is_power_space and
+          isinstance(space[0], TensorSpace)):
+        return space[0].shape
+    else:
+        return None
+
+
+def _stencil_radius(op):
+    """Return the index radius on which outputs of ``op`` depend, or ``None``.
+
+    An operator has stencil radius ``r`` if its output at a grid index
+    ``i`` only depends on inputs at indices ``j`` with
+    ``max_k |i[k] - j[k]| <= r``, for all components.
+    """
+    # Lazy import to avoid circular dependency
+    from odl.discr.diff_ops import (
+        PartialDerivative, Gradient, Divergence, Laplacian)
+
+    if isinstance(op, (PartialDerivative, Gradient, Divergence, Laplacian)):
+        if op.pad_mode == 'periodic':
+            return None
+        elif op.pad_mode == 'constant':
+            return 1
+        else:
+            # Extrapolating boundary conditions use one more point
+            return 2
+    elif isinstance(op, (ScalingOperator, ZeroOperator)):
+        return 0
+    elif isinstance(op, MultiplyOperator):
+        return 0 if op.domain == op.range else None
+    elif isinstance(op, (OperatorLeftScalarMult, OperatorRightScalarMult)):
+        return _stencil_radius(op.operator)
+    elif isinstance(op, OperatorSum):
+        radii = [_stencil_radius(op.left), _stencil_radius(op.right)]
+        return None if None in radii else max(radii)
+    elif isinstance(op, OperatorLinComb):
+        radii = [_stencil_radius(summand) for summand in op.operators]
+        return None if None in radii else max(radii)
+    elif isinstance(op, OperatorComp):
+        if _grid_shape(op.left.domain) != _grid_shape(op.domain):
+            return None
+        radii = [_stencil_radius(op.left), _stencil_radius(op.right)]
+        return None if None in radii else sum(radii)
+    else:
+        return None
+
+
+def _probing_structure(op):
+    """Return a grouping of structurally orthogonal columns of ``op``.
+
+    Returns
+    -------
+    structure : tuple or None
+        ``None`` if no structure is known. Otherwise a tuple
+        ``(colors, ncolors, resolve)``, where ``colors`` is an integer
+        array assigning a group to each (flat) column index,
+        ``ncolors`` the number of groups, and ``resolve(color, rows)`` a
+        function returning for each (flat) row index the column index
+        in group ``color`` that contributes to it, or ``-1`` if no
+        column from the group can contribute.
+    """
+    if isinstance(op, SamplingOperator):
+        # Each output depends on exactly one input
+        indices_flat = np.ravel_multi_index(op.sampling_points,
+                                            dims=op.domain.shape)
+        indices_flat = np.array(indices_flat, dtype=int, ndmin=1)
+
+        def resolve(color, rows):
+            return indices_flat[rows]
+
+        return np.zeros(op.domain.size, dtype=int), 1, resolve
+
+    radius = _stencil_radius(op)
+    grid_shape = _grid_shape(op.domain)
+    if (radius is None or grid_shape is None or
+            _grid_shape(op.range) != grid_shape):
+        return None
+
+    # Columns whose indices agree modulo `2 * radius + 1` in every axis
+    # and that belong to the same component form one group
+    width = 2 * radius + 1
+    ndim = len(grid_shape)
+    ngrid_colors = width ** ndim
+    col_idx = np.unravel_index(np.arange(op.domain.size), op.domain.shape)
+    colors = np.ravel_multi_index([idx % width for idx in col_idx[-ndim:]],
+                                  (width,) * ndim)
+    if len(op.domain.shape) > ndim:
+        colors += col_idx[0] * ngrid_colors
+    ncolors = (op.domain.size // int(np.prod(grid_shape))) * ngrid_colors
+
+    def resolve(color, rows):
+        comp, grid_color = divmod(color, ngrid_colors)
+        grid_color = np.unravel_index(grid_color, (width,) * ndim)
+        row_idx = np.unravel_index(rows, op.range.shape)[-ndim:]
+        col_idx = []
+        valid = np.ones(rows.size, dtype=bool)
+        for i, c, n in zip(row_idx, grid_color, grid_shape):
+            # The unique index `j` with `|i - j| <= radius` and
+            # `j % width == c`
+            j = i - radius + (c - (i - radius)) % width
+            valid &= (j >= 0) & (j < n)
+            col_idx.append(np.where(valid, j, 0))
+
+        if len(op.domain.shape) > ndim:
+            col_idx.insert(0, np.full(rows.size, comp, dtype=int))
+        cols = np.ravel_multi_index(col_idx, op.domain.shape)
+        cols[~valid] = -1
+        return cols
+
+    return colors, ncolors, resolve
+
+
 def power_method_opnorm(op, xstart=None, maxiter=100, rtol=1e-05, atol=1e-08,
                         callback=None):
-    """Estimate the operator norm with the power method.
+    r"""Estimate the operator norm with the power method.
 
     Parameters
     ----------
@@ -260,6 +520,179 @@ def power_method_opnorm(op, xstart=None, maxiter=100, rtol=1e-05, atol=1e-08,
     return opnorm
 
 
+def lanczos_opnorm(op, xstart=None, maxiter=100, rtol=1e-05, atol=1e-08,
+                   krylov_dim=10, callback=None, return_vector=False):
+    r"""Estimate the operator norm with Lanczos bidiagonalization.
+
+    Compared to `power_method_opnorm`, this method typically needs much
+    fewer operator evaluations for the same accuracy, but requires an
+    `Operator.adjoint`.
+
+    Parameters
+    ----------
+    op : `Operator`
+        Linear operator whose norm is to be estimated.
+    xstart : ``op.domain`` `element-like`, optional
+        Starting point of the iteration. By default an `Operator.domain`
+        element containing noise is used. A good starting point, e.g.,
+        the vector returned for a related operator with
+        ``return_vector=True``, reduces the number of iterations.
+    maxiter : positive int, optional
+        Maximum number of evaluations of ``op``. Each evaluation is
+        accompanied by one evaluation of ``op.adjoint``.
+    rtol : float, optional
+        Relative tolerance parameter (see Notes).
+    atol : float, optional
+        Absolute tolerance parameter (see Notes).
+    krylov_dim : int, optional
+        Maximum dimension of the Krylov subspace before the iteration is
+        restarted, at least 2. The method stores ``krylov_dim``
+        elements of ``op.domain``.
+    callback : callable, optional
+        Function called with the current estimate in each iteration.
+    return_vector : bool, optional
+        If ``True``, additionally return an approximation of the right
+        singular vector belonging to the largest singular value.
+
+    Returns
+    -------
+    est_opnorm : float
+        The estimated operator norm of ``op``.
+    vector : ``op.domain`` element
+        Normalized approximate singular vector. Only returned if
+        ``return_vector`` is ``True``.
+
+    Examples
+    --------
+    >>> mat = np.diag([1.0, 2.0, 3.0])
+    >>> op = odl.MatrixOperator(mat)
+    >>> estimation = lanczos_opnorm(op)
+    >>> round(estimation, ndigits=3)
+    3.0
+
+    Notes
+    -----
+    The method builds an orthonormal basis of the Krylov subspace
+    spanned by :math:`x, A^* A x, (A^* A)^2 x, \dots` by Golub-Kahan
+    bidiagonalization, see `[GV2013]`_, and estimates :math:`||A||` by
+    the largest singular value of the bidiagonal matrix representing
+    :math:`A` in this basis. After ``krylov_dim`` steps, the iteration
+    is restarted from the best approximation of the singular vector.
+
+    The iteration stops after ``maxiter`` operator calls or when
+    consecutive estimates ``a`` and ``b`` satisfy
+
+        ``abs(a - b) <= (atol + rtol * abs(b))``.
+
+    References
+    ----------
+    [GV2013] Golub, G H, and Van Loan, C F. *Matrix Computations*,
+    4th edition. Johns Hopkins University Press, 2013.
+
+    .. _[GV2013]: https://jhupbooks.press.jhu.edu/title/matrix-computations
+    """
+    if not op.is_linear:
+        raise ValueError('the operator is not linear')
+
+    if maxiter is None:
+        maxiter = np.iinfo(int).max
+    maxiter, maxiter_in = int(maxiter), maxiter
+    if maxiter <= 0:
+        raise ValueError('`maxiter` must be positive, got {}'
+                         ''.format(maxiter_in))
+
+    krylov_dim, krylov_dim_in = int(krylov_dim), krylov_dim
+    if krylov_dim < 2:
+        raise ValueError('`krylov_dim` must be at least 2, got {}'
+                         ''.format(krylov_dim_in))
+
+    # Make sure starting point is ok or select initial guess
+    if xstart is None:
+        x = noise_element(op.domain)
+    else:
+        # copy to ensure xstart is not modified
+        x = op.domain.element(xstart).copy()
+
+    x_norm = x.norm()
+    if x_norm == 0:
+        raise ValueError('``xstart`` must be nonzero')
+    x /= x_norm
+
+    adjoint = op.adjoint
+    opnorm = None
+    ncalls = 0
+    converged = False
+    u = op.range.element()
+
+    while not converged and ncalls < maxiter:
+        # Golub-Kahan bidiagonalization, started from `x`.
+        # The Krylov basis of the domain is stored in `basis`.
+        basis = [x]
+        alphas, betas = [], []
+        op(x, out=u)
+        ncalls += 1
+        alpha = u.norm()
+        if alpha == 0:
+            # `x` lies in the null space; this only happens for `op == 0`
+            # or by bad luck with `xstart`
+            opnorm = 0.0
+            break
+        u /= alpha
+        alphas.append(alpha)
+
+        while len(basis) < krylov_dim and ncalls < maxiter:
+            w = adjoint(u)
+            # Full reorthogonalization against the stored basis
+            for v in basis:
+                w.lincomb(1, w, -w.inner(v), v)
+            beta = w.norm()
+            if beta <= np.finfo(float).eps * alphas[0]:
+                # Invariant subspace found, estimate is exact
+                converged = True
+                break
+            w /= beta
+
+            u_new = op(w)
+            ncalls += 1
+            u_new.lincomb(1, u_new, -beta, u)
+            alpha = u_new.norm()
+            if alpha == 0:
+                converged = True
+                break
+            u = u_new
+            u /= alpha
+
+            basis.append(w)
+            alphas.append(alpha)
+            betas.append(beta)
+
+            bidiag = np.diag(alphas) + np.diag(betas, 1)
+            est = np.linalg.norm(bidiag, 2)
+
+            if callback is not None:
+                callback(est)
+
+            if opnorm is not None and np.isclose(est, opnorm, rtol, atol):
+                opnorm = est
+                converged = True
+                break
+            opnorm = est
+
+        # Restart from the Ritz vector of the largest singular value
+        bidiag = np.diag(alphas) + np.diag(betas, 1)
+        _, sigma, right_vecs = np.linalg.svd(bidiag)
+        opnorm = float(sigma[0])
+        x = op.domain.zero()
+        for coeff, v in zip(right_vecs[0], basis):
+            x.lincomb(1, x, coeff, v)
+        x /= x.norm()
+
+    if return_vector:
+        return opnorm, x
+    else:
+        return opnorm
+
+
 def as_scipy_operator(op):
     """Wrap ``op`` as a ``scipy.sparse.linalg.LinearOperator``.
 
@@ -274,7 +707,8 @@ def as_scipy_operator(op):
     -------
     ``scipy.sparse.linalg.LinearOperator`` : linear_op
         The wrapped operator, has attributes ``matvec`` which calls ``op``,
-        and ``rmatvec`` which calls ``op.adjoint``.
+        and ``rmatvec`` which calls ``op.adjoint``, as well as ``matmat``
+        and ``rmatmat`` that apply them to several vectors at once.
 
     Examples
     --------
@@ -287,15 +721,36 @@ def as_scipy_operator(op):
     >>> result
     array([ 0.,  1.,  0.])
 
+    Several vectors can be processed at once, e.g., for the computation
+    of singular values:
+
+    >>> op = odl.MatrixOperator(np.diag([1.0, 2.0, 3.0, 4.0]))
+    >>> scipy_op = as_scipy_operator(op)
+    >>> scipy_op.matmat(np.eye(4)[:, :2])
+    array([[ 1.,  0.],
+           [ 0.,  2.],
+           [ 0.,  0.],
+           [ 0.,  0.]])
+    >>> sigma = sl.svds(scipy_op, k=1, return_singular_vectors=False)
+    >>> np.round(sigma, 3)
+    array([ 4.])
+
     Notes
     -----
     If the data representation of ``op``'s domain and range is of type
-    `NumpyTensorSpace` this incurs no significant overhead. If the space
-    type is ``CudaFn`` or some other nonlocal type, the overhead is
-    significant.
+    `NumpyTensorSpace` this incurs no significant overhead since the
+    input and output arrays are wrapped as elements without copying.
+    If the space type is ``CudaFn`` or some other nonlocal type, or a
+    `ProductSpace`, the overhead is significant.
+
+    For ``matmat`` and ``rmatmat``, operators whose action is given by
+    a matrix, e.g., `MatrixOperator`, `ScalingOperator` and sums,
+    compositions and scalar multiples of these, are applied to all
+    vectors with a single matrix product. Other operators are evaluated
+    once per vector.
     """
     # Lazy import to improve `import odl` time
-    import scipy.sparse
+    import scipy.sparse.linalg
 
     if not op.is_linear:
         raise ValueError('`op` needs to be linear')
@@ -308,15 +763,135 @@ def as_scipy_operator(op):
     shape = (native(op.range.size), native(op.domain.size))
 
     def matvec(v):
-        return (op(v.reshape(op.domain.shape))).asarray().ravel()
+        return _flat_call(op, np.asarray(v).reshape(-1))
 
     def rmatvec(v):
-        return (op.adjoint(v.reshape(op.range.shape))).asarray().ravel()
+        return _flat_call(op.adjoint, np.asarray(v).reshape(-1))
+
+    def matmat(v):
+        return _flat_matmat(op, np.asarray(v))
+
+    def rmatmat(v):
+        return _flat_matmat(op.adjoint, np.asarray(v))
+
+    try:
+        return scipy.sparse.linalg.LinearOperator(shape=shape,
+                                                  matvec=matvec,
+                                                  rmatvec=rmatvec,
+                                                  matmat=matmat,
+                                                  rmatmat=rmatmat,
+                                                  dtype=dtype)
+    except TypeError:
+        # scipy < 1.4 does not support `rmatmat`
+        return scipy.sparse.linalg.LinearOperator(shape=shape,
+                                                  matvec=matvec,
+                                                  rmatvec=rmatvec,
+                                                  matmat=matmat,
+                                                  dtype=dtype)
+
+
+def _flat_call(op, v, out=None):
+    """Evaluate ``op`` on the flat array ``v``, avoiding copies if possible.
+
+    Parameters
+    ----------
+    op : `Operator`
+        Linear operator to evaluate.
+    v : `numpy.ndarray`
+        One-dimensional array of size ``op.domain.size``.
+    out : `numpy.ndarray`, optional
+        One-dimensional array of size ``op.range.size`` to which the
+        result should be written.
+
+    Returns
+    -------
+    out : `numpy.ndarray`
+        The flat result. If ``out`` was given, it is returned.
+    """
+    if out is None:
+        out = np.empty(op.range.size, dtype=op.range.dtype)
+
+    x = op.domain.element(v.reshape(op.domain.shape))
+    if isinstance(op.range, TensorSpace):
+        # Wraps `out` without copy for contiguous Numpy-based spaces
+        result = op.range.element(out.reshape(op.range.shape))
+        op(x, out=result)
+    else:
+        result = op(x)
+
+    result_arr = result.asarray().reshape(-1)
+    if not np.may_share_memory(result_arr, out):
+        out[:] = result_arr
+    return out
+
+
+def _flat_matmat(op, mat):
+    """Evaluate ``op`` on the columns of ``mat`` and return the matrix."""
+    if mat.ndim == 1:
+        mat = mat[:, None]
+
+    if _is_batchable(op):
+        return _batched_call(op, mat)
+
+    # Column-wise evaluation, using Fortran ordering for contiguous columns
+    mat = np.asfortranarray(mat, dtype=op.domain.dtype)
+    result = np.empty((op.range.size, mat.shape[1]), dtype=op.range.dtype,
+                      order='F')
+    for j in range(mat.shape[1]):
+        _flat_call(op, mat[:, j], out=result[:, j])
+    return result
+
+
+def _is_batchable(op):
+    """Return ``True`` if ``op`` can be applied to several vectors at once.
+
+    This is a structural check that does not evaluate ``op``, such that
+    `_batched_call` is only used if it succeeds for the whole operator.
+    """
+    if isinstance(op, MatrixOperator):
+        return op.domain.ndim == 1
+    elif isinstance(op, (ScalingOperator, ZeroOperator)):
+        return True
+    elif isinstance(op, (OperatorLeftScalarMult, OperatorRightScalarMult)):
+        return _is_batchable(op.operator)
+    elif isinstance(op, (OperatorComp, OperatorSum)):
+        return _is_batchable(op.left) and _is_batchable(op.right)
+    elif isinstance(op, OperatorLinComb):
+        return all(_is_batchable(summand) for summand in op.operators)
+    else:
+        return False
 
-    return scipy.sparse.linalg.LinearOperator(shape=shape,
-                                              matvec=matvec,
-                                              rmatvec=rmatvec,
-                                              dtype=dtype)
+
+def _batched_call(op, mat):
+    """Apply ``op`` to all columns of ``mat`` at once.
+
+    ``op`` must satisfy `_is_batchable`.
+
+    Returns
+    -------
+    result : `numpy.ndarray`
+        Array of shape ``(op.range.size, mat.shape[1])``.
+    """
+    if isinstance(op, MatrixOperator):
+        return np.asarray(op.matrix.dot(mat))
+    elif isinstance(op, ScalingOperator):
+        return op.scalar * mat
+    elif isinstance(op, ZeroOperator):
+        return np.zeros((op.range.size, mat.shape[1]), dtype=op.range.dtype)
+    elif isinstance(op, (OperatorLeftScalarMult, OperatorRightScalarMult)):
+        return op.scalar * _batched_call(op.operator, mat)
+    elif isinstance(op, OperatorComp):
+        return _batched_call(op.left, _batched_call(op.right, mat))
+    elif isinstance(op, OperatorSum):
+        return _batched_call(op.left, mat) + _batched_call(op.right, mat)
+    elif isinstance(op, OperatorLinComb):
+        result = 0
+        for scalar, summand in zip(op.scalars, op.operators):
+            result = result + scalar * _batched_call(summand, mat)
+        return result
+    else:
+        raise TypeError('{!r} cannot be applied to several vectors at once'
+                        ''.format(op))
 
 
 def as_scipy_functional(func, return_gradient=False):
@@ -430,6 +1005,502 @@ def as_proximal_lang_operator(op, norm_bound=None):
                                  norm_bound=norm_bound)
 
 
+def simplify(op):
+    """Return an equivalent operator with a simplified expression tree.
+
+    Operator arithmetic like ``a * (b * (A.adjoint * A)) + 0 * B`` creates
+    deeply nested expression types, where each node is evaluated separately
+    and uses its own temporaries. This function rewrites such expressions
+    by applying algebraic identities, resulting in an operator that is
+    evaluated in fewer passes.
+
+    Parameters
+    ----------
+    op : `Operator`
+        The operator to simplify.
+
+    Returns
+    -------
+    simplified : `Operator`
+        An operator equivalent to ``op``. If no simplification applies,
+        ``op`` itself is returned.
+
+    Examples
+    --------
+    Scalars are folded and zero terms are removed:
+
+    >>> space = odl.rn(3)
+    >>> A = odl.MatrixOperator(np.eye(3))
+    >>> B = odl.ScalingOperator(space, 2.0)
+    >>> op = 2 * (3 * (A.adjoint * A)) + 0 * B
+    >>> simplified = simplify(op)
+    >>> isinstance(simplified, odl.OperatorLeftScalarMult)
+    True
+    >>> simplified.scalar
+    6
+    >>> simplified([1, 2, 3])
+    rn(3).element([  6.,  12.,  18.])
+
+    Chains of scaling operators are merged:
+
+    >>> op = odl.ScalingOperator(space, 2) * odl.ScalingOperator(space, 3)
+    >>> simplify(op)
+    ScalingOperator(rn(3), 6.0)
+
+    Sums with more than two terms are turned into a single
+    `OperatorLinComb`:
+
+    >>> op = A + 2 * A.adjoint + B - odl.IdentityOperator(space)
+    >>> simplified = simplify(op)
+    >>> isinstance(simplified, odl.OperatorLinComb)
+    True
+    >>> simplified([1, 2, 3])
+    rn(3).element([ 4.,  8.,  12.])
+
+    Notes
+    -----
+    The following rules are applied recursively:
+
+    - Scalar multiplications are folded into a single scalar, and linear
+      operators commute with scalars, i.e.,
+      ``A * (a * B) == a * (A * B)``.
+      Hence, the nested sign flips created by ``op.adjoint.adjoint``
+      cancel out.
+    - `ScalingOperator` and `IdentityOperator` factors in compositions
+      are merged into the scalar of the composition.
+    - Multiplication with ``0`` and compositions with a `ZeroOperator`
+      (with only linear operators to its left) become a `ZeroOperator`.
+    - Nested sums and linear combinations are flattened into a single
+      `OperatorLinComb`, where terms with the same operator object
+      are merged and zero terms are dropped.
+    - Compositions are rebuilt as a balanced tree.
+
+    Only the exact expression types from `odl.operator.operator` are
+    rewritten. Subclasses, e.g., those representing arithmetic of
+    `Functional`'s, are left untouched since they carry additional
+    structure.
+    """
+    op_type = type(op)
+
+    if op_type in (ScalingOperator, IdentityOperator):
+        scalar, core = _split_scalar(op)
+        simplified = _assemble_scaled(scalar, core, op.domain, op.range)
+        return op if type(simplified) is op_type else simplified
+
+    elif op_type is OperatorLeftScalarMult:
+        scalar, core = _split_scalar(simplify(op.operator))
+        return _assemble_scaled(op.scalar * scalar, core,
+                                op.domain, op.range)
+
+    elif op_type is OperatorRightScalarMult:
+        inner = simplify(op.operator)
+        if inner.is_linear:
+            scalar, core = _split_scalar(inner)
+            return _assemble_scaled(op.scalar * scalar, core,
+                                    op.domain, op.range)
+        elif op.scalar == 1:
+            return inner
+        else:
+            return OperatorRightScalarMult(inner, op.scalar)
+
+    elif op_type is OperatorComp:
+        return _simplify_comp(op)
+
+    elif op_type in (OperatorSum, OperatorLinComb):
+        return _simplify_sum(op)
+
+    elif op_type is OperatorVectorSum:
+        return OperatorVectorSum(simplify(op.operator), op.vector)
+
+    else:
+        return op
+
+
+def _split_scalar(op):
+    """Return ``(scalar, core)`` such that ``op == scalar * core``.
+
+    For scaling operators, ``core`` is ``None``, representing the identity.
+    """
+    op_type = type(op)
+    if op_type in (ScalingOperator, IdentityOperator):
+        return op.scalar, None
+    elif op_type is OperatorLeftScalarMult:
+        return op.scalar, op.operator
+    elif op_type is OperatorRightScalarMult and op.operator.is_linear:
+        return op.scalar, op.operator
+    else:
+        return 1, op
+
+
+def _assemble_scaled(scalar, core, domain, range):
+    """Return the simplest operator equivalent to ``scalar * core``."""
+    if scalar == 0 and isinstance(range, LinearSpace):
+        return ZeroOperator(domain, range)
+    elif core is None:
+        if scalar == 1:
+            return IdentityOperator(domain)
+        else:
+            return ScalingOperator(domain, scalar)
+    elif scalar == 1:
+        return core
+    else:
+        return OperatorLeftScalarMult(core, scalar)
+
+
+def _comp_factors(op, factors):
+    """Append the simplified factors of a composition to ``factors``."""
+    if type(op) is OperatorComp:
+        _comp_factors(op.left, factors)
+        _comp_factors(op.right, factors)
+    else:
+        scalar, core = _split_scalar(simplify(op))
+        if type(core) is OperatorComp:
+            # Already simplified, only need to collect the factors
+            if scalar != 1:
+                factors.append(ScalingOperator(core.range, scalar))
+            _comp_factors(core, factors)
+        else:
+            factors.append(_assemble_scaled(scalar, core,
+                                            op.domain, op.range))
+    return factors
+
+
+def _balanced_comp(factors):
+    """Return the composition of ``factors`` as a balanced tree."""
+    if len(factors) == 1:
+        return factors[0]
+    mid = len(factors) // 2
+    return OperatorComp(_balanced_comp(factors[:mid]),
+                        _balanced_comp(factors[mid:]))
+
+
+def _simplify_comp(op):
+    """Simplify an `OperatorComp` expression."""
+    factors = _comp_factors(op, [])
+
+    # Traverse from right to left, pushing scalars to the left through
+    # linear operators. `chain` contains the factors in reverse order.
+    scalar = 1
+    chain = []
+    for factor in reversed(factors):
+        fac_scalar, core = _split_scalar(factor)
+        is_zero = (type(core) is ZeroOperator or
+                   (fac_scalar == 0 and isinstance(factor.range, LinearSpace)))
+        if is_zero or (chain and type(chain[-1]) is ZeroOperator and
+                       factor.is_linear):
+            chain = [ZeroOperator(op.domain, factor.range)]
+            scalar = 1
+        elif core is None:
+            scalar *= fac_scalar
+        elif core.is_linear:
+            scalar *= fac_scalar
+            chain.append(core)
+        else:
+            if scalar != 1:
+                core = OperatorRightScalarMult(core, scalar)
+            scalar = fac_scalar
+            chain.append(core)
+
+    if not chain:
+        return _assemble_scaled(scalar, None, op.domain, op.range)
+    elif len(chain) == 1 and type(chain[0]) is ZeroOperator:
+        return chain[0]
+    else:
+        comp = _balanced_comp(chain[::-1])
+        return _assemble_scaled(scalar, comp, op.domain, op.range)
+
+
+def _sum_terms(op, scalar, terms):
+    """Append the simplified ``(scalar, operator)`` terms of a sum."""
+    op_type = type(op)
+    if op_type is OperatorSum:
+        _sum_terms(op.left, scalar, terms)
+        _sum_terms(op.right, scalar, terms)
+    elif op_type is OperatorLinComb:
+        for sub_scalar, sub_op in zip(op.scalars, op.operators):
+            _sum_terms(sub_op, scalar * sub_scalar, terms)
+    else:
+        sub_scalar, core = _split_scalar(simplify(op))
+        if type(core) in (OperatorSum, OperatorLinComb):
+            _sum_terms(core, scalar * sub_scalar, terms)
+        else:
+            terms.append((scalar * sub_scalar, core))
+    return terms
+
+
+def _simplify_sum(op):
+    """Simplify an `OperatorSum` or `OperatorLinComb` expression."""
+    # Merge terms with identical operators, keeping the original order
+    scalars, cores = [], []
+    ident_scalar = 0
+    for scalar, core in _sum_terms(op, 1, []):
+        if core is None:
+            ident_scalar += scalar
+        elif type(core) is ZeroOperator:
+            continue
+        else:
+            for i, other in enumerate(cores):
+                if other is core:
+                    scalars[i] += scalar
+                    break
+            else:
+                scalars.append(scalar)
+                cores.append(core)
+
+    if ident_scalar != 0:
+        scalars.append(ident_scalar)
+        cores.append(IdentityOperator(op.domain))
+
+    terms = [(s, c) for s, c in zip(scalars, cores) if s != 0]
+    if not terms:
+        if isinstance(op.range, LinearSpace):
+            return ZeroOperator(op.domain, op.range)
+        else:
+            return op
+    elif len(terms) == 1:
+        return _assemble_scaled(terms[0][0], terms[0][1],
+                                op.domain, op.range)
+    elif len(terms) == 2 and all(s == 1 for s, _ in terms):
+        return OperatorSum(terms[0][1], terms[1][1])
+    else:
+        return OperatorLinComb([c for _, c in terms], [s for s, _ in terms])
+
+
+class CachedOperator(Operator):
+
+    """Operator wrapper that memoizes its evaluation results.
+
+    The wrapper keeps the results of the last ``maxsize`` evaluations
+    in a least-recently-used cache. When the operator is evaluated
+    again in a point with the same content, the stored result is
+    returned instead of evaluating the wrapped operator.
+
+    Derivatives are memoized in the same way, such that repeated calls
+    to ``derivative`` in the same point return the same operator.
+
+    See Also
+    --------
+    cached : Convenience function that also handles `Functional`'s
+    """
+
+    def __init__(self, operator, maxsize=4):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        operator : `Operator`
+            The operator whose results should be cached.
+        maxsize : positive int, optional
+            Maximum number of stored results. Each stored result
+            requires a copy of the evaluation point and the result.
+
+        Examples
+        --------
+        >>> space = odl.rn(3)
+        >>> op = CachedOperator(odl.MatrixOperator(np.eye(3)))
+        >>> op([1, 2, 3])  # evaluated
+        rn(3).element([ 1.,  2.,  3.])
+        >>> op([1, 2, 3])  # from cache
+        rn(3).element([ 1.,  2.,  3.])
+        """
+        if not isinstance(operator, Operator):
+            raise TypeError('`operator` {!r} is not an `Operator` instance'
+                            ''.format(operator))
+        maxsize, maxsize_in = int(maxsize), maxsize
+        if maxsize <= 0:
+            raise ValueError('`maxsize` must be positive, got {}'
+                             ''.format(maxsize_in))
+
+        super(CachedOperator, self).__init__(
+            operator.domain, operator.range, linear=operator.is_linear)
+        self.__operator = operator
+        self.__maxsize = maxsize
+        self.__results = OrderedDict()
+        self.__derivatives = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @property
+    def operator(self):
+        """The wrapped operator."""
+        return self.__operator
+
+    @property
+    def maxsize(self):
+        """Maximum number of stored results."""
+        return self.__maxsize
+
+    def clear_cache(self):
+        """Remove all stored results and derivatives."""
+        with self.__lock:
+            self.__results.clear()
+            self.__derivatives.clear()
+
+    def _lookup(self, cache, x):
+        """Return ``(key, value)`` of ``x`` in ``cache``, or ``(key, None)``.
+        """
+        key = _fingerprint(x)
+        with self.__lock:
+            entry = cache.get(key, None)
+            if entry is None or not _equal_contents(entry[0], x):
+                return key, None
+            # Mark as most recently used
+            del cache[key]
+            cache[key] = entry
+            return key, entry[1]
+
+    def _store(self, cache, key, x, value):
+        """Store ``value`` for ``x`` in ``cache`` and evict old entries."""
+        with self.__lock:
+            cache.pop(key, None)
+            cache[key] = (x.copy(), value)
+            while len(cache) > self.maxsize:
+                cache.popitem(last=False)
+
+    def _call(self, x, out=None):
+        """Return the (cached) result of ``self.operator(x)``."""
+        key, result = self._lookup(self.__results, x)
+        if result is not None:
+            if out is None:
+                return result.copy() if hasattr(result, 'copy') else result
+            else:
+                out.assign(result)
+                return out
+
+        if out is None:
+            out = self.operator(x)
+        else:
+            self.operator(x, out=out)
+
+        self._store(self.__results, key, x,
+                    out.copy() if hasattr(out, 'copy') else out)
+        return out
+
+    def derivative(self, point):
+        """Return the (cached) derivative of the wrapped operator.
+
+        Parameters
+        ----------
+        point : `domain` `element-like`
+            Point in which to take the derivative.
+
+        Returns
+        -------
+        derivative : `Operator`
+            If this operator is linear, it is returned itself. Otherwise,
+            the derivative of the wrapped operator is returned, the same
+            object for repeated calls in the same point.
+        """
+        if self.is_linear:
+            return self
+
+        point = self.domain.element(point)
+        key, deriv = self._lookup(self.__derivatives, point)
+        if deriv is None:
+            deriv = self.operator.derivative(point)
+            self._store(self.__derivatives, key, point, deriv)
+        return deriv
+
+    @property
+    def adjoint(self):
+        """Adjoint of the wrapped operator, with its own cache."""
+        return CachedOperator(self.operator.adjoint, self.maxsize)
+
+    @property
+    def inverse(self):
+        """Inverse of the wrapped operator, with its own cache."""
+        return CachedOperator(self.operator.inverse, self.maxsize)
+
+    def norm(self, estimate=False, **kwargs):
+        """Return the operator norm of the wrapped operator."""
+        return self.operator.norm(estimate=estimate, **kwargs)
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return '{}({!r}, maxsize={})'.format(self.__class__.__name__,
+                                             self.operator, self.maxsize)
+
+    def __str__(self):
+        """Return ``str(self)``."""
+        return 'cached({})'.format(self.operator)
+
+
+def cached(op, maxsize=4):
+    """Return a wrapper of ``op`` that memoizes its results.
+
+    This is intended for situations where an expensive operator or
+    functional is repeatedly evaluated in the same point, e.g., in line
+    searches or quasi-Newton methods.
+
+    Parameters
+    ----------
+    op : `Operator`
+        The operator to wrap. If it is a `Functional`, the returned
+        wrapper is again a `Functional`, whose `Functional.gradient` is
+        memoized as well.
+    maxsize : positive int, optional
+        Maximum number of stored results. Each stored result requires
+        a copy of the evaluation point and the result.
+
+    Returns
+    -------
+    cached_op : `CachedOperator`
+        The wrapped operator. For functionals, a `CachedFunctional`.
+
+    Examples
+    --------
+    >>> space = odl.rn(3)
+    >>> func = cached(odl.solvers.L2NormSquared(space))
+    >>> func([1, 2, 3])
+    14.0
+    >>> func.gradient([1, 2, 3])
+    rn(3).element([ 2.,  4.,  6.])
+
+    Notes
+    -----
+    Points are identified by a fingerprint computed from a few sampled
+    values. On a match, the content of the point is compared with a copy
+    stored along with the result, such that elements that have been
+    modified in-place are recognized as new points.
+
+    Results are copied on return, hence they can be modified freely
+    by the caller.
+    """
+    # Lazy import to avoid circular dependency
+    from odl.solvers.functional.functional import (
+        CachedFunctional, Functional)
+
+    if isinstance(op, Functional):
+        return CachedFunctional(op, maxsize)
+    else:
+        return CachedOperator(op, maxsize)
+
+
+def _fingerprint(x, nsamples=64):
+    """Return a cheap, hashable fingerprint of the contents of ``x``."""
+    if isinstance(x, ProductSpaceElement):
+        return tuple(_fingerprint(xi, nsamples) for xi in x)
+
+    try:
+        arr = x.asarray()
+    except AttributeError:
+        return x
+
+    flat = arr.reshape(-1)
+    stride = max(flat.size // nsamples, 1)
+    return (arr.shape, flat[::stride].tobytes())
+
+
+def _equal_contents(x, y):
+    """Return ``True`` if ``x`` and ``y`` have exactly equal contents."""
+    if isinstance(x, ProductSpaceElement):
+        return all(_equal_contents(xi, yi) for xi, yi in zip(x, y))
+
+    try:
+        return np.array_equal(x.asarray(), y.asarray())
+    except AttributeError:
+        return x == y
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()
@@ -88,7 +88,7 @@ class ProductSpaceOperator(Operator):
     DiagonalOperator : Case where the 'matrix' is diagonal.
     """
 
-    def __init__(self, operators, domain=None, range=None):
+    def __init__(self, operators, domain=None, range=None, executor=None):
         """Initialize a new instance.
 
         Parameters
@@ -103,6 +103,29 @@ class ProductSpaceOperator(Operator):
             Range of the operator. If not provided, it is tried to be
             inferred from the operators. This requires each **row**
             to contain at least one operator.
+        executor : {None, 'threads', 'processes'} or executor, optional
+            Strategy for evaluating the component operators.
+
+            - ``None``: Evaluate the operators one after another.
+            - ``'threads'``: Evaluate the operators concurrently in a
+              `concurrent.futures.ThreadPoolExecutor` that is created
+              on first use. The component operators must be safe to
+              evaluate concurrently; most NumPy-based operators release
+              the GIL in their heavy parts.
+            - ``'processes'``: Evaluate the operators concurrently in a
+              `concurrent.futures.ProcessPoolExecutor` that is created
+              on first use. Operators and space elements must be
+              picklable, and results are evaluated out-of-place and
+              transferred back.
+            - `concurrent.futures.Executor` instance: Use this pool.
+              Note that nested operators submitting to the same pool can
+              dead-lock if all workers are busy.
+
+            Partial results in the same row are summed pairwise in a
+            tree-reduction pass. Operators derived from this one, e.g.,
+            `adjoint` or `derivative`, use the same pool. A pool created
+            by this operator is shut down by `close`, or by using the
+            operator as context manager.
 
         Examples
         --------
@@ -226,6 +249,19 @@ class ProductSpaceOperator(Operator):
         super(ProductSpaceOperator, self).__init__(
             domain=domain, range=range, linear=linear)
 
+        if isinstance(executor, str):
+            executor, executor_in = executor.lower(), executor
+            if executor not in ('threads', 'processes'):
+                raise ValueError('`executor` {!r} not understood'
+                                 ''.format(executor_in))
+        elif executor is not None and not hasattr(executor, 'submit'):
+            raise TypeError('`executor` must be None, a string or an '
+                            'executor with a `submit` method, got {!r}'
+                            ''.format(executor))
+        self.__executor = executor
+        self.__pool = None
+        self.__owns_pool = False
+
     @staticmethod
     def _convert_to_spmatrix(operators):
         """Convert an array-like object of operators to a sparse matrix."""
@@ -287,8 +323,82 @@ class ProductSpaceOperator(Operator):
         """The sparse operator matrix representing this operator."""
         return self.__ops
 
+    @property
+    def executor(self):
+        """Strategy for evaluating the component operators.
+
+        See Also
+        --------
+        __init__ : Description of the options
+        """
+        return self.__executor
+
+    def _pool(self):
+        """Return the executor, creating it if necessary."""
+        if self.__pool is None:
+            if self.executor == 'threads':
+                from concurrent.futures import ThreadPoolExecutor
+                try:
+                    from os import cpu_count
+                except ImportError:  # Python 2
+                    from multiprocessing import cpu_count
+                max_workers = max(min(self.ops.nnz, cpu_count() or 1), 1)
+                self.__pool = ThreadPoolExecutor(max_workers=max_workers)
+            elif self.executor == 'processes':
+                from concurrent.futures import ProcessPoolExecutor
+                self.__pool = ProcessPoolExecutor()
+            else:
+                self.__pool = self.executor
+            self.__owns_pool = self.__pool is not self.executor
+        return self.__pool
+
+    def _derived_executor(self):
+        """Return the executor for operators derived from this one.
+
+        Pools created by this operator are passed on as instance, such
+        that derived operators do not create pools of their own.
+        """
+        if self.executor in ('threads', 'processes'):
+            return self._pool()
+        else:
+            return self.executor
+
+    def close(self):
+        """Shut down the pool created by this operator, if any.
+
+        Only pools created for ``executor='threads'`` or
+        ``executor='processes'`` are shut down, user-provided executors
+        are left alone. Operators derived from this operator share its
+        pool and can not be evaluated concurrently afterwards.
+
+        Examples
+        --------
+        >>> I = odl.IdentityOperator(odl.rn(3))
+        >>> with odl.DiagonalOperator(I, 2 * I, executor='threads') as op:
+        ...     op([[1, 2, 3], [1, 1, 1]])
+        ProductSpace(rn(3), 2).element([
+            [ 1.,  2.,  3.],
+            [ 2.,  2.,  2.]
+        ])
+        """
+        if self.__owns_pool:
+            self.__pool.shutdown()
+            self.__pool = None
+            self.__owns_pool = False
+
+    def __enter__(self):
+        """Return ``self`` in a ``with`` statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Call `close` at the end of a ``with`` statement."""
+        self.close()
+
     def _call(self, x, out=None):
         """Call the operators on the parts of ``x``."""
+        if self.executor is not None:
+            return self._call_concurrent(x, out)
+
         # TODO: add optimization in case an operator appears repeatedly in a
         # row
         if out is None:
@@ -312,6 +422,55 @@ class ProductSpaceOperator(Operator):
 
         return out
 
+    def _call_concurrent(self, x, out=None):
+        """Call the operators on the parts of ``x`` using the executor."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = self._pool()
+        # With processes, results cannot be written to `out` directly
+        in_place = not isinstance(pool, ProcessPoolExecutor)
+
+        if out is None:
+            out = self.range.element()
+
+        # Submit all evaluations, the first one per row writes to `out`
+        futures = {}
+        for i, j, op in zip(self.ops.row, self.ops.col, self.ops.data):
+            row_futures = futures.setdefault(i, [])
+            if in_place and not row_futures:
+                row_futures.append(
+                    pool.submit(_evaluate_in_place, op, x[j], out[i]))
+            else:
+                row_futures.append(pool.submit(_evaluate, op, x[j]))
+
+        partial = {}
+        for i, row_futures in futures.items():
+            partial[i] = [fut.result() for fut in row_futures]
+            if not in_place:
+                out[i].assign(partial[i][0])
+                partial[i][0] = out[i]
+
+        # Sum up the partial results of each row pairwise, such that
+        # the summation can also be done concurrently in each pass
+        while any(len(parts) > 1 for parts in partial.values()):
+            sum_futures = []
+            for i, parts in partial.items():
+                for k in range(0, len(parts) - 1, 2):
+                    if in_place:
+                        sum_futures.append(
+                            pool.submit(_add_in_place, parts[k], parts[k + 1]))
+                    else:
+                        _add_in_place(parts[k], parts[k + 1])
+                partial[i] = parts[::2]
+            for fut in sum_futures:
+                fut.result()
+
+        for i in range(len(self.range)):
+            if i not in partial:
+                out[i].set_zero()
+
+        return out
+
     def derivative(self, x):
         """Derivative of the product space operator.
 
@@ -383,7 +542,8 @@ class ProductSpaceOperator(Operator):
         indices = [self.ops.row, self.ops.col]
         shape = self.ops.shape
         deriv_matrix = scipy.sparse.coo_matrix((data, indices), shape)
-        return ProductSpaceOperator(deriv_matrix, self.domain, self.range)
+        return ProductSpaceOperator(deriv_matrix, self.domain, self.range,
+                                    executor=self._derived_executor())
 
     @property
     def adjoint(self):
@@ -432,7 +592,8 @@ class ProductSpaceOperator(Operator):
         indices = [self.ops.col, self.ops.row]  # Swap col/row -> transpose
         shape = (self.ops.shape[1], self.ops.shape[0])
         adj_matrix = scipy.sparse.coo_matrix((data, indices), shape)
-        return ProductSpaceOperator(adj_matrix, self.range, self.domain)
+        return ProductSpaceOperator(adj_matrix, self.range, self.domain,
+                                    executor=self._derived_executor())
 
     def __getitem__(self, index):
         """Get sub-operator by index.
@@ -495,7 +656,7 @@ class ProductSpaceOperator(Operator):
                 if ops[i] is None:
                     ops[i] = ZeroOperator(self.domain[i])
 
-            return ReductionOperator(*ops)
+            return ReductionOperator(*ops, executor=self._derived_executor())
 
     @property
     def shape(self):
@@ -731,7 +892,7 @@ class BroadcastOperator(Operator):
     ReductionOperator : Calculates sum of operator results.
     DiagonalOperator : Case where each operator should have its own argument.
     """
-    def __init__(self, *operators):
+    def __init__(self, *operators, **kwargs):
         """Initialize a new instance
 
         Parameters
@@ -740,6 +901,9 @@ class BroadcastOperator(Operator):
             The individual operators that should be evaluated.
             Can also be given as ``operator, n`` with ``n`` integer,
             in which case ``operator`` is repeated ``n`` times.
+        executor : {None, 'threads', 'processes'} or executor, optional
+            Strategy for evaluating the operators, see
+            `ProductSpaceOperator` for details. Default: ``None``
 
         Examples
         --------
@@ -773,8 +937,14 @@ class BroadcastOperator(Operator):
                 isinstance(operators[1], Integral)):
             operators = (operators[0],) * operators[1]
 
+        executor = kwargs.pop('executor', None)
+        if kwargs:
+            raise TypeError('got unexpected keyword arguments {}'
+                            ''.format(kwargs))
+
         self.__operators = operators
-        self.__prod_op = ProductSpaceOperator([[op] for op in operators])
+        self.__prod_op = ProductSpaceOperator([[op] for op in operators],
+                                              executor=executor)
         super(BroadcastOperator, self).__init__(
             self.prod_op.domain[0], self.prod_op.range,
             linear=self.prod_op.is_linear)
@@ -784,6 +954,23 @@ class BroadcastOperator(Operator):
         """`ProductSpaceOperator` implementation."""
         return self.__prod_op
 
+    def close(self):
+        """Shut down the pool created for concurrent evaluation, if any.
+
+        See Also
+        --------
+        ProductSpaceOperator.close
+        """
+        self.prod_op.close()
+
+    def __enter__(self):
+        """Return ``self`` in a ``with`` statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Call `close` at the end of a ``with`` statement."""
+        self.close()
+
     @property
     def operators(self):
         """Tuple of sub-operators that comprise ``self``."""
@@ -846,7 +1033,8 @@ class BroadcastOperator(Operator):
         ])
         """
         return BroadcastOperator(*[op.derivative(x) for op in
-                                   self.operators])
+                                   self.operators],
+                                 executor=self.prod_op._derived_executor())
 
     @property
     def adjoint(self):
@@ -863,7 +1051,8 @@ class BroadcastOperator(Operator):
         >>> op.adjoint([[1, 2, 3], [2, 3, 4]])
         rn(3).element([  5.,   8.,  11.])
         """
-        return ReductionOperator(*[op.adjoint for op in self.operators])
+        return ReductionOperator(*[op.adjoint for op in self.operators],
+                                 executor=self.prod_op._derived_executor())
 
     def __repr__(self):
         """Return ``repr(self)``.
@@ -900,7 +1089,7 @@ class ReductionOperator(Operator):
     BroadcastOperator : Calls several operators with same argument.
     DiagonalOperator : Case where each operator should have its own argument.
     """
-    def __init__(self, *operators):
+    def __init__(self, *operators, **kwargs):
         """Initialize a new instance.
 
         Parameters
@@ -909,6 +1098,11 @@ class ReductionOperator(Operator):
             The individual operators that should be evaluated and summed.
             Can also be given as ``operator, n`` with ``n`` integer,
             in which case ``operator`` is repeated ``n`` times.
+        executor : {None, 'threads', 'processes'} or executor, optional
+            Strategy for evaluating the operators, see
+            `ProductSpaceOperator` for details. With an executor, the
+            results are summed up in a tree-reduction pass.
+            Default: ``None``
 
         Examples
         --------
@@ -948,8 +1142,13 @@ class ReductionOperator(Operator):
                 isinstance(operators[1], Integral)):
             operators = (operators[0],) * operators[1]
 
+        executor = kwargs.pop('executor', None)
+        if kwargs:
+            raise TypeError('got unexpected keyword arguments {}'
+                            ''.format(kwargs))
+
         self.__operators = operators
-        self.__prod_op = ProductSpaceOperator([operators])
+        self.__prod_op = ProductSpaceOperator([operators], executor=executor)
 
         super(ReductionOperator, self).__init__(
             self.prod_op.domain, self.prod_op.range[0],
@@ -960,6 +1159,23 @@ class ReductionOperator(Operator):
         """`ProductSpaceOperator` implementation."""
         return self.__prod_op
 
+    def close(self):
+        """Shut down the pool created for concurrent evaluation, if any.
+
+        See Also
+        --------
+        ProductSpaceOperator.close
+        """
+        self.prod_op.close()
+
+    def __enter__(self):
+        """Return ``self`` in a ``with`` statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Call `close` at the end of a ``with`` statement."""
+        self.close()
+
     @property
     def operators(self):
         """Tuple of sub-operators that comprise ``self``."""
@@ -1030,7 +1246,8 @@ class ReductionOperator(Operator):
         rn(3).element([  9.,  14.,  19.])
         """
         return ReductionOperator(*[op.derivative(xi)
-                                   for op, xi in zip(self.operators, x)])
+                                   for op, xi in zip(self.operators, x)],
+                                 executor=self.prod_op._derived_executor())
 
     @property
     def adjoint(self):
@@ -1050,7 +1267,8 @@ class ReductionOperator(Operator):
             [ 2.,  4.,  6.]
         ])
         """
-        return BroadcastOperator(*[op.adjoint for op in self.operators])
+        return BroadcastOperator(*[op.adjoint for op in self.operators],
+                                 executor=self.prod_op._derived_executor())
 
     def __repr__(self):
         """Return ``repr(self)``.
@@ -1104,7 +1322,8 @@ class DiagonalOperator(ProductSpaceOperator):
             in which case the diagonal operator with ``n`` multiples of
             ``operator`` is created.
         kwargs :
-            Keyword arguments passed to the `ProductSpaceOperator` backend.
+            Keyword arguments passed to the `ProductSpaceOperator` backend,
+            e.g., ``executor`` for concurrent evaluation of the operators.
 
         Examples
         --------
@@ -1200,7 +1419,8 @@ class DiagonalOperator(ProductSpaceOperator):
 
         derivs = [op.derivative(p) for op, p in zip(self.operators, point)]
         return DiagonalOperator(*derivs,
-                                domain=self.domain, range=self.range)
+                                domain=self.domain, range=self.range,
+                                executor=self._derived_executor())
 
     @property
     def adjoint(self):
@@ -1229,7 +1449,8 @@ class DiagonalOperator(ProductSpaceOperator):
         """
         adjoints = [op.adjoint for op in self.operators]
         return DiagonalOperator(*adjoints,
-                                domain=self.range, range=self.domain)
+                                domain=self.range, range=self.domain,
+                                executor=self._derived_executor())
 
     @property
     def inverse(self):
@@ -1258,7 +1479,8 @@ class DiagonalOperator(ProductSpaceOperator):
         """
         inverses = [op.inverse for op in self.operators]
         return DiagonalOperator(*inverses,
-                                domain=self.range, range=self.domain)
+                                domain=self.range, range=self.domain,
+                                executor=self._derived_executor())
 
     def __repr__(self):
         """Return ``repr(self)``.
@@ -1281,6 +1503,22 @@ class DiagonalOperator(ProductSpaceOperator):
             return '{}({})'.format(self.__class__.__name__, op_repr)
 
 
+def _evaluate(op, x):
+    """Return ``op(x)``, helper for executors."""
+    return op(x)
+
+
+def _evaluate_in_place(op, x, out):
+    """Evaluate ``op(x, out=out)``, helper for executors."""
+    return op(x, out=out)
+
+
+def _add_in_place(x, y):
+    """Evaluate ``x += y``, helper for executors."""
+    x += y
+    return x
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()
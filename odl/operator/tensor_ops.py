@@ -11,7 +11,6 @@
 from __future__ import print_function, division, absolute_import
 from numbers import Integral
 import numpy as np
-from packaging.version import parse as parse_version
 
 from odl.operator.operator import Operator
 from odl.set import RealNumbers, ComplexNumbers
@@ -19,7 +18,9 @@ from odl.space import ProductSpace, tensor_space
 from odl.space.base_tensors import TensorSpace
 from odl.space.weighting import ArrayWeighting
 from odl.util import (
-    signature_string, indent, dtype_repr, moveaxis, writable_array)
+    signature_string, indent, dtype_repr, writable_array)
+from odl.util.numerics import _apply_blockwise
+from odl.util.utility import _cpu_count, _thread_pool
 
 
 __all__ = ('PointwiseNorm', 'PointwiseInner', 'PointwiseSum', 'MatrixOperator',
@@ -234,70 +235,80 @@ class PointwiseNorm(PointwiseTensorFieldOperator):
 
     def _call_vecfield_1(self, vf, out):
         """Implement ``self(vf, out)`` for exponent 1."""
-        vf[0].ufuncs.absolute(out=out)
-        if self.is_weighted:
-            out *= self.weights[0]
+        weights = self.weights if self.is_weighted else None
 
-        if len(self.domain) == 1:
-            return
+        def kernel(vf_blocks, out_blocks, tmps):
+            out_block, tmp = out_blocks[0], tmps[0]
+            np.absolute(vf_blocks[0], out=out_block)
+            if weights is not None:
+                out_block *= weights[0]
+            for i in range(1, len(vf_blocks)):
+                np.absolute(vf_blocks[i], out=tmp)
+                if weights is not None:
+                    tmp *= weights[i]
+                out_block += tmp
 
-        tmp = self.range.element()
-        for fi, wi in zip(vf[1:], self.weights[1:]):
-            fi.ufuncs.absolute(out=tmp)
-            if self.is_weighted:
-                tmp *= wi
-            out += tmp
+        _apply_blockwise(kernel, vf, [out])
 
     def _call_vecfield_inf(self, vf, out):
         """Implement ``self(vf, out)`` for exponent ``inf``."""
-        vf[0].ufuncs.absolute(out=out)
-        if self.is_weighted:
-            out *= self.weights[0]
+        weights = self.weights if self.is_weighted else None
 
-        if len(self.domain) == 1:
-            return
+        def kernel(vf_blocks, out_blocks, tmps):
+            out_block, tmp = out_blocks[0], tmps[0]
+            np.absolute(vf_blocks[0], out=out_block)
+            if weights is not None:
+                out_block *= weights[0]
+            for i in range(1, len(vf_blocks)):
+                np.absolute(vf_blocks[i], out=tmp)
+                if weights is not None:
+                    tmp *= weights[i]
+                np.maximum(out_block, tmp, out=out_block)
 
-        tmp = self.range.element()
-        for vfi, wi in zip(vf[1:], self.weights[1:]):
-            vfi.ufuncs.absolute(out=tmp)
-            if self.is_weighted:
-                tmp *= wi
-            out.ufuncs.maximum(tmp, out=out)
+        _apply_blockwise(kernel, vf, [out])
 
     def _call_vecfield_p(self, vf, out):
         """Implement ``self(vf, out)`` for exponent 1 < p < ``inf``."""
+        p = self.exponent
+        weights = self.weights if self.is_weighted else None
+
         # Optimization for 1 component - just absolute value (maybe weighted)
         if len(self.domain) == 1:
             vf[0].ufuncs.absolute(out=out)
-            if self.is_weighted:
-                out *= self.weights[0] ** (1 / self.exponent)
+            if weights is not None:
+                out *= weights[0] ** (1 / p)
             return
 
-        # Initialize out, avoiding one copy
-        self._abs_pow_ufunc(vf[0], out=out, p=self.exponent)
-        if self.is_weighted:
-            out *= self.weights[0]
+        abs_pow = self._abs_pow_ufunc
 
-        tmp = self.range.element()
-        for fi, wi in zip(vf[1:], self.weights[1:]):
-            self._abs_pow_ufunc(fi, out=tmp, p=self.exponent)
-            if self.is_weighted:
-                tmp *= wi
-            out += tmp
+        def kernel(vf_blocks, out_blocks, tmps):
+            out_block, tmp = out_blocks[0], tmps[0]
+            abs_pow(vf_blocks[0], out=out_block, p=p)
+            if weights is not None:
+                out_block *= weights[0]
+            for i in range(1, len(vf_blocks)):
+                abs_pow(vf_blocks[i], out=tmp, p=p)
+                if weights is not None:
+                    tmp *= weights[i]
+                out_block += tmp
+            abs_pow(out_block, out=out_block, p=1 / p)
 
-        self._abs_pow_ufunc(out, out=out, p=(1 / self.exponent))
+        _apply_blockwise(kernel, vf, [out])
 
     def _abs_pow_ufunc(self, fi, out, p):
-        """Compute |F_i(x)|^p point-wise and write to ``out``."""
+        """Compute |F_i(x)|^p point-wise and write to ``out``.
+
+        ``fi`` and ``out`` are Numpy arrays.
+        """
         # Optimization for very common cases
         if p == 0.5:
-            fi.ufuncs.absolute(out=out)
-            out.ufuncs.sqrt(out=out)
+            np.absolute(fi, out=out)
+            np.sqrt(out, out=out)
         elif p == 2.0 and self.base_space.field == RealNumbers():
-            fi.multiply(fi, out=out)
+            np.multiply(fi, fi, out=out)
         else:
-            fi.ufuncs.absolute(out=out)
-            out.ufuncs.power(p, out=out)
+            np.absolute(fi, out=out)
+            np.power(out, p, out=out)
 
     def derivative(self, vf):
         """Derivative of the point-wise norm operator at ``vf``.
@@ -520,29 +531,27 @@ class PointwiseInner(PointwiseInnerBase):
 
     def _call(self, vf, out):
         """Implement ``self(vf, out)``."""
-        if self.domain.field == ComplexNumbers():
-            vf[0].multiply(self._vecfield[0].conj(), out=out)
-        else:
-            vf[0].multiply(self._vecfield[0], out=out)
-
-        if self.is_weighted:
-            out *= self.weights[0]
-
-        if len(self.domain) == 1:
-            return
-
-        tmp = self.range.element()
-        for vfi, gi, wi in zip(vf[1:], self.vecfield[1:],
-                               self.weights[1:]):
-
-            if self.domain.field == ComplexNumbers():
-                vfi.multiply(gi.conj(), out=tmp)
-            else:
-                vfi.multiply(gi, out=tmp)
-
-            if self.is_weighted:
-                tmp *= wi
-            out += tmp
+        ncomp = len(self.domain)
+        weights = self.weights if self.is_weighted else None
+        is_complex = self.domain.field == ComplexNumbers()
+
+        def kernel(blocks, out_blocks, tmps):
+            out_block, tmp = out_blocks[0], tmps[0]
+            # `blocks` contains the blocks of `vf`, followed by those of
+            # `self.vecfield`
+            for i in range(ncomp):
+                res = out_block if i == 0 else tmp
+                if is_complex:
+                    np.conj(blocks[ncomp + i], out=res)
+                    res *= blocks[i]
+                else:
+                    np.multiply(blocks[i], blocks[ncomp + i], out=res)
+                if weights is not None:
+                    res *= weights[i]
+                if i > 0:
+                    out_block += tmp
+
+        _apply_blockwise(kernel, list(vf) + list(self.vecfield), [out])
 
     @property
     def adjoint(self):
@@ -715,7 +724,8 @@ class MatrixOperator(Operator):
     recommended to use other alternatives if possible.
     """
 
-    def __init__(self, matrix, domain=None, range=None, axis=0):
+    def __init__(self, matrix, domain=None, range=None, axis=0,
+                 num_threads=None):
         """Initialize a new instance.
 
         Parameters
@@ -739,6 +749,12 @@ class MatrixOperator(Operator):
         axis : int, optional
             Sum over this axis of an input tensor in the
             multiplication.
+        num_threads : positive int, optional
+            Number of threads used for the multiplication with a sparse
+            matrix. For the default ``None``, all CPUs are used for
+            matrices with at least 50000 nonzero entries, and a single
+            thread otherwise. Dense matrices rely on the threading of
+            the BLAS library used by Numpy.
 
         Examples
         --------
@@ -790,6 +806,10 @@ class MatrixOperator(Operator):
 
         It produces a new tensor :math:`A \cdot T \in \mathbb{F}^{
         n_1 \\times \dots \\times n \\times \dots \\times n_d}`.
+
+        Sparse matrices are converted to CSR format (once) for the
+        evaluation, which is done in-place and split into blocks of rows
+        that are processed in parallel.
         """
         # Lazy import to improve `import odl` time
         import scipy.sparse
@@ -803,6 +823,13 @@ class MatrixOperator(Operator):
         if self.axis != axis_in:
             raise ValueError('`axis` must be integer, got {}'.format(axis_in))
 
+        if num_threads is not None:
+            num_threads, num_threads_in = int(num_threads), num_threads
+            if num_threads <= 0:
+                raise ValueError('`num_threads` must be positive, got {}'
+                                 ''.format(num_threads_in))
+        self.__num_threads = num_threads
+
         if self.matrix.ndim != 2:
             raise ValueError('`matrix` has {} axes instead of 2'
                              ''.format(self.matrix.ndim))
@@ -861,6 +888,10 @@ class MatrixOperator(Operator):
 
         super(MatrixOperator, self).__init__(domain, range, linear=True)
 
+        # Lazily created CSR matrix and adjoint
+        self.__csr_matrix = None
+        self.__adjoint = None
+
     @property
     def matrix(self):
         """Matrix representing this operator."""
@@ -871,17 +902,30 @@ class MatrixOperator(Operator):
         """Axis of domain elements over which is summed."""
         return self.__axis
 
+    @property
+    def num_threads(self):
+        """Number of threads used for sparse matrices, or ``None``."""
+        return self.__num_threads
+
     @property
     def adjoint(self):
         """Adjoint operator represented by the adjoint matrix.
 
+        The adjoint is created only once, hence its (transposed) matrix
+        is computed only once as well.
+
         Returns
         -------
         adjoint : `MatrixOperator`
         """
-        return MatrixOperator(self.matrix.conj().T,
-                              domain=self.range, range=self.domain,
-                              axis=self.axis)
+        if self.__adjoint is None:
+            adjoint = MatrixOperator(self.matrix.conj().T,
+                                     domain=self.range, range=self.domain,
+                                     axis=self.axis,
+                                     num_threads=self.num_threads)
+            adjoint.__adjoint = self
+            self.__adjoint = adjoint
+        return self.__adjoint
 
     @property
     def inverse(self):
@@ -914,34 +958,41 @@ class MatrixOperator(Operator):
         import scipy.sparse
 
         if out is None:
+            out_arr = np.empty(self.range.shape, dtype=self.range.dtype)
             if scipy.sparse.isspmatrix(self.matrix):
-                out = self.matrix.dot(x)
+                self._sparse_dot(x.asarray(), out_arr)
             else:
-                dot = np.tensordot(self.matrix, x, axes=(1, self.axis))
-                # New axis ends up as first, need to swap it to its place
-                out = moveaxis(dot, 0, self.axis)
+                _dense_dot_axis(self.matrix, x.asarray(), self.axis, out_arr)
+            return out_arr
         else:
-            if scipy.sparse.isspmatrix(self.matrix):
-                # Unfortunately, there is no native in-place dot product for
-                # sparse matrices
-                out[:] = self.matrix.dot(x)
-            elif (parse_version(np.__version__) < parse_version('1.13.0') and
-                  x is out and
-                  self.range.ndim == 1):
-                # Workaround for bug in Numpy < 1.13 with aliased in and
-                # out in np.dot
-                out[:] = self.matrix.dot(x)
-            elif self.range.ndim == 1:
-                with writable_array(out) as out_arr:
-                    self.matrix.dot(x, out=out_arr)
-            else:
-                # Could use einsum to have out, but it's damn slow
-                # TODO: investigate speed issue
-                dot = np.tensordot(self.matrix, x, axes=(1, self.axis))
-                # New axis ends up as first, need to move it to its place
-                out[:] = moveaxis(dot, 0, self.axis)
-
-        return out
+            with writable_array(out) as out_arr:
+                if scipy.sparse.isspmatrix(self.matrix):
+                    self._sparse_dot(x.asarray(), out_arr)
+                else:
+                    _dense_dot_axis(self.matrix, x.asarray(), self.axis,
+                                    out_arr)
+            return out
+
+    def _sparse_dot(self, x_arr, out_arr):
+        """Compute ``out_arr[:] = self.matrix.dot(x_arr)``."""
+        dtype = np.promote_types(self.matrix.dtype, self.domain.dtype)
+        if self.__csr_matrix is None:
+            self.__csr_matrix = self.matrix.tocsr().astype(dtype, copy=False)
+        matrix = self.__csr_matrix
+
+        num_threads = self.num_threads
+        if num_threads is None:
+            num_threads = _cpu_count() if matrix.nnz >= 50000 else 1
+
+        # The input may not be overwritten during the computation
+        x_arr = np.array(x_arr, dtype=dtype, order='C',
+                         copy=np.may_share_memory(x_arr, out_arr))
+        if out_arr.dtype == dtype and out_arr.flags.c_contiguous:
+            _csr_matvec(matrix, x_arr, out_arr, num_threads)
+        else:
+            tmp = np.empty(out_arr.shape, dtype=dtype)
+            _csr_matvec(matrix, x_arr, tmp, num_threads)
+            out_arr[:] = tmp
 
     def __repr__(self):
         """Return ``repr(self)``."""
@@ -964,11 +1015,12 @@ class MatrixOperator(Operator):
                                                  self.matrix.dtype)),
             ('range', self.range, tensor_space(range_shape,
                                                self.matrix.dtype)),
-            ('axis', self.axis, 0)
+            ('axis', self.axis, 0),
+            ('num_threads', self.num_threads, None)
         ]
 
         inner_str = signature_string(posargs, optargs, sep=[', ', ', ', ',\n'],
-                                     mod=[['!s'], ['!r', '!r', '']])
+                                     mod=[['!s'], ['!r', '!r', '', '']])
         return '{}(\n{}\n)'.format(self.__class__.__name__, indent(inner_str))
 
     def __str__(self):
@@ -976,6 +1028,90 @@ class MatrixOperator(Operator):
         return repr(self)
 
 
+def _dense_dot_axis(matrix, x_arr, axis, out_arr):
+    """Compute the product of ``matrix`` with ``x_arr`` along ``axis``.
+
+    The result is written to ``out_arr``. Instead of moving ``axis`` to
+    the front, the arrays are viewed as stacks of matrices, such that
+    the product can be computed without copying the data.
+    """
+    m, n = matrix.shape[1], matrix.shape[0]
+    pre = int(np.prod(x_arr.shape[:axis]))
+    post = int(np.prod(x_arr.shape[axis + 1:]))
+    dtype = np.result_type(matrix, x_arr)
+
+    # The input may not be overwritten during the computation
+    x_arr = np.array(x_arr, order='C',
+                     copy=np.may_share_memory(x_arr, out_arr))
+    if out_arr.dtype == dtype and out_arr.flags.c_contiguous:
+        result = out_arr
+    else:
+        result = np.empty(out_arr.shape, dtype=dtype)
+
+    if x_arr.ndim == 1:
+        np.dot(matrix, x_arr, out=result)
+    elif pre == 1:
+        np.dot(matrix, x_arr.reshape(m, post), out=result.reshape(n, post))
+    elif post == 1:
+        np.dot(x_arr.reshape(pre, m), matrix.T, out=result.reshape(pre, n))
+    else:
+        np.matmul(matrix, x_arr.reshape(pre, m, post),
+                  out=result.reshape(pre, n, post))
+
+    if result is not out_arr:
+        out_arr[:] = result
+
+
+def _csr_matvec(matrix, x_arr, out_arr, num_threads=1):
+    """Compute ``out_arr[:] = matrix.dot(x_arr)`` for a CSR ``matrix``.
+
+    ``x_arr`` and ``out_arr`` must be C-contiguous arrays of the same
+    dtype as the matrix. The rows are split into ``num_threads`` blocks
+    with roughly equal numbers of nonzeros, which are processed in
+    parallel.
+    """
+    try:
+        from scipy.sparse import _sparsetools
+    except ImportError:
+        # No access to the in-place kernel
+        out_arr[:] = matrix.dot(x_arr.ravel()).reshape(out_arr.shape)
+        return
+
+    x_flat = x_arr.reshape(-1)
+    out_flat = out_arr.reshape(-1)
+    out_flat.fill(0)
+    nrows, ncols = matrix.shape
+    indptr, indices, data = matrix.indptr, matrix.indices, matrix.data
+
+    num_threads = min(num_threads, nrows)
+    if num_threads <= 1:
+        _sparsetools.csr_matvec(nrows, ncols, indptr, indices, data,
+                                x_flat, out_flat)
+        return
+
+    # Row blocks with equal numbers of nonzeros. The kernel releases the
+    # GIL and uses absolute offsets from `indptr` into `indices` and
+    # `data`, so no slicing of these arrays is required.
+    bounds = np.searchsorted(indptr,
+                             np.linspace(0, matrix.nnz, num_threads + 1))
+    bounds[0], bounds[-1] = 0, nrows
+    bounds = np.unique(bounds)
+
+    def matvec_block(i):
+        start, stop = bounds[i], bounds[i + 1]
+        _sparsetools.csr_matvec(stop - start, ncols,
+                                indptr[start:stop + 1], indices, data,
+                                x_flat, out_flat[start:stop])
+
+    # The first block is done in the calling thread, which leaves a
+    # worker free if this runs in a task of the shared pool
+    futures = [_thread_pool().submit(matvec_block, i)
+               for i in range(1, len(bounds) - 1)]
+    matvec_block(0)
+    for future in futures:
+        future.result()
+
+
 def _normalize_sampling_points(sampling_points, ndim):
     """Normalize points to an ndim-long list of linear index arrays.
 
@@ -23,7 +23,7 @@ from odl.solvers.nonsmooth.proximal_operators import (
     proximal_l1_l2, proximal_convex_conj_l1_l2,
     proximal_l2, proximal_convex_conj_l2, proximal_l2_squared,
     proximal_linfty,
-    proximal_huber,
+    proximal_huber, proximal_total_variation,
     proximal_const_func, proximal_box_constraint,
     proximal_convex_conj_kl, proximal_convex_conj_kl_cross_entropy,
     combine_proximals, proximal_convex_conj)
@@ -33,7 +33,7 @@ from odl.util import conj_exponent, moveaxis
 __all__ = ('ZeroFunctional', 'ConstantFunctional', 'ScalingFunctional',
            'IdentityFunctional',
            'LpNorm', 'L1Norm', 'GroupL1Norm', 'L2Norm', 'L2NormSquared',
-           'Huber', 'NuclearNorm',
+           'Huber', 'NuclearNorm', 'TotalVariation',
            'IndicatorZero', 'IndicatorBox', 'IndicatorNonnegativity',
            'IndicatorLpUnitBall', 'IndicatorGroupL1UnitBall',
            'IndicatorNuclearNormUnitBall',
@@ -2723,6 +2723,135 @@ class Huber(Functional):
                                        self.gamma)
 
 
+class TotalVariation(Functional):
+
+    """The total variation functional.
+
+    Notes
+    -----
+    The total variation of a function :math:`x` is given by
+
+    .. math::
+        TV(x) = \\int_\\Omega |\\nabla x(y)| dy,
+
+    where :math:`|\\cdot|` is the Euclidean norm for the isotropic variant
+    and the 1-norm for the anisotropic variant. It is computed as
+    `GroupL1Norm` of the gradient.
+
+    The proximal operator is evaluated iteratively by solving the dual
+    problem with the FGP method, see `proximal_total_variation`. Its
+    result is inexact, with an accuracy controlled by ``prox_niter`` and
+    ``prox_tol``.
+    Consecutive evaluations of the proximal are warm-started from the
+    dual variable of the previous one, which usually is a good starting
+    point inside iterative schemes like `forward_backward_pd` or `admm`.
+    """
+
+    def __init__(self, space, isotropic=True, grad=None, prox_niter=200,
+                 prox_tol=1e-6):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        space : `DiscreteLp`
+            Domain of the functional.
+        isotropic : bool, optional
+            If ``True``, use the pointwise Euclidean norm of the gradient,
+            otherwise the pointwise 1-norm.
+        grad : `Operator`, optional
+            Linear operator with adjoint mapping ``space`` to a power space,
+            used in place of the gradient.
+            Default: forward differences with symmetric padding.
+        prox_niter : positive int, optional
+            Maximum number of dual iterations per evaluation of the
+            proximal.
+        prox_tol : positive float, optional
+            Relative change of the dual variable at which the iteration
+            for the proximal is stopped. ``None`` means that always
+            ``prox_niter`` iterations are run.
+
+        Examples
+        --------
+        The total variation of a constant function is zero:
+
+        >>> space = odl.uniform_discr(0, 1, 5)
+        >>> tv = odl.solvers.TotalVariation(space)
+        >>> tv(space.one())
+        0.0
+
+        For a step function, the total variation is the jump size:
+
+        >>> tv([0, 0, 1, 1, 1])
+        1.0
+
+        The proximal reduces the total variation:
+
+        >>> x = space.element([0, 0, 1, 1, 1])
+        >>> tv(tv.proximal(0.1)(x)) < tv(x)
+        True
+        """
+        if grad is None:
+            from odl.discr.diff_ops import Gradient
+            grad = Gradient(space, method='forward', pad_mode='symmetric')
+            grad_is_default = True
+        else:
+            if grad.domain != space:
+                raise ValueError('`grad.domain` {!r} not equal to `space` '
+                                 '{!r}'.format(grad.domain, space))
+            grad_is_default = False
+
+        super(TotalVariation, self).__init__(
+            space=space, linear=False, grad_lipschitz=np.nan)
+        self.__isotropic = bool(isotropic)
+        self.__grad = grad
+        exponent = 2 if self.isotropic else 1
+        self.__group_norm = GroupL1Norm(grad.range, exponent=exponent)
+        self.__dual = grad.range.zero()
+        self.__proximal = proximal_total_variation(
+            space, isotropic=self.isotropic,
+            grad=None if grad_is_default else grad,
+            niter=prox_niter, tol=prox_tol, dual=self.__dual)
+
+    @property
+    def isotropic(self):
+        """``True`` if the isotropic variant is used."""
+        return self.__isotropic
+
+    @property
+    def grad(self):
+        """The gradient operator of the total variation."""
+        return self.__grad
+
+    @property
+    def dual(self):
+        """The dual variable used to warm-start the proximal.
+
+        It is updated by each evaluation of the proximal. Call
+        ``dual.set_zero()`` to start from scratch.
+        """
+        return self.__dual
+
+    def _call(self, x):
+        """Return ``self(x)``."""
+        return self.__group_norm(self.grad(x))
+
+    @property
+    def proximal(self):
+        """Return the ``proximal factory`` of the functional.
+
+        See Also
+        --------
+        odl.solvers.proximal_total_variation :
+            `proximal factory` for the total variation.
+        """
+        return self.__proximal
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        return '{}({!r}, isotropic={})'.format(self.__class__.__name__,
+                                               self.domain, self.isotropic)
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()
@@ -15,6 +15,7 @@ from odl.operator.operator import (
     Operator, OperatorComp, OperatorLeftScalarMult, OperatorRightScalarMult,
     OperatorRightVectorMult, OperatorSum, OperatorPointwiseProduct)
 from odl.operator.default_ops import (IdentityOperator, ConstantOperator)
+from odl.operator.oputils import CachedOperator
 from odl.solvers.nonsmooth import (proximal_arg_scaling, proximal_translation,
                                    proximal_quadratic_perturbation,
                                    proximal_const_func, proximal_convex_conj)
@@ -26,7 +27,8 @@ __all__ = ('Functional', 'FunctionalLeftScalarMult',
            'FunctionalRightVectorMult', 'FunctionalSum', 'FunctionalScalarSum',
            'FunctionalTranslation', 'InfimalConvolution',
            'FunctionalQuadraticPerturb', 'FunctionalProduct',
-           'FunctionalQuotient', 'BregmanDistance', 'simple_functional')
+           'FunctionalQuotient', 'BregmanDistance', 'CachedFunctional',
+           'simple_functional')
 
 
 class Functional(Operator):
@@ -1329,6 +1331,73 @@ class FunctionalDefaultConvexConjugate(Functional):
         return '{}.convex_conj'.format(self.convex_conj)
 
 
+class CachedFunctional(Functional, CachedOperator):
+
+    """Functional wrapper that memoizes values and gradients.
+
+    See Also
+    --------
+    odl.operator.oputils.cached : Create a cached operator or functional
+    """
+
+    def __init__(self, func, maxsize=4):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        func : `Functional`
+            The functional whose values should be cached.
+        maxsize : positive int, optional
+            Maximum number of stored values and gradients.
+
+        Examples
+        --------
+        >>> space = odl.rn(3)
+        >>> func = CachedFunctional(odl.solvers.L1Norm(space))
+        >>> func([1, -2, 3])
+        6.0
+        """
+        if not isinstance(func, Functional):
+            raise TypeError('`func` {!r} is not a `Functional` instance'
+                            ''.format(func))
+
+        CachedOperator.__init__(self, func, maxsize)
+        Functional.__init__(self, space=func.domain, linear=func.is_linear,
+                            grad_lipschitz=func.grad_lipschitz)
+        self.__gradient = None
+
+    @property
+    def functional(self):
+        """The wrapped functional."""
+        return self.operator
+
+    @property
+    def gradient(self):
+        """Gradient of the wrapped functional, with its own cache.
+
+        The same operator is returned on every access, such that the
+        cache persists between calls.
+        """
+        if self.__gradient is None:
+            self.__gradient = CachedOperator(self.functional.gradient,
+                                             self.maxsize)
+        return self.__gradient
+
+    @property
+    def proximal(self):
+        """Proximal factory of the wrapped functional."""
+        return self.functional.proximal
+
+    @property
+    def convex_conj(self):
+        """Convex conjugate of the wrapped functional."""
+        return self.functional.convex_conj
+
+    def derivative(self, point):
+        """Return the derivative of the wrapped functional in ``point``."""
+        return CachedOperator.derivative(self, point)
+
+
 class BregmanDistance(Functional):
     r"""The Bregman distance functional.
 
@@ -12,18 +12,24 @@ from __future__ import print_function, division, absolute_import
 from builtins import next
 import numpy as np
 
-from odl.operator import IdentityOperator, OperatorComp, OperatorSum
+from odl.operator import (Operator, IdentityOperator, OperatorComp,
+                          OperatorSum, DiagonalOperator)
+from odl.solvers.iterative.statistical import (
+    _SubsetBlocks, _ones_image, _subset_key)
+from odl.solvers.util.stopping import _normalized_stopping
 from odl.util import normalized_scalar_param_list
 
 
 __all__ = ('landweber', 'conjugate_gradient', 'conjugate_gradient_normal',
-           'gauss_newton', 'kaczmarz')
+           'conjugate_gradient_block', 'lsqr', 'lsmr', 'minres',
+           'gauss_newton', 'kaczmarz', 'sart', 'sirt')
 
 
 # TODO: update all docs
 
 
-def landweber(op, x, rhs, niter, omega=None, projection=None, callback=None):
+def landweber(op, x, rhs, niter, omega=None, projection=None, callback=None,
+              tol=None, stopping=None):
     """Optimized implementation of Landweber's method.
 
     Solves the inverse problem::
@@ -52,6 +58,12 @@ def landweber(op, x, rhs, niter, omega=None, projection=None, callback=None):
         argument and modify it in-place.
     callback : callable, optional
         Object executing code per iteration, e.g. plotting each iterate.
+    tol : positive float, optional
+        Stop the iteration as soon as the change of the iterate is
+        smaller than ``tol`` relative to its norm, see `RelativeChange`.
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping the iteration early, evaluated with the
+        change of the iterate. Cannot be combined with ``tol``.
 
     Notes
     -----
@@ -100,6 +112,8 @@ def landweber(op, x, rhs, niter, omega=None, projection=None, callback=None):
         raise TypeError('`x` {!r} is not in the domain of `op` {!r}'
                         ''.format(x, op.domain))
 
+    stopping = _normalized_stopping(tol, stopping)
+
     if omega is None:
         omega = 1 / op.norm(estimate=True) ** 2
 
@@ -107,7 +121,16 @@ def landweber(op, x, rhs, niter, omega=None, projection=None, callback=None):
     tmp_ran = op.range.element()
     tmp_dom = op.domain.element()
 
-    for _ in range(niter):
+    # Without projection, the change of x is the scaled gradient step.
+    # Otherwise the previous iterate is stored when the criterion is due.
+    if stopping is not None and projection is not None:
+        x_prev = op.domain.element()
+
+    for k in range(niter):
+        check_stopping = stopping is not None and stopping.is_due(k)
+        if check_stopping and projection is not None:
+            x_prev.assign(x)
+
         op(x, out=tmp_ran)
         tmp_ran -= rhs
         op.derivative(x).adjoint(tmp_ran, out=tmp_dom)
@@ -119,8 +142,18 @@ def landweber(op, x, rhs, niter, omega=None, projection=None, callback=None):
         if callback is not None:
             callback(x)
 
+        if check_stopping:
+            if projection is None:
+                change = abs(omega) * tmp_dom.norm()
+            else:
+                x_prev.lincomb(1, x, -1, x_prev)
+                change = x_prev.norm()
+            if stopping([change], [x.norm()]):
+                break
+
 
-def conjugate_gradient(op, x, rhs, niter, callback=None):
+def conjugate_gradient(op, x, rhs, niter, callback=None,
+                       preconditioner=None):
     """Optimized implementation of CG for self-adjoint operators.
 
     This method solves the inverse problem (of the first kind)::
@@ -152,10 +185,16 @@ def conjugate_gradient(op, x, rhs, niter, callback=None):
         Number of iterations.
     callback : callable, optional
         Object executing code per iteration, e.g. plotting each iterate.
+    preconditioner : linear `Operator`, optional
+        Self-adjoint and positive definite operator ``M`` approximating
+        the inverse of ``op``, e.g. the inverse of the diagonal of
+        ``op``. The preconditioned CG method is used, which converges
+        faster if ``M op`` is better conditioned than ``op``.
 
     See Also
     --------
     conjugate_gradient_normal : Solver for nonsymmetric matrices
+    conjugate_gradient_block : Solver for several right-hand sides
     """
     # TODO: add a book reference
     # TODO: update doc
@@ -167,12 +206,21 @@ def conjugate_gradient(op, x, rhs, niter, callback=None):
         raise TypeError('`x` {!r} is not in the domain of `op` {!r}'
                         ''.format(x, op.domain))
 
+    if preconditioner is not None:
+        _check_preconditioner(preconditioner, op.domain)
+
     r = op(x)
     r.lincomb(1, rhs, -1, r)       # r = rhs - A x
-    p = r.copy()
     d = op.domain.element()  # Extra storage for storing A x
 
-    sqnorm_r_old = r.norm() ** 2  # Only recalculate norm after update
+    if preconditioner is None:
+        z = r
+        p = r.copy()
+        sqnorm_r_old = r.norm() ** 2  # Only recalculate norm after update
+    else:
+        z = preconditioner(r)      # z = M r
+        p = z.copy()
+        sqnorm_r_old = r.inner(z)  # Squared norm in the M-inner product
 
     if sqnorm_r_old == 0:  # Return if no step forward
         return
@@ -190,18 +238,26 @@ def conjugate_gradient(op, x, rhs, niter, callback=None):
         x.lincomb(1, x, alpha, p)            # x = x + alpha*p
         r.lincomb(1, r, -alpha, d)           # r = r - alpha*d
 
-        sqnorm_r_new = r.norm() ** 2
+        if preconditioner is None:
+            sqnorm_r_new = r.norm() ** 2
+        else:
+            preconditioner(r, out=z)         # z = M r
+            sqnorm_r_new = r.inner(z)
 
         beta = sqnorm_r_new / sqnorm_r_old
         sqnorm_r_old = sqnorm_r_new
 
-        p.lincomb(1, r, beta, p)                       # p = s + b * p
+        p.lincomb(1, z, beta, p)                       # p = z + b * p
 
         if callback is not None:
             callback(x)
 
+        if sqnorm_r_new == 0:  # Return if converged
+            return
+
 
-def conjugate_gradient_normal(op, x, rhs, niter=1, callback=None):
+def conjugate_gradient_normal(op, x, rhs, niter=1, callback=None,
+                              preconditioner=None):
     """Optimized implementation of CG for the normal equation.
 
     This method solves the inverse problem (of the first kind) ::
@@ -237,6 +293,11 @@ Conjugate_gradient_on_the_normal_equations>`_.
         Number of iterations.
     callback : callable, optional
         Object executing code per iteration, e.g. plotting each iterate.
+    preconditioner : linear `Operator`, optional
+        Self-adjoint and positive definite operator ``M`` on ``op.domain``
+        approximating the inverse of the normal operator
+        ``op.adjoint * op``, e.g. the inverse of the diagonal
+        ``op.adjoint(op(one))`` for operators with nonnegative entries.
 
     See Also
     --------
@@ -250,12 +311,21 @@ Conjugate_gradient_on_the_normal_equations>`_.
         raise TypeError('`x` {!r} is not in the domain of `op` {!r}'
                         ''.format(x, op.domain))
 
+    if preconditioner is not None:
+        _check_preconditioner(preconditioner, op.domain)
+
     d = op(x)
     d.lincomb(1, rhs, -1, d)               # d = rhs - A x
-    p = op.derivative(x).adjoint(d)
-    s = p.copy()
+    s = op.derivative(x).adjoint(d)
+    if preconditioner is None:
+        z = s
+        p = s.copy()
+        sqnorm_s_old = s.norm() ** 2  # Only recalculate norm after update
+    else:
+        z = preconditioner(s)              # z = M s
+        p = z.copy()
+        sqnorm_s_old = s.inner(z)
     q = op.range.element()
-    sqnorm_s_old = s.norm() ** 2  # Only recalculate norm after update
 
     for _ in range(niter):
         op(p, out=q)                       # q = A p
@@ -268,15 +338,610 @@ Conjugate_gradient_on_the_normal_equations>`_.
         d.lincomb(1, d, -a, q)              # d = d - a*Ap
         op.derivative(p).adjoint(d, out=s)  # s = A^T d
 
-        sqnorm_s_new = s.norm() ** 2
+        if preconditioner is None:
+            sqnorm_s_new = s.norm() ** 2
+        else:
+            preconditioner(s, out=z)        # z = M s
+            sqnorm_s_new = s.inner(z)
         b = sqnorm_s_new / sqnorm_s_old
         sqnorm_s_old = sqnorm_s_new
 
-        p.lincomb(1, s, b, p)               # p = s + b * p
+        p.lincomb(1, z, b, p)               # p = z + b * p
+
+        if callback is not None:
+            callback(x)
+
+
+def conjugate_gradient_block(op, x, rhs, niter, callback=None,
+                             preconditioner=None, executor=None):
+    """Block CG for self-adjoint operators and several right-hand sides.
+
+    This method solves the inverse problems ::
+
+        A(x[j]) = rhs[j],  j = 0, ..., k - 1
+
+    for a linear and self-adjoint `Operator` ``A`` together. The search
+    directions of all systems span a common Krylov space, which usually
+    gives convergence in fewer iterations than ``k`` separate runs of
+    `conjugate_gradient`, see [OLe1980]. In each iteration, ``A`` is
+    applied to all ``k`` search directions through one `DiagonalOperator`,
+    which can evaluate them concurrently.
+
+    Parameters
+    ----------
+    op : linear `Operator`
+        Operator in the inverse problem. It must be linear and
+        self-adjoint. This implies in particular that its domain and
+        range are equal.
+    x : `ProductSpace` element
+        Element of ``op.domain ** k`` to which the results are written.
+        Its initial value is used as starting point of the iteration,
+        and its values are updated in each iteration step.
+    rhs : `ProductSpace` element
+        Element of ``op.range ** k`` containing the right-hand sides.
+    niter : int
+        Number of iterations.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+    preconditioner : linear `Operator`, optional
+        Self-adjoint and positive definite operator approximating the
+        inverse of ``op``.
+    executor : {None, 'threads', 'processes'} or executor, optional
+        Used for the concurrent application of ``op`` to all search
+        directions, see `ProductSpaceOperator`.
+
+    See Also
+    --------
+    conjugate_gradient : Solver for a single right-hand side
+
+    References
+    ----------
+    [OLe1980] O'Leary, D P. *The block conjugate gradient algorithm and
+    related methods*. Linear Algebra and its Applications, 29 (1980),
+    pp 293-322.
+    """
+    if op.domain != op.range:
+        raise ValueError('operator needs to be self-adjoint')
+
+    num_rhs = len(rhs)
+    block_space = op.domain ** num_rhs
+    if x not in block_space:
+        raise TypeError('`x` {!r} is not in the space {!r}'
+                        ''.format(x, block_space))
+    if preconditioner is not None:
+        _check_preconditioner(preconditioner, op.domain)
+
+    block_op = DiagonalOperator(op, num_rhs, executor=executor)
+    if preconditioner is not None:
+        block_precon = DiagonalOperator(preconditioner, num_rhs,
+                                        executor=executor)
+
+    try:
+        r = block_op(x)
+        r.lincomb(1, rhs, -1, r)       # R = rhs - A X
+        if preconditioner is None:
+            z = r
+        else:
+            z = block_precon(r)        # Z = M R
+        p = z.copy()
+        q = block_space.element()      # Storage for A P
+
+        rho_old = _gram_matrix(z, r)
+        if not np.any(rho_old):  # Return if no step forward
+            return
+
+        for _ in range(niter):
+            block_op(p, out=q)         # Q = A P
+
+            # Coefficients from (P^T Q) alpha = Z^T R
+            alpha = np.linalg.pinv(_gram_matrix(p, q)).dot(rho_old)
+            if not np.any(alpha):  # Return if step is 0
+                return
+
+            _block_lincomb(x, 1, x, alpha, p)        # X = X + P alpha
+            _block_lincomb(r, 1, r, -alpha, q)       # R = R - Q alpha
+
+            if preconditioner is not None:
+                block_precon(r, out=z)               # Z = M R
+            rho_new = _gram_matrix(z, r)
+
+            beta = np.linalg.pinv(rho_old).dot(rho_new)
+            rho_old = rho_new
+
+            # P = Z + P beta, using Q as temporary
+            _block_lincomb(q, 1, z, beta, p)
+            p, q = q, p
+
+            if callback is not None:
+                callback(x)
+
+            if not np.any(rho_new):  # Return if converged
+                return
+    finally:
+        # Shut down pools created for the concurrent evaluation
+        block_op.close()
+        if preconditioner is not None:
+            block_precon.close()
+
+
+def _gram_matrix(u, v):
+    """Return the matrix of inner products ``G[i, j] = <v[j], u[i]>``."""
+    return np.array([[vj.inner(ui) for vj in v] for ui in u])
+
+
+def _block_lincomb(out, a, x, coeffs, y):
+    """Compute ``out[j] = a * x[j] + sum_i coeffs[i, j] * y[i]`` in-place.
+
+    ``out`` may be the same as ``x``, but not the same as ``y``.
+    """
+    for j, (out_j, x_j) in enumerate(zip(out, x)):
+        out_j.lincomb(a, x_j, coeffs[0, j], y[0])
+        for i in range(1, len(y)):
+            out_j.lincomb(1, out_j, coeffs[i, j], y[i])
+
+
+def _check_preconditioner(preconditioner, space):
+    """Raise if ``preconditioner`` is not a linear operator on ``space``."""
+    if not isinstance(preconditioner, Operator):
+        raise TypeError('`preconditioner` must be an `Operator`, got {!r}'
+                        ''.format(preconditioner))
+    if preconditioner.domain != space or preconditioner.range != space:
+        raise ValueError('`preconditioner` must map {!r} to itself, got '
+                         'domain {!r} and range {!r}'
+                         ''.format(space, preconditioner.domain,
+                                   preconditioner.range))
+
+
+def lsqr(op, x, rhs, niter, damp=0, atol=1e-8, btol=1e-8, callback=None):
+    """Least-squares solution of ``A(x) = rhs`` with the LSQR method.
+
+    The method solves the (damped) least-squares problem ::
+
+        min ||A(x) - rhs||^2 + damp^2 ||x - x0||^2
+
+    for a linear `Operator` ``A`` and the initial value ``x0`` of ``x``,
+    see [PS1982]. It is mathematically equivalent to
+    `conjugate_gradient_normal`, but numerically more stable. Per
+    iteration, ``op`` and ``op.adjoint`` are evaluated once each, and
+    all vector updates are done in-place on preallocated elements.
+
+    Parameters
+    ----------
+    op : linear `Operator`
+        Operator in the inverse problem. ``op.adjoint`` must be
+        well-defined.
+    x : ``op.domain`` element
+        Element to which the result is written. Its initial value is
+        used as starting point of the iteration, and its values are
+        updated in each iteration step.
+    rhs : ``op.range`` element
+        Right-hand side of the equation defining the inverse problem.
+    niter : int
+        Maximum number of iterations.
+    damp : nonnegative float, optional
+        Damping (Tikhonov regularization) parameter.
+    atol, btol : nonnegative float, optional
+        Stopping tolerances. The iteration stops when the residual
+        ``r = rhs - A(x)`` satisfies
+        ``||r|| <= btol * ||rhs|| + atol * ||A|| * ||x||`` or
+        ``||A^* r|| <= atol * ||A|| * ||r||``, where ``||A||``, ``||r||``
+        and ``||x||`` are estimated as part of the iteration. With
+        ``atol = btol = 0``, the iteration only stops early when
+        machine precision is reached.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    See Also
+    --------
+    lsmr : Similar method with monotonically decreasing ``||A^* r||``
+    conjugate_gradient_normal : Equivalent but less stable method
+
+    References
+    ----------
+    [PS1982] Paige, C C, and Saunders, M A. *LSQR: An algorithm for
+    sparse linear equations and sparse least squares*. ACM Transactions
+    on Mathematical Software, 8 (1982), pp 43-71.
+    """
+    if x not in op.domain:
+        raise TypeError('`x` {!r} is not in the domain of `op` {!r}'
+                        ''.format(x, op.domain))
+
+    damp = float(damp)
+    bnorm = rhs.norm()
+
+    # Golub-Kahan bidiagonalization, started from the residual
+    u = op(x)
+    u.lincomb(1, rhs, -1, u)                # u = rhs - A x
+    beta = u.norm()
+    if beta == 0:  # Return if x solves the problem
+        return
+    u /= beta
+
+    v = op.adjoint(u)
+    alpha = v.norm()
+    if alpha == 0:  # Return if x is a least-squares solution
+        return
+    v /= alpha
+
+    w = v.copy()
+    tmp_ran = op.range.element()
+    tmp_dom = op.domain.element()
+
+    phibar = beta
+    rhobar = alpha
+
+    # Quantities for the estimation of ||A||, ||x|| and ||r||
+    anorm_sq = 0.0
+    xxnorm = z = 0.0
+    cs2, sn2 = -1.0, 0.0
+    res2 = 0.0
+
+    for _ in range(niter):
+        # Continue the bidiagonalization
+        op(v, out=tmp_ran)
+        u.lincomb(1, tmp_ran, -alpha, u)    # u = A v - alpha u
+        beta = u.norm()
+        anorm_sq += alpha ** 2 + beta ** 2 + damp ** 2
+        if beta > 0:
+            u /= beta
+            op.adjoint(u, out=tmp_dom)
+            v.lincomb(1, tmp_dom, -beta, v)  # v = A^* u - beta v
+            alpha = v.norm()
+            if alpha > 0:
+                v /= alpha
+
+        # Plane rotation eliminating the damping parameter
+        rhobar1 = np.hypot(rhobar, damp)
+        cs1 = rhobar / rhobar1
+        sn1 = damp / rhobar1
+        psi = sn1 * phibar
+        phibar = cs1 * phibar
+
+        # Plane rotation eliminating the subdiagonal element beta
+        rho = np.hypot(rhobar1, beta)
+        cs = rhobar1 / rho
+        sn = beta / rho
+        theta = sn * alpha
+        rhobar = -cs * alpha
+        phi = cs * phibar
+        phibar = sn * phibar
+        tau = sn * phi
+
+        x.lincomb(1, x, phi / rho, w)        # x = x + (phi / rho) w
+        w.lincomb(1, v, -theta / rho, w)     # w = v - (theta / rho) w
+
+        if callback is not None:
+            callback(x)
+
+        # Estimate ||x|| from the rotations
+        delta = sn2 * rho
+        gambar = -cs2 * rho
+        zbar = (phi - delta * z) / gambar
+        xnorm = np.sqrt(xxnorm + zbar ** 2)
+        gamma = np.hypot(gambar, theta)
+        cs2 = gambar / gamma
+        sn2 = theta / gamma
+        z = (phi - delta * z) / gamma
+        xxnorm += z ** 2
+
+        res2 += psi ** 2
+        rnorm = np.sqrt(phibar ** 2 + res2)
+        arnorm = alpha * abs(tau)
+        if _lsq_converged(rnorm, arnorm, np.sqrt(anorm_sq), xnorm, bnorm,
+                          atol, btol):
+            return
+
+
+def lsmr(op, x, rhs, niter, damp=0, atol=1e-8, btol=1e-8, callback=None):
+    """Least-squares solution of ``A(x) = rhs`` with the LSMR method.
+
+    The method solves the same (damped) least-squares problem as `lsqr`,
+    but is equivalent to MINRES applied to the normal equation, see
+    [FS2011]. Hence the norm of ``A^* r`` decreases monotonically, which
+    makes it safer to stop the iteration early. Per iteration, ``op``
+    and ``op.adjoint`` are evaluated once each, and all vector updates
+    are done in-place on preallocated elements.
+
+    Parameters
+    ----------
+    op : linear `Operator`
+        Operator in the inverse problem. ``op.adjoint`` must be
+        well-defined.
+    x : ``op.domain`` element
+        Element to which the result is written. Its initial value is
+        used as starting point of the iteration, and its values are
+        updated in each iteration step.
+    rhs : ``op.range`` element
+        Right-hand side of the equation defining the inverse problem.
+    niter : int
+        Maximum number of iterations.
+    damp : nonnegative float, optional
+        Damping (Tikhonov regularization) parameter.
+    atol, btol : nonnegative float, optional
+        Stopping tolerances, see `lsqr`.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    See Also
+    --------
+    lsqr : Similar method with monotonically decreasing ``||r||``
+
+    References
+    ----------
+    [FS2011] Fong, D C-L, and Saunders, M A. *LSMR: An iterative
+    algorithm for sparse least-squares problems*. SIAM Journal on
+    Scientific Computing, 33 (2011), pp 2950-2971.
+    """
+    if x not in op.domain:
+        raise TypeError('`x` {!r} is not in the domain of `op` {!r}'
+                        ''.format(x, op.domain))
+
+    damp = float(damp)
+    bnorm = rhs.norm()
+
+    # Golub-Kahan bidiagonalization, started from the residual
+    u = op(x)
+    u.lincomb(1, rhs, -1, u)                # u = rhs - A x
+    beta = u.norm()
+    if beta == 0:  # Return if x solves the problem
+        return
+    u /= beta
+
+    v = op.adjoint(u)
+    alpha = v.norm()
+    if alpha == 0:  # Return if x is a least-squares solution
+        return
+    v /= alpha
+
+    h = v.copy()
+    hbar = op.domain.zero()
+    tmp_ran = op.range.element()
+    tmp_dom = op.domain.element()
+
+    zetabar = alpha * beta
+    alphabar = alpha
+    rho = rhobar = cbar = 1.0
+    sbar = 0.0
+
+    # Quantities for the estimation of ||r|| and ||A||
+    betadd = beta
+    betad = 0.0
+    rhodold = 1.0
+    tautildeold = thetatilde = zeta = 0.0
+    d = 0.0
+    anorm_sq = alpha ** 2
+
+    for _ in range(niter):
+        # Continue the bidiagonalization
+        op(v, out=tmp_ran)
+        u.lincomb(1, tmp_ran, -alpha, u)    # u = A v - alpha u
+        beta = u.norm()
+        if beta > 0:
+            u /= beta
+            op.adjoint(u, out=tmp_dom)
+            v.lincomb(1, tmp_dom, -beta, v)  # v = A^* u - beta v
+            alpha = v.norm()
+            if alpha > 0:
+                v /= alpha
+
+        # Rotation eliminating the damping parameter
+        chat, shat, alphahat = _sym_ortho(alphabar, damp)
+
+        # Rotation turning B_k into R_k
+        rhoold = rho
+        c, s, rho = _sym_ortho(alphahat, beta)
+        thetanew = s * alpha
+        alphabar = c * alpha
+
+        # Rotation turning R_k^T into Rbar_k
+        rhobarold = rhobar
+        zetaold = zeta
+        thetabar = sbar * rho
+        cbar, sbar, rhobar = _sym_ortho(cbar * rho, thetanew)
+        zeta = cbar * zetabar
+        zetabar = -sbar * zetabar
+
+        # hbar = h - (thetabar * rho / (rhoold * rhobarold)) hbar
+        hbar.lincomb(1, h, -thetabar * rho / (rhoold * rhobarold), hbar)
+        # x = x + (zeta / (rho * rhobar)) hbar
+        x.lincomb(1, x, zeta / (rho * rhobar), hbar)
+        # h = v - (thetanew / rho) h
+        h.lincomb(1, v, -thetanew / rho, h)
 
         if callback is not None:
             callback(x)
 
+        # Estimate ||r|| from the rotations
+        betaacute = chat * betadd
+        betacheck = -shat * betadd
+        betahat = c * betaacute
+        betadd = -s * betaacute
+
+        thetatildeold = thetatilde
+        ctildeold, stildeold, rhotildeold = _sym_ortho(rhodold, thetabar)
+        thetatilde = stildeold * rhobar
+        rhodold = ctildeold * rhobar
+        betad = -stildeold * betad + ctildeold * betahat
+
+        tautildeold = (zetaold - thetatildeold * tautildeold) / rhotildeold
+        taud = (zeta - thetatilde * tautildeold) / rhodold
+        d += betacheck ** 2
+        rnorm = np.sqrt(d + (betad - taud) ** 2 + betadd ** 2)
+
+        # Estimate ||A||
+        anorm_sq += beta ** 2
+        anorm = np.sqrt(anorm_sq)
+        anorm_sq += alpha ** 2
+
+        if _lsq_converged(rnorm, abs(zetabar), anorm, x.norm(), bnorm,
+                          atol, btol):
+            return
+
+
+def minres(op, x, rhs, niter, tol=1e-8, callback=None):
+    """Optimized implementation of MINRES for self-adjoint operators.
+
+    This method solves the inverse problem (of the first kind) ::
+
+        A(x) = rhs
+
+    for a linear and self-adjoint `Operator` ``A``, which may be
+    indefinite or singular, by minimizing ``||rhs - A(x)||`` over a
+    Krylov subspace, see [PS1975]. Per iteration, ``op`` is evaluated
+    once, and all vector updates are done in-place on preallocated
+    elements.
+
+    Parameters
+    ----------
+    op : linear `Operator`
+        Operator in the inverse problem. It must be linear and
+        self-adjoint. This implies in particular that its domain and
+        range are equal.
+    x : ``op.domain`` element
+        Element to which the result is written. Its initial value is
+        used as starting point of the iteration, and its values are
+        updated in each iteration step.
+    rhs : ``op.range`` element
+        Right-hand side of the equation defining the inverse problem.
+    niter : int
+        Maximum number of iterations.
+    tol : nonnegative float, optional
+        Stopping tolerance. The iteration stops when the residual
+        ``r = rhs - A(x)`` satisfies ``||r|| <= tol * ||A|| * ||x||`` or
+        ``||A r|| <= tol * ||A|| * ||r||``, where ``||A||`` and
+        ``||r||`` are estimated as part of the iteration.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    See Also
+    --------
+    conjugate_gradient : Solver for positive definite operators
+
+    References
+    ----------
+    [PS1975] Paige, C C, and Saunders, M A. *Solution of sparse
+    indefinite systems of linear equations*. SIAM Journal on Numerical
+    Analysis, 12 (1975), pp 617-629.
+    """
+    if op.domain != op.range:
+        raise ValueError('operator needs to be self-adjoint')
+
+    if x not in op.domain:
+        raise TypeError('`x` {!r} is not in the domain of `op` {!r}'
+                        ''.format(x, op.domain))
+
+    r1 = op(x)
+    r1.lincomb(1, rhs, -1, r1)              # r1 = rhs - A x
+    beta1 = r1.norm()
+    if beta1 == 0:  # Return if x solves the problem
+        return
+
+    # Lanczos vectors r1, r2 and the new one y; v is the normalized r2
+    r2 = r1.copy()
+    y = op.domain.element()
+    v = op.domain.element()
+
+    # Search directions w and the previous ones w1, w2
+    w = op.domain.zero()
+    w1 = op.domain.element()
+    w2 = op.domain.zero()
+
+    oldb = 0.0
+    beta = beta1
+    dbar = epsln = 0.0
+    phibar = beta1
+    tnorm2 = 0.0
+    cs, sn = -1.0, 0.0
+
+    for i in range(niter):
+        # Lanczos step
+        v.lincomb(1 / beta, r2)              # v = r2 / beta
+        op(v, out=y)                         # y = A v
+        if i > 0:
+            y.lincomb(1, y, -beta / oldb, r1)
+        alpha = v.inner(y).real
+        y.lincomb(1, y, -alpha / beta, r2)
+        r1, r2, y = r2, y, r1
+        oldb = beta
+        beta = r2.norm()
+        tnorm2 += alpha ** 2 + oldb ** 2 + beta ** 2
+
+        # Plane rotation applied to the tridiagonal matrix
+        oldeps = epsln
+        delta = cs * dbar + sn * alpha
+        gbar = sn * dbar - cs * alpha
+        epsln = sn * beta
+        dbar = -cs * beta
+        root = np.hypot(gbar, dbar)
+        gamma = max(np.hypot(gbar, beta), np.finfo(float).eps)
+        cs = gbar / gamma
+        sn = beta / gamma
+        phi = cs * phibar
+        phibar = sn * phibar
+
+        # w = (v - oldeps * w1 - delta * w2) / gamma, reusing the oldest
+        w1, w2, w = w2, w, w1
+        w.lincomb(1 / gamma, v, -oldeps / gamma, w1)
+        w.lincomb(1, w, -delta / gamma, w2)
+        x.lincomb(1, x, phi, w)              # x = x + phi * w
+
+        if callback is not None:
+            callback(x)
+
+        # Stopping criteria, see `_lsq_converged`
+        anorm = np.sqrt(tnorm2)
+        xnorm = x.norm()
+        rnorm = phibar
+        if anorm * xnorm == 0:
+            test1 = float('inf')
+        else:
+            test1 = rnorm / (anorm * xnorm)
+        # ||A r|| = root * ||r|| for the residual before this step, hence
+        # ||A r|| / (||A|| * ||r||) reduces to root / ||A||
+        test2 = root / anorm
+        if 1 + test1 <= 1 or 1 + test2 <= 1 or test1 <= tol or test2 <= tol:
+            return
+
+        if beta == 0:  # Return if the Krylov space is exhausted
+            return
+
+
+def _lsq_converged(rnorm, arnorm, anorm, xnorm, bnorm, atol, btol):
+    """Return ``True`` if the LSQR/LSMR stopping criteria are satisfied."""
+    if rnorm == 0 or arnorm == 0:
+        return True
+    if bnorm == 0:
+        # Homogeneous problem, use absolute tolerances
+        bnorm = 1.0
+    test1 = rnorm / bnorm
+    test2 = arnorm / (anorm * rnorm)
+    t1 = test1 / (1 + anorm * xnorm / bnorm)
+    rtol = btol + atol * anorm * xnorm / bnorm
+    return (1 + test2 <= 1 or 1 + t1 <= 1 or
+            test2 <= atol or test1 <= rtol)
+
+
+def _sym_ortho(a, b):
+    """Return ``(c, s, r)`` of a stable Givens rotation zeroing ``b``.
+
+    The values satisfy ``c * a + s * b = r`` and ``-s * a + c * b = 0``.
+    """
+    if b == 0:
+        return np.sign(a), 0.0, abs(a)
+    elif a == 0:
+        return 0.0, np.sign(b), abs(b)
+    elif abs(b) > abs(a):
+        tau = a / b
+        s = np.sign(b) / np.sqrt(1 + tau ** 2)
+        c = s * tau
+        r = b / s
+    else:
+        tau = b / a
+        c = np.sign(a) / np.sqrt(1 + tau ** 2)
+        s = c * tau
+        r = a / c
+    return c, s, r
+
 
 def exp_zero_seq(base):
     """Default exponential zero sequence.
@@ -472,6 +1137,7 @@ def kaczmarz(ops, x, rhs, niter, omega=1, projection=None, random=False,
     See Also
     --------
     landweber
+    sart : Normalized variant for linear operators
     """
     domain = ops[0].domain
     if any(domain != opi.domain for opi in ops):
@@ -521,6 +1187,271 @@ def kaczmarz(ops, x, rhs, niter, omega=1, projection=None, random=False,
             callback(x)
 
 
+def sart(ops, x, rhs, niter, omega=1.0, block_size=1, projection=None,
+         callback=None, callback_loop='outer', **kwargs):
+    """Simultaneous algebraic reconstruction technique with subsets.
+
+    Solves the linear inverse problem given by the set of equations::
+
+        A_i(x) = rhs_i
+
+    by cycling over the subsets ``i``, normalizing the residuals by the
+    row sums ``A_i 1`` and the back-projections by the column sums
+    ``A_i^* 1`` of the operators [AK1984].
+
+    Parameters
+    ----------
+    ops : sequence of linear `Operator`'s
+        Operators in the inverse problem, all with the same domain.
+    x : ``ops[i].domain`` element
+        Element to which the result is written. Its initial value is
+        used as starting point of the iteration, and its values are
+        updated in each iteration step.
+    rhs : sequence of ``ops[i].range`` elements
+        Right-hand sides of the equations defining the inverse problem.
+    niter : int
+        Number of iterations.
+    omega : positive float, optional
+        Relaxation parameter, the iteration converges for
+        ``0 < omega < 2``.
+    block_size : positive int, optional
+        Number of consecutive subsets (in the given ``order``) that are
+        combined into one update. The updates of the subsets of a block
+        are computed independently at the same iterate and averaged,
+        see Notes. With an ``executor``, they are computed concurrently.
+    projection : callable, optional
+        Function that can be used to modify the iterates in each update,
+        for example enforcing positivity. The function should take one
+        argument and modify it in-place.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+    callback_loop : {'inner', 'outer'}, optional
+        Whether the callback should be called after each block update or
+        after each pass over all subsets.
+
+    Other Parameters
+    ----------------
+    order : {'sequential', 'golden_angle', 'random'} or sequence of int, \
+optional
+        Order in which the subsets are visited, see `subset_order`.
+        The blocks are formed from consecutive subsets in this order.
+        With ``'random'``, the subsets are reshuffled in each iteration,
+        as in `osmlem`.
+        Default: ``'sequential'``
+    executor : {None, 'threads'} or `concurrent.futures.Executor`, optional
+        Strategy for evaluating the subsets of a block, see `osmlem`.
+    cache_sums : bool, optional
+        If ``True``, the row and column sums of the operators are stored
+        for their lifetime and reused in later calls with the same
+        operator objects. This assumes that the operators are not changed
+        in-place in between.
+        Default: ``False``
+    cache_dir, cache_key : str, optional
+        Directory in which the row and column sums are stored and from
+        which they are loaded in later calls, and a user-chosen key
+        identifying the operators, see `osmlem`.
+    tol : positive float, optional
+        Stop the iteration as soon as the change of ``x`` in one pass
+        over all subsets is smaller than ``tol`` relative to its norm,
+        see `RelativeChange`.
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping the iteration early, evaluated with the
+        change of ``x`` in one pass over all subsets. Cannot be combined
+        with ``tol``.
+
+    Notes
+    -----
+    For linear operators :math:`A_i` with nonnegative "matrix entries",
+    e.g. ray transforms, each block :math:`B` of subsets is applied by the
+    update
+
+    .. math::
+        x \\leftarrow x + \\omega
+        \\frac{\\sum_{i \\in B} A_i^* \\big( (y_i - A_i x) / A_i 1 \\big)}
+        {\\sum_{i \\in B} A_i^* 1},
+
+    where the division by the row sums :math:`A_i 1` is only done where
+    they are positive, and the other entries are set to zero. The same
+    holds for the column sums. This is the SART update of [AK1984] for
+    the union of the subsets in :math:`B`, and with a single subset, the
+    method is `sirt`.
+
+    The row and column sums are computed once per operator, and all
+    temporaries are allocated before the iteration. Only with
+    ``order='random'`` and ``block_size > 1``, the column sums of the
+    changing blocks are summed up in each iteration. Memory for one
+    element of each operator range and ``block_size`` elements of the
+    domain is needed in addition to the (cached) row and column sums.
+
+    References
+    ----------
+    [AK1984] Andersen, A H, and Kak, A C. *Simultaneous algebraic
+    reconstruction technique (SART): a superior implementation of the
+    ART algorithm*. Ultrasonic Imaging, 6 (1984), pp 81-94.
+
+    See Also
+    --------
+    sirt : Variant without subsets
+    kaczmarz : Unnormalized variant, also for nonlinear operators
+    osmlem : Ordered subsets for Poisson noise
+    """
+    domain = ops[0].domain
+    if any(domain != opi.domain for opi in ops):
+        raise ValueError('domains of `ops` are not all equal')
+    if not all(opi.is_linear for opi in ops):
+        raise ValueError('`ops` must be linear')
+
+    if x not in domain:
+        raise TypeError('`x` {!r} is not in the domain of `ops` {!r}'
+                        ''.format(x, domain))
+
+    n_ops = len(ops)
+    if n_ops != len(rhs):
+        raise ValueError('`number of `ops` {} does not match number of '
+                         '`rhs` {}'.format(n_ops, len(rhs)))
+
+    omega = float(omega)
+    subset_blocks = _SubsetBlocks(n_ops, block_size=block_size,
+                                  order=kwargs.pop('order', 'sequential'),
+                                  executor=kwargs.pop('executor', None))
+    block_size = subset_blocks.block_size
+
+    cache = kwargs.pop('cache_sums', False)
+    cache_dir = kwargs.pop('cache_dir', None)
+    cache_key = kwargs.pop('cache_key', None)
+    stopping = _normalized_stopping(kwargs.pop('tol', None),
+                                    kwargs.pop('stopping', None))
+    if kwargs:
+        raise TypeError('got unexpected keyword arguments: {}'.format(kwargs))
+
+    def ones_image(i, adjoint):
+        """Return the column or row sums of ``ops[i]``."""
+        return _ones_image(ops[i], adjoint=adjoint, cache=cache,
+                           cache_dir=cache_dir,
+                           cache_key=_subset_key(cache_key, i))
+
+    # Inverse row sums per subset, and inverse column sums per block. The
+    # latter are stored unless the blocks change in each pass.
+    row_weights = [_inverse_weights(ones_image(i, adjoint=False))
+                   for i in range(n_ops)]
+    col_weights = {}
+    store_col_weights = not subset_blocks.random or block_size == 1
+
+    def block_col_weights(block):
+        """Return the inverse column sums of the subsets in ``block``."""
+        key = tuple(block)
+        if key in col_weights:
+            return col_weights[key]
+
+        col_sums = ones_image(block[0], adjoint=True)
+        if len(block) > 1:
+            col_sums = col_sums.copy()
+            for i in block[1:]:
+                col_sums += ones_image(i, adjoint=True)
+        weights = _inverse_weights(col_sums)
+        if store_col_weights:
+            col_weights[key] = weights
+        return weights
+
+    # One range temporary per subset and one domain temporary per subset
+    # in a block
+    tmp_ran = [opi.range.element() for opi in ops]
+    tmp_dom = [domain.element() for _ in range(block_size)]
+
+    # Previous iterate, only stored when the stopping criterion is due
+    if stopping is not None:
+        x_prev = domain.element()
+
+    def backproject_residual(i, out):
+        """Compute ``out = A_i^* ((rhs_i - A_i x) / A_i 1)`` in-place."""
+        ops[i](x, out=tmp_ran[i])
+        tmp_ran[i].lincomb(1, rhs[i], -1, tmp_ran[i])
+        tmp_ran[i] *= row_weights[i]
+        ops[i].adjoint(tmp_ran[i], out=out)
+
+    with subset_blocks:
+        for k in range(niter):
+            check_stopping = stopping is not None and stopping.is_due(k)
+            if check_stopping:
+                x_prev.assign(x)
+
+            for block in subset_blocks.blocks():
+                subset_blocks.map(backproject_residual, block, tmp_dom)
+                for j in range(1, len(block)):
+                    tmp_dom[0] += tmp_dom[j]
+                tmp_dom[0] *= block_col_weights(block)
+                x.lincomb(1, x, omega, tmp_dom[0])
+
+                if projection is not None:
+                    projection(x)
+
+                if callback is not None and callback_loop == 'inner':
+                    callback(x)
+
+            if callback is not None and callback_loop == 'outer':
+                callback(x)
+
+            if check_stopping:
+                tmp_dom[0].lincomb(1, x, -1, x_prev)
+                if stopping([tmp_dom[0].norm()], [x.norm()]):
+                    break
+
+
+def sirt(op, x, rhs, niter, omega=1.0, projection=None, callback=None,
+         **kwargs):
+    """Simultaneous iterative reconstruction technique.
+
+    Solves the linear inverse problem ``op(x) = rhs`` by the iteration ::
+
+        x <- x + omega * C op^*(R (rhs - op(x)))
+
+    where ``R`` and ``C`` are the inverses of the row sums ``op(1)`` and
+    the column sums ``op^*(1)``, respectively.
+
+    Parameters
+    ----------
+    op : linear `Operator`
+        Operator in the inverse problem.
+    x : ``op.domain`` element
+        Element to which the result is written. Its initial value is
+        used as starting point of the iteration, and its values are
+        updated in each iteration step.
+    rhs : ``op.range`` element
+        Right-hand side of the equation defining the inverse problem.
+    niter : int
+        Number of iterations.
+    omega : positive float, optional
+        Relaxation parameter, the iteration converges for
+        ``0 < omega < 2``.
+    projection : callable, optional
+        Function that can be used to modify the iterates in each
+        iteration, for example enforcing positivity. The function should
+        take one argument and modify it in-place.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    Other Parameters
+    ----------------
+    cache_sums, cache_dir, cache_key, tol, stopping : optional
+        See `sart`.
+
+    See Also
+    --------
+    sart : Variant with subsets of the equations
+    landweber : Unnormalized variant
+    """
+    sart([op], x, [rhs], niter, omega=omega, projection=projection,
+         callback=callback, **kwargs)
+
+
+def _inverse_weights(sums, eps=1e-8):
+    """Return ``1 / sums`` where ``sums > eps``, and 0 elsewhere."""
+    sums_arr = sums.asarray()
+    weights = np.zeros_like(sums_arr)
+    np.divide(1, sums_arr, out=weights, where=sums_arr > eps)
+    return sums.space.element(weights)
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()
@@ -0,0 +1,146 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Coarse-to-fine (multilevel) solution of inverse problems."""
+
+from __future__ import print_function, division, absolute_import
+import numpy as np
+
+from odl.discr import DiscreteLp, Resampling, uniform_discr_fromdiscr
+from odl.util import normalized_scalar_param_list, safe_int_conv
+
+
+__all__ = ('multilevel_solve',)
+
+
+def multilevel_solve(op_factory, solver, x, niter, num_levels=3, factor=2,
+                     interp='linear', callback=None):
+    """Solve an inverse problem from coarse to fine discretizations.
+
+    A pyramid of spaces is created from ``x.space`` by reducing the
+    number of cells by ``factor`` per level. Starting on the coarsest
+    level, the forward operator is created for the level and ``solver``
+    is run. Its result, interpolated to the next finer level, is the
+    starting point on that level. Since most of the iterations are done
+    on small spaces, far fewer iterations are needed on the finest level.
+
+    Parameters
+    ----------
+    op_factory : callable
+        Function with signature ``op_factory(space)`` that returns the
+        forward operator with domain ``space`` for a level, e.g.
+        ``lambda space: odl.tomo.RayTransform(space, geometry)``.
+        The range of the operator should not depend on the level, so
+        that the same data can be used on all levels.
+    solver : callable
+        Function with signature ``solver(op, x, niter)`` that runs
+        ``niter`` iterations of a solver for the operator ``op``,
+        starting from and updating ``x`` in-place, e.g.
+        ``lambda op, x, niter:
+        odl.solvers.conjugate_gradient_normal(op, x, data, niter)``.
+    x : `DiscreteLp` element
+        Element to which the result on the finest level is written. The
+        space must be uniformly discretized. Its initial value, sampled
+        down to the coarsest level, is used as starting point.
+    niter : int or sequence of ints
+        Number of iterations per level. A sequence is given from the
+        coarsest to the finest level.
+    num_levels : positive int, optional
+        Number of levels, including the finest one.
+    factor : int or sequence of ints, optional
+        Factor by which the number of cells is reduced per level, or
+        one factor per axis. Axes are never reduced below one cell.
+    interp : string, optional
+        Interpolation scheme used to transfer solutions to the next
+        finer level.
+    callback : callable, optional
+        Function called with the solution after each level.
+
+    Returns
+    -------
+    spaces : list of `DiscreteLp`
+        The spaces of the pyramid, from the coarsest to the finest one.
+
+    Examples
+    --------
+    Solve a deconvolution-like problem with conjugate gradient on three
+    levels:
+
+    >>> space = odl.uniform_discr(0, 1, 16)
+    >>> x_true = space.element(lambda x: x ** 2)
+    >>> op_factory = lambda sp: odl.ScalingOperator(sp, 2.0)
+    >>> solver = lambda op, x, niter: odl.solvers.conjugate_gradient(
+    ...     op, x, op(op.domain.element(lambda x: x ** 2)), niter)
+    >>> x = space.zero()
+    >>> spaces = odl.solvers.multilevel_solve(op_factory, solver, x,
+    ...                                       niter=[5, 2, 1])
+    >>> [sp.shape for sp in spaces]
+    [(4,), (8,), (16,)]
+    >>> (x - x_true).norm() < 1e-10
+    True
+    """
+    space = x.space
+    if not isinstance(space, DiscreteLp) or not space.is_uniform:
+        raise TypeError('`x.space` must be a uniformly discretized '
+                        '`DiscreteLp`, got {!r}'.format(space))
+
+    num_levels, num_levels_in = safe_int_conv(num_levels), num_levels
+    if num_levels < 1:
+        raise ValueError('`num_levels` must be positive, got {}'
+                         ''.format(num_levels_in))
+
+    niters = normalized_scalar_param_list(niter, num_levels,
+                                          param_conv=safe_int_conv)
+
+    spaces = _multilevel_spaces(space, num_levels, factor, interp)
+
+    # Starting point on the coarsest level
+    if num_levels == 1:
+        x_level = x
+    else:
+        x_level = Resampling(space, spaces[0], precomputed=True)(x)
+
+    for level, (level_space, level_niter) in enumerate(zip(spaces, niters)):
+        if level > 0:
+            # Interpolate the solution of the coarser level
+            prolongation = Resampling(spaces[level - 1], level_space,
+                                      precomputed=True)
+            if level_space is space:
+                prolongation(x_level, out=x)
+                x_level = x
+            else:
+                x_level = prolongation(x_level)
+
+        op = op_factory(level_space)
+        if op.domain != level_space:
+            raise ValueError('`op_factory` returned an operator with '
+                             'domain {!r}, expected {!r}'
+                             ''.format(op.domain, level_space))
+        solver(op, x_level, level_niter)
+
+        if callback is not None:
+            callback(x_level)
+
+    return spaces
+
+
+def _multilevel_spaces(space, num_levels, factor, interp):
+    """Return the spaces of a pyramid, from coarsest to finest."""
+    factors = np.array(normalized_scalar_param_list(
+        factor, space.ndim, param_conv=safe_int_conv))
+    if np.any(factors < 1):
+        raise ValueError('`factor` must be positive, got {}'.format(factor))
+
+    spaces = [space]
+    shape = np.array(space.shape)
+    for _ in range(num_levels - 1):
+        shape = np.maximum(-(-shape // factors), 1)
+        spaces.append(uniform_discr_fromdiscr(
+            space, shape=tuple(int(n) for n in shape), interp=interp))
+
+    return spaces[::-1]
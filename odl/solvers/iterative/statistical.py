@@ -9,12 +9,26 @@
 """Maximum Likelihood Expectation Maximization algorithm."""
 
 from __future__ import print_function, division, absolute_import
+import hashlib
+import os
+import threading
+import weakref
 import numpy as np
 
-__all__ = ('mlem', 'osmlem', 'loglikelihood')
+from odl.solvers.util.stopping import _normalized_stopping
+from odl.util import is_string
+
+__all__ = ('mlem', 'osmlem', 'loglikelihood', 'subset_order')
 
 
 AVAILABLE_MLEM_NOISE = ('poisson',)
+SUBSET_ORDERS = ('sequential', 'golden_angle', 'random')
+
+# Column sums `op.adjoint(op.range.one())` (key `True`) and row sums
+# `op(op.domain.one())` (key `False`), weakly keyed on the operator such
+# that entries are dropped together with the operator
+_SENSITIVITY_CACHE = weakref.WeakKeyDictionary()
+_SENSITIVITY_CACHE_LOCK = threading.Lock()
 
 
 def mlem(op, x, data, niter, noise='poisson', callback=None, **kwargs):
@@ -58,6 +72,10 @@ def mlem(op, x, data, niter, noise='poisson', callback=None, **kwargs):
         Usable with ``noise='poisson'``. The algorithm contains a ``A^T 1``
         term, if this parameter is given, it is replaced by it.
         Default: ``op.adjoint(op.range.one())``
+    cache_sensitivities, cache_dir, cache_key : optional
+        Cache the default sensitivities, see `osmlem`.
+    tol, stopping : optional
+        Stop the iteration early, see `osmlem`.
 
     Notes
     -----
@@ -121,6 +139,56 @@ def osmlem(op, x, data, niter, noise='poisson', callback=None, **kwargs):
         Usable with ``noise='poisson'``. The algorithm contains an ``A^T 1``
         term, if this parameter is given, it is replaced by it.
         Default: ``op[i].adjoint(op[i].range.one())``
+    cache_sensitivities : bool, optional
+        If ``True``, the default sensitivities are stored for the lifetime
+        of the operators ``op[i]`` and reused in later calls with the same
+        operator objects. This assumes that the operators are not changed
+        in-place in between.
+        Default: ``False``
+    cache_dir : str, optional
+        Directory in which the default sensitivities are stored and from
+        which they are loaded in later calls, also across sessions. This
+        requires a ``cache_key``.
+    cache_key : str, optional
+        Identifier of the operators ``op``, e.g., a hash of the geometry
+        of a ray transform, chosen by the user. It must change whenever
+        the operators change. The files in ``cache_dir`` are named after
+        ``cache_key``, the subset index and the domain and range of the
+        subset operators.
+    order : {'sequential', 'golden_angle', 'random'} or sequence of int, \
+optional
+        Order in which the subsets are visited in each iteration, see
+        `subset_order`. A sequence is used as permutation of the subset
+        indices. ``'random'`` draws a new permutation in each iteration.
+        Default: ``'sequential'``
+    block_size : positive int, optional
+        Number of consecutive subsets (in the given ``order``) that are
+        combined into one update. The subsets of a block are evaluated
+        independently at the same iterate, and their multiplicative
+        updates are averaged with weights given by the sensitivities,
+        see Notes. With an ``executor``, the subsets of a block are
+        evaluated concurrently.
+        Default: 1
+    executor : {None, 'threads'} or `concurrent.futures.Executor`, optional
+        Strategy for evaluating the subsets of a block.
+
+        - ``None``: Evaluate the subsets one after another.
+        - ``'threads'``: Evaluate the subsets concurrently in a
+          `concurrent.futures.ThreadPoolExecutor` with ``block_size``
+          workers, which is shut down at the end of the iteration.
+        - `concurrent.futures.Executor` instance: Use this pool. The
+          subsets are evaluated in-place, hence process pools are not
+          supported and raise a ``ValueError``.
+
+        The operators must be safe to evaluate concurrently.
+    tol : positive float, optional
+        Stop the iteration as soon as the change of ``x`` in one pass
+        over all subsets is smaller than ``tol`` relative to its norm,
+        see `RelativeChange`.
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping the iteration early, evaluated with the
+        change of ``x`` in one pass over all subsets. Cannot be combined
+        with ``tol``.
 
     Notes
     -----
@@ -139,6 +207,19 @@ def osmlem(op, x, data, niter, noise='poisson', callback=None, **kwargs):
 
     for :math:`m = 1, ..., M` and :math:`x_{n+1} = x_{n + M/M}`.
 
+    With ``block_size`` :math:`> 1`, the subsets :math:`i \\in B` of a block
+    are applied at once by averaging their updates,
+
+    .. math::
+       x \\leftarrow x \\frac{\\sum_{i \\in B} A_i^* 1 \\cdot u_i}
+       {\\sum_{i \\in B} A_i^* 1}, \\quad
+       u_i = \\frac{A_i^* (g_i / A_i(x))}{A_i^* 1},
+
+    which is the OSEM update for the union of the subsets in :math:`B`.
+    Larger blocks hence trade the acceleration by ordered subsets for
+    parallelism; with a single block containing all subsets, the
+    algorithm is `mlem`.
+
     The algorithm is not guaranteed to converge, but works for many practical
     problems.
 
@@ -150,6 +231,7 @@ def osmlem(op, x, data, niter, noise='poisson', callback=None, **kwargs):
     --------
     mlem : Ordinary MLEM algorithm without subsets.
     loglikelihood : Function for calculating the logarithm of the likelihood
+    subset_order : Orderings of the subsets
     """
     noise, noise_in = str(noise).lower(), noise
     if noise not in AVAILABLE_MLEM_NOISE:
@@ -176,9 +258,16 @@ def osmlem(op, x, data, niter, noise='poisson', callback=None, **kwargs):
 
         # Extract the sensitivites parameter
         sensitivities = kwargs.pop('sensitivities', None)
+        cache = kwargs.pop('cache_sensitivities', False)
+        cache_dir = kwargs.pop('cache_dir', None)
+        cache_key = kwargs.pop('cache_key', None)
         if sensitivities is None:
-            sensitivities = [np.maximum(opi.adjoint(opi.range.one()), eps)
-                             for opi in op]
+            sensitivities = [
+                np.maximum(_ones_image(opi, adjoint=True, cache=cache,
+                                       cache_dir=cache_dir,
+                                       cache_key=_subset_key(cache_key, i)),
+                           eps)
+                for i, opi in enumerate(op)]
         else:
             # Make sure the sensitivities is a list of the correct size.
             try:
@@ -186,24 +275,318 @@ def osmlem(op, x, data, niter, noise='poisson', callback=None, **kwargs):
             except TypeError:
                 sensitivities = [sensitivities] * n_ops
 
-        tmp_dom = op[0].domain.element()
+        subset_blocks = _SubsetBlocks(
+            n_ops, block_size=kwargs.pop('block_size', 1),
+            order=kwargs.pop('order', 'sequential'),
+            executor=kwargs.pop('executor', None))
+        block_size = subset_blocks.block_size
+        stopping = _normalized_stopping(kwargs.pop('tol', None),
+                                        kwargs.pop('stopping', None))
+
+        # One domain temporary per subset in a block, and storage for the
+        # summed sensitivities of a block
+        tmp_dom = [op[0].domain.element() for _ in range(block_size)]
         tmp_ran = [opi.range.element() for opi in op]
+        if block_size > 1:
+            tmp_sens = op[0].domain.element()
+
+        # Previous iterate, only stored when the stopping criterion is due
+        if stopping is not None:
+            x_prev = op[0].domain.element()
+
+        def backproject_ratio(i, out):
+            """Compute ``out = A_i^T (g_i / A_i(x))`` in-place."""
+            op[i](x, out=tmp_ran[i])
+            tmp_ran[i].ufuncs.maximum(eps, out=tmp_ran[i])
+            data[i].divide(tmp_ran[i], out=tmp_ran[i])
+            op[i].adjoint(tmp_ran[i], out=out)
+
+        with subset_blocks:
+            for k in range(niter):
+                check_stopping = stopping is not None and stopping.is_due(k)
+                if check_stopping:
+                    x_prev.assign(x)
+
+                for block in subset_blocks.blocks():
+                    subset_blocks.map(backproject_ratio, block, tmp_dom)
+                    if len(block) == 1:
+                        tmp_dom[0] /= sensitivities[block[0]]
+                    else:
+                        # Sum of the back-projections over sum of the
+                        # sensitivities
+                        tmp_sens.set_zero()
+                        for j, i in enumerate(block):
+                            if j > 0:
+                                tmp_dom[0] += tmp_dom[j]
+                            tmp_sens += sensitivities[i]
+                        tmp_dom[0] /= tmp_sens
+
+                    x *= tmp_dom[0]
+
+                    if callback is not None:
+                        callback(x)
+
+                if check_stopping:
+                    tmp_dom[0].lincomb(1, x, -1, x_prev)
+                    if stopping([tmp_dom[0].norm()], [x.norm()]):
+                        break
+    else:
+        raise RuntimeError('unknown noise model')
 
-        for _ in range(niter):
-            for i in range(n_ops):
-                op[i](x, out=tmp_ran[i])
-                tmp_ran[i].ufuncs.maximum(eps, out=tmp_ran[i])
-                data[i].divide(tmp_ran[i], out=tmp_ran[i])
 
-                op[i].adjoint(tmp_ran[i], out=tmp_dom)
-                tmp_dom /= sensitivities[i]
+def subset_order(num_subsets, order='sequential'):
+    """Return an order in which to visit subsets in ordered subset methods.
 
-                x *= tmp_dom
+    Parameters
+    ----------
+    num_subsets : positive int
+        Number of subsets.
+    order : {'sequential', 'golden_angle', 'random'} or sequence of int, \
+optional
+        Strategy for the order:
+
+        - ``'sequential'``: Visit the subsets in their natural order.
+        - ``'golden_angle'``: Visit the subsets ``0, ..., num_subsets - 1``
+          such that subset ``k`` is the one whose relative position
+          ``i / num_subsets`` is closest to ``k`` times the golden
+          section, modulo 1 [KM2004]. For subsets of consecutive
+          projection angles, consecutive updates then use data from
+          very different angles, which are approximately independent.
+        - ``'random'``: Visit the subsets in random order.
+        - sequence: Use it as order, it must be a permutation of the
+          subset indices.
+
+    Returns
+    -------
+    order : `numpy.ndarray`
+        Permutation of ``0, ..., num_subsets - 1``.
+
+    Examples
+    --------
+    >>> subset_order(8, 'golden_angle')
+    array([0, 5, 2, 7, 4, 1, 6, 3])
 
-                if callback is not None:
-                    callback(x)
+    References
+    ----------
+    [KM2004] Kohler, T. *A projection access scheme for iterative
+    reconstruction based on the golden section*. IEEE Nuclear Science
+    Symposium Conference Record, 6 (2004), pp 4041-4045.
+    """
+    num_subsets, num_subsets_in = int(num_subsets), num_subsets
+    if num_subsets < 1 or num_subsets != num_subsets_in:
+        raise ValueError('`num_subsets` must be a positive integer, got {}'
+                         ''.format(num_subsets_in))
+
+    if is_string(order):
+        order, order_in = str(order).lower(), order
+        if order not in SUBSET_ORDERS:
+            raise ValueError('`order` {!r} not understood'.format(order_in))
+
+    if order == 'sequential':
+        return np.arange(num_subsets)
+    elif order == 'golden_angle':
+        # Rank of the fractional parts of k * golden section, which is
+        # a permutation
+        golden = (np.sqrt(5) - 1) / 2
+        positions = np.mod(np.arange(num_subsets) * golden, 1)
+        return np.argsort(np.argsort(positions, kind='mergesort'),
+                          kind='mergesort')
+    elif order == 'random':
+        return np.random.permutation(num_subsets)
     else:
-        raise RuntimeError('unknown noise model')
+        order_arr = np.array(order, dtype=int, ndmin=1)
+        if (order_arr.ndim != 1 or
+                not np.array_equal(np.sort(order_arr),
+                                   np.arange(num_subsets))):
+            raise ValueError('`order` {!r} is not a permutation of the {} '
+                             'subset indices'.format(order, num_subsets))
+        return order_arr
+
+
+class _SubsetBlocks(object):
+
+    """Blocks of subsets visited in the passes of ordered subset methods.
+
+    The blocks are formed from ``block_size`` consecutive subsets in the
+    given ``order``, and `map` evaluates a function for the subsets of a
+    block, concurrently with an ``executor``. For ``executor='threads'``,
+    a thread pool is created on first use and shut down by `close`, which
+    is also called at the end of a ``with`` block.
+    """
+
+    def __init__(self, num_subsets, block_size=1, order='sequential',
+                 executor=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        num_subsets : positive int
+            Number of subsets.
+        block_size : positive int, optional
+            Number of subsets per block. Values larger than
+            ``num_subsets`` are reduced to it.
+        order : {'sequential', 'golden_angle', 'random'} or sequence of \
+int, optional
+            Order of the subsets, see `subset_order`. With ``'random'``,
+            the subsets are reshuffled in each pass.
+        executor : {None, 'threads'} or `concurrent.futures.Executor`, \
+optional
+            Strategy for evaluating the subsets of a block, see `osmlem`.
+        """
+        self.num_subsets = int(num_subsets)
+        block_size_in = block_size
+        block_size = int(block_size)
+        if block_size < 1 or block_size != block_size_in:
+            raise ValueError('`block_size` must be a positive integer, got {}'
+                             ''.format(block_size_in))
+        self.block_size = min(block_size, self.num_subsets)
+
+        self.random = is_string(order) and str(order).lower() == 'random'
+        if self.random:
+            self.__order = None
+        else:
+            self.__order = subset_order(self.num_subsets, order)
+
+        self.__executor = _subset_executor(executor)
+        self.__pool = None
+
+    def blocks(self):
+        """Return the blocks of subset indices for one pass."""
+        if self.random:
+            order = subset_order(self.num_subsets, 'random')
+        else:
+            order = self.__order
+        return [order[start:start + self.block_size]
+                for start in range(0, self.num_subsets, self.block_size)]
+
+    def map(self, func, block, outs):
+        """Evaluate ``func(i, out)`` for the subsets ``i`` of ``block``.
+
+        The ``outs`` are zipped with ``block``, and the evaluations are
+        done in the executor if there is one.
+        """
+        if self.__executor is None or len(block) == 1:
+            for i, out in zip(block, outs):
+                func(i, out)
+            return
+
+        if self.__executor == 'threads':
+            if self.__pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self.__pool = ThreadPoolExecutor(max_workers=self.block_size)
+            pool = self.__pool
+        else:
+            pool = self.__executor
+
+        futures = [pool.submit(func, i, out) for i, out in zip(block, outs)]
+        for fut in futures:
+            fut.result()
+
+    def close(self):
+        """Shut down the thread pool created for ``executor='threads'``."""
+        if self.__pool is not None:
+            self.__pool.shutdown()
+            self.__pool = None
+
+    def __enter__(self):
+        """Return ``self`` in a ``with`` statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Call `close` at the end of a ``with`` statement."""
+        self.close()
+
+
+def _subset_executor(executor):
+    """Return ``executor`` after checking that it can evaluate subsets.
+
+    The subsets are evaluated in-place on shared temporaries, hence only
+    ``None``, ``'threads'`` and executors other than process pools are
+    accepted.
+    """
+    from concurrent.futures import Executor, ProcessPoolExecutor
+
+    if executor is None:
+        return None
+    elif is_string(executor):
+        executor, executor_in = str(executor).lower(), executor
+        if executor != 'threads':
+            raise ValueError('`executor` {!r} not understood, expected '
+                             "None or 'threads'".format(executor_in))
+        return executor
+    elif isinstance(executor, ProcessPoolExecutor):
+        raise ValueError('process pools are not supported since the '
+                         'subsets are evaluated in-place')
+    elif isinstance(executor, Executor):
+        return executor
+    else:
+        raise TypeError('`executor` must be None, a string or a '
+                        '`concurrent.futures.Executor`, got {!r}'
+                        ''.format(executor))
+
+
+def _ones_image(op, adjoint=True, cache=False, cache_dir=None,
+                cache_key=None):
+    """Return ``op.adjoint(op.range.one())`` or ``op(op.domain.one())``.
+
+    These are the column and row sums of ``op``, respectively. With
+    ``cache=True``, the result is stored in memory for the lifetime of
+    ``op``. With ``cache_dir``, it is stored on disk in a file named after
+    ``cache_key``, the kind of sums and the domain and range of ``op``.
+    """
+    if cache_dir is not None and cache_key is None:
+        raise ValueError('`cache_dir` requires a `cache_key` identifying '
+                         'the operators')
+
+    if cache:
+        with _SENSITIVITY_CACHE_LOCK:
+            try:
+                cached = _SENSITIVITY_CACHE.get(op, {})
+            except TypeError:
+                # Operator does not support weak references or hashing
+                cached = {}
+            if adjoint in cached:
+                return cached[adjoint]
+
+    space = op.domain if adjoint else op.range
+    if cache_dir is None:
+        result = None
+    else:
+        kind = 'colsums' if adjoint else 'rowsums'
+        key = hashlib.sha1('\n'.join(
+            [str(cache_key), kind, repr(op.domain), repr(op.range)]
+        ).encode('utf-8')).hexdigest()
+        fname = os.path.join(cache_dir, '{}_{}.npy'.format(kind, key))
+        try:
+            result = space.element(np.load(fname))
+        except (IOError, OSError, ValueError):
+            result = None
+
+    if result is None:
+        if adjoint:
+            result = op.adjoint(op.range.one())
+        else:
+            result = op(op.domain.one())
+        if cache_dir is not None:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            np.save(fname, result.asarray())
+
+    if cache:
+        with _SENSITIVITY_CACHE_LOCK:
+            try:
+                _SENSITIVITY_CACHE.setdefault(op, {})[adjoint] = result
+            except TypeError:
+                pass
+    return result
+
+
+def _subset_key(cache_key, index):
+    """Return the cache key of subset ``index``, or ``None``."""
+    if cache_key is None:
+        return None
+    else:
+        return '{}_{}'.format(cache_key, index)
 
 
 def loglikelihood(x, data, noise='poisson'):
@@ -230,3 +613,8 @@ def loglikelihood(x, data, noise='poisson'):
         return np.sum(data * np.log(x + 1e-8) - x)
     else:
         raise RuntimeError('unknown noise model')
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
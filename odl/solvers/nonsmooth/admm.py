@@ -4,6 +4,7 @@ from __future__ import division
 from builtins import range
 
 from odl.operator import Operator, OpDomainError
+from odl.solvers.util.stopping import _normalized_stopping
 
 
 __all__ = ('admm_linearized',)
@@ -42,6 +43,14 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
     ----------------
     callback : callable, optional
         Function called with the current iterate after each iteration.
+    tol : positive float, optional
+        Stop the iteration as soon as the primal residual
+        ``L x - z`` and the change of ``z`` are smaller than ``tol``
+        relative to the norm of ``z``, see `RelativeChange`.
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping the iteration early, evaluated with the
+        primal residual and the change of ``z`` as above. Cannot be
+        combined with ``tol``.
 
     Notes
     -----
@@ -108,11 +117,14 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
     if callback is not None and not callable(callback):
         raise TypeError('`callback` {} is not callable'.format(callback))
 
+    stopping = _normalized_stopping(kwargs.pop('tol', None),
+                                    kwargs.pop('stopping', None))
+
     # Initialize range variables
     z = L.range.zero()
     u = L.range.zero()
 
-    # Temporary for Lx + u [- z]
+    # Temporary for Lx - z [+ u]
     tmp_ran = L(x)
     # Temporary for L^*(Lx + u - z)
     tmp_dom = L.domain.element()
@@ -121,11 +133,14 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
     prox_tau_f = f.proximal(tau)
     prox_sigma_g = g.proximal(sigma)
 
-    for _ in range(niter):
-        # tmp_ran has value Lx^k here
+    # Previous z, only stored when the stopping criterion is due
+    if stopping is not None:
+        z_old = L.range.element()
+
+    for k in range(niter):
+        # tmp_ran has value Lx^k - z^k here
         # tmp_dom <- L^*(Lx^k + u^k - z^k)
         tmp_ran += u
-        tmp_ran -= z
         L.adjoint(tmp_ran, out=tmp_dom)
 
         # x <- x^k - (tau/sigma) L^*(Lx^k + u^k - z^k)
@@ -133,18 +148,30 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
         # x^(k+1) <- prox[tau*f](x)
         prox_tau_f(x, out=x)
 
+        check_stopping = stopping is not None and stopping.is_due(k)
+        if check_stopping:
+            z_old.assign(z)
+
         # tmp_ran <- Lx^(k+1)
         L(x, out=tmp_ran)
         # z^(k+1) <- prox[sigma*g](Lx^(k+1) + u^k)
         prox_sigma_g(tmp_ran + u, out=z)  # 1 copy here
 
+        # tmp_ran <- Lx^(k+1) - z^(k+1)
+        tmp_ran -= z
         # u^(k+1) = u^k + Lx^(k+1) - z^(k+1)
         u += tmp_ran
-        u -= z
 
         if callback is not None:
             callback(x)
 
+        if check_stopping:
+            # tmp_ran holds the primal residual
+            z_old.lincomb(1, z, -1, z_old)
+            z_norm = z.norm()
+            if stopping([tmp_ran.norm(), z_old.norm()], [z_norm, z_norm]):
+                break
+
 
 def admm_linearized_simple(x, f, g, L, tau, sigma, niter, **kwargs):
     """Non-optimized version of ``admm_linearized``.
@@ -13,6 +13,7 @@ from __future__ import print_function, division, absolute_import
 import numpy as np
 
 from odl.operator import Operator
+from odl.solvers.util.stopping import _normalized_stopping
 
 
 __all__ = ('douglas_rachford_pd', 'douglas_rachford_pd_stepsize')
@@ -72,6 +73,14 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
     lam : float or callable, optional
         Overrelaxation step size. If callable, it should take an index
         (starting at zero) and return the corresponding step size.
+    tol : positive float, optional
+        Stop the iteration as soon as the changes of the primal variable
+        and the dual variables are smaller than ``tol`` relative to
+        their norms, see `RelativeChange`.
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping the iteration early, evaluated with the
+        changes of the primal variable and the dual variables. Cannot be
+        combined with ``tol``.
 
     Notes
     -----
@@ -155,6 +164,9 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
         raise ValueError('`lam` must callable or a number between 0 and 2')
     lam = lam_in if callable(lam_in) else lambda _: lam_in
 
+    stopping = _normalized_stopping(kwargs.pop('tol', None),
+                                    kwargs.pop('stopping', None))
+
     # Check for unused parameters
     if kwargs:
         raise TypeError('got unexpected keyword arguments: {}'.format(kwargs))
@@ -228,6 +240,18 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
         if callback is not None:
             callback(p1)
 
+        if stopping is not None and stopping.is_due(k):
+            # The changes are lam(k) * (z - p); w1 and w2 are not needed
+            # anymore in this iteration
+            w1.lincomb(1, z1, -1, p1)
+            for i in range(m):
+                w2[i].lincomb(1, z2[i], -1, p2[i])
+            dual_change = np.sqrt(sum(w2i.norm() ** 2 for w2i in w2))
+            dual_norm = np.sqrt(sum(vi.norm() ** 2 for vi in v))
+            if stopping([lam_k * w1.norm(), lam_k * dual_change],
+                        [x.norm(), dual_norm]):
+                break
+
     # The final result is actually in p1 according to the algorithm, so we need
     # to assign here.
     x.assign(p1)
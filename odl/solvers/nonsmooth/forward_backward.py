@@ -9,8 +9,10 @@
 """Optimization methods based on a forward-backward splitting scheme."""
 
 from __future__ import print_function, division, absolute_import
+import numpy as np
 
 from odl.operator import Operator
+from odl.solvers.util.stopping import _normalized_stopping
 
 
 __all__ = ('forward_backward_pd',)
@@ -68,6 +70,14 @@ def forward_backward_pd(x, f, g, L, h, tau, sigma, niter,
     l : sequence of `Functional`'s, optional
         The functionals ``l_i``. Needs to have ``g_i.convex_conj.gradient``.
         If omitted, the simpler problem without ``l_i``  will be considered.
+    tol : positive float, optional
+        Stop the iteration as soon as the changes of the primal variable
+        and the dual variables are smaller than ``tol`` relative to
+        their norms, see `RelativeChange`.
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping the iteration early, evaluated with the
+        changes of the primal variable and the dual variables. Cannot be
+        combined with ``tol``.
 
     Notes
     -----
@@ -161,6 +171,9 @@ def forward_backward_pd(x, f, g, L, h, tau, sigma, niter,
             raise ValueError('`grad_cc_l` not same length as `L`')
         grad_cc_l = [li.convex_conj.gradient for li in l]
 
+    stopping = _normalized_stopping(kwargs.pop('tol', None),
+                                    kwargs.pop('stopping', None))
+
     if kwargs:
         raise TypeError('unexpected keyword argument: {}'.format(kwargs))
 
@@ -168,9 +181,20 @@ def forward_backward_pd(x, f, g, L, h, tau, sigma, niter,
     v = [Li.range.zero() for Li in L]
     y = x.space.zero()
 
+    # Previous iterates, only stored when the stopping criterion is due
+    if stopping is not None:
+        x_prev = x.space.element()
+        v_prev = [Li.range.element() for Li in L]
+
     for k in range(niter):
         x_old = x
 
+        check_stopping = stopping is not None and stopping.is_due(k)
+        if check_stopping:
+            x_prev.assign(x)
+            for vi_prev, vi in zip(v_prev, v):
+                vi_prev.assign(vi)
+
         tmp_1 = grad_h(x) + sum(Li.adjoint(vi) for Li, vi in zip(L, v))
         prox_f(tau)(x - tau * tmp_1, out=x)
         y.lincomb(2.0, x, -1, x_old)
@@ -188,3 +212,12 @@ def forward_backward_pd(x, f, g, L, h, tau, sigma, niter,
 
         if callback is not None:
             callback(x)
+
+        if check_stopping:
+            x_prev.lincomb(1, x, -1, x_prev)
+            for vi_prev, vi in zip(v_prev, v):
+                vi_prev.lincomb(1, vi, -1, vi_prev)
+            dual_change = np.sqrt(sum(vi.norm() ** 2 for vi in v_prev))
+            dual_norm = np.sqrt(sum(vi.norm() ** 2 for vi in v))
+            if stopping([x_prev.norm(), dual_change], [x.norm(), dual_norm]):
+                break
@@ -16,9 +16,10 @@ from __future__ import print_function, division, absolute_import
 import numpy as np
 
 from odl.operator import Operator
+from odl.solvers.util.stopping import _normalized_stopping
 
 
-__all__ = ('pdhg', 'pdhg_stepsize')
+__all__ = ('pdhg', 'pdhg_linesearch', 'pdhg_stepsize')
 
 
 # TODO: add dual gap as convergence measure
@@ -95,6 +96,14 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
         Required to resume iteration. For ``None``, ``op.range.zero()``
         is used.
         Default: ``None``
+    tol : positive float, optional
+        Stop the iteration as soon as the changes of the primal and the
+        dual variable are smaller than ``tol`` relative to their norms,
+        see `RelativeChange`.
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping the iteration early, evaluated with the
+        changes of the primal and the dual variable. Cannot be combined
+        with ``tol``.
 
     Notes
     -----
@@ -149,6 +158,7 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
 
     See Also
     --------
+    pdhg_linesearch : Variant with adaptive step sizes
     odl.solvers.nonsmooth.douglas_rachford.douglas_rachford_pd :
         Solver for similar problems which can additionaly handle infimal
         convolutions and multiple forward operators.
@@ -247,6 +257,9 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
         raise TypeError('`y` {} is not in the range of `L` '
                         '{}'.format(y.space, L.range))
 
+    stopping = _normalized_stopping(kwargs.pop('tol', None),
+                                    kwargs.pop('stopping', None))
+
     # Get the proximals
     proximal_primal = f.proximal
     proximal_dual = g.convex_conj.proximal
@@ -263,9 +276,16 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
     dual_tmp = L.range.element()
     primal_tmp = L.domain.element()
 
-    for _ in range(niter):
+    # Previous dual iterate, only stored when the stopping criterion is due
+    if stopping is not None:
+        y_old = L.range.element()
+
+    for k in range(niter):
         # Copy required for relaxation
         x_old.assign(x)
+        check_stopping = stopping is not None and stopping.is_due(k)
+        if check_stopping:
+            y_old.assign(y)
 
         # Gradient ascent in the dual variable y
         # Compute dual_tmp = y + sigma * L(x_relax)
@@ -304,6 +324,227 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
         if callback is not None:
             callback(x)
 
+        if check_stopping:
+            # The temporaries are not needed anymore in this iteration
+            primal_tmp.lincomb(1, x, -1, x_old)
+            dual_tmp.lincomb(1, y, -1, y_old)
+            if stopping([primal_tmp.norm(), dual_tmp.norm()],
+                        [x.norm(), y.norm()]):
+                break
+
+
+def pdhg_linesearch(x, f, g, L, niter, tau=1.0, beta=1.0, **kwargs):
+    r"""PDHG with linesearch for adaptive step sizes.
+
+    This variant of `pdhg` for the problem ::
+
+        min_{x in X} f(x) + g(L x)
+
+    chooses the step sizes by a backtracking linesearch as proposed in
+    [MP2018]. It needs no estimate of the operator norm of ``L``, and
+    the steps adapt to the local behavior of the problem, which usually
+    gives much larger steps than the worst-case bound used by
+    `pdhg_stepsize`.
+
+    The values ``L x`` and ``L^* y`` of the current iterates are kept,
+    and ``L`` applied to the extrapolated primal variable is computed
+    from them by linearity. Hence each iteration needs one evaluation of
+    ``L`` and one of ``L.adjoint``, plus one more evaluation of
+    ``L.adjoint`` per rejected step size.
+
+    Parameters
+    ----------
+    x : ``L.domain`` element
+        Starting point of the iteration, updated in-place.
+    f : `Functional`
+        The function ``f`` in the problem definition. Needs to have
+        ``f.proximal``.
+    g : `Functional`
+        The function ``g`` in the problem definition. Needs to have
+        ``g.convex_conj.proximal``.
+    L : linear `Operator`
+        The linear operator that should be applied before ``g``. Its
+        range must match the domain of ``g`` and its domain must match
+        the domain of ``f``.
+    niter : non-negative int
+        Number of iterations.
+    tau : positive float, optional
+        Initial step size for ``f``. Too large values are reduced by the
+        linesearch in the first iteration.
+    beta : positive float, optional
+        Ratio ``sigma / tau`` of the step sizes, which is kept fixed.
+        It balances the progress in the primal and the dual variable.
+
+    Other Parameters
+    ----------------
+    callback : callable, optional
+        Function called with the current iterate after each iteration.
+    mu : float, optional
+        Factor by which the step size is reduced in the linesearch,
+        required to fulfill ``0 < mu < 1``.
+        Default: 0.7
+    delta : float, optional
+        Parameter of the linesearch condition, required to fulfill
+        ``0 < delta < 1``. Larger values accept larger steps.
+        Default: 0.99
+    y : ``L.range`` element, optional
+        Dual variable, updated in-place. For ``None``, ``L.range.zero()``
+        is used.
+    tol : positive float, optional
+        Stop the iteration as soon as the changes of the primal and the
+        dual variable are smaller than ``tol`` relative to their norms,
+        see `RelativeChange`.
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping the iteration early, evaluated with the
+        changes of the primal and the dual variable. Cannot be combined
+        with ``tol``.
+
+    Notes
+    -----
+    Starting from :math:`\tau_{-1} = \tau`, :math:`\theta_{-1} = 1`
+    and the dual variable :math:`y_0`, the method iterates
+
+    .. math::
+        x_k = \mathrm{prox}_{\tau_{k-1} f}(x_{k-1} - \tau_{k-1} L^* y_k),
+
+    and, starting with :math:`\tau_k = \tau_{k-1}\sqrt{1 + \theta_{k-1}}`,
+
+    .. math::
+        \theta_k &= \tau_k / \tau_{k-1}, \quad \sigma_k = \beta \tau_k,
+
+        \bar{x}_k &= x_k + \theta_k (x_k - x_{k-1}),
+
+        y_{k+1} &= \mathrm{prox}_{\sigma_k g^*}(y_k + \sigma_k L \bar{x}_k),
+
+    where :math:`\tau_k` is multiplied by :math:`\mu` until
+
+    .. math::
+        \sqrt{\beta} \tau_k \|L^* y_{k+1} - L^* y_k\| \leq
+        \delta \|y_{k+1} - y_k\|.
+
+    Convergence holds for convex, proper and lower semicontinuous
+    :math:`f` and :math:`g`, see [MP2018].
+
+    See Also
+    --------
+    pdhg : Variant with fixed step sizes
+
+    References
+    ----------
+    [MP2018] Malitsky, Y, and Pock, T. *A first-order primal-dual
+    algorithm with linesearch*. SIAM Journal on Optimization, 28 (2018),
+    pp 411-432.
+    """
+    if not isinstance(L, Operator):
+        raise TypeError('`L` {!r} is not an `Operator` instance'
+                        ''.format(L))
+    if x not in L.domain:
+        raise TypeError('`x` {!r} is not in the domain of `L` {!r}'
+                        ''.format(x, L.domain))
+    if f.domain != L.domain:
+        raise TypeError('`f.domain` {!r} must equal `L.domain` {!r}'
+                        ''.format(f.domain, L.domain))
+
+    if not isinstance(niter, int) or niter < 0:
+        raise ValueError('`niter` {} not understood'
+                         ''.format(niter))
+
+    tau, tau_in = float(tau), tau
+    if tau <= 0:
+        raise ValueError('`tau` must be positive, got {}'.format(tau_in))
+    beta, beta_in = float(beta), beta
+    if beta <= 0:
+        raise ValueError('`beta` must be positive, got {}'.format(beta_in))
+
+    mu = kwargs.pop('mu', 0.7)
+    mu, mu_in = float(mu), mu
+    if not 0 < mu < 1:
+        raise ValueError('`mu` {} not in (0, 1)'.format(mu_in))
+    delta = kwargs.pop('delta', 0.99)
+    delta, delta_in = float(delta), delta
+    if not 0 < delta < 1:
+        raise ValueError('`delta` {} not in (0, 1)'.format(delta_in))
+
+    callback = kwargs.pop('callback', None)
+    if callback is not None and not callable(callback):
+        raise TypeError('`callback` {} is not callable'
+                        ''.format(callback))
+
+    y = kwargs.pop('y', None)
+    if y is None:
+        y = L.range.zero()
+    elif y not in L.range:
+        raise TypeError('`y` {} is not in the range of `L` '
+                        '{}'.format(y.space, L.range))
+
+    stopping = _normalized_stopping(kwargs.pop('tol', None),
+                                    kwargs.pop('stopping', None))
+
+    if kwargs:
+        raise TypeError('got unexpected keyword arguments: {}'.format(kwargs))
+
+    proximal_primal = f.proximal
+    proximal_dual = g.convex_conj.proximal
+
+    # Previous primal iterate and candidate for the next dual iterate
+    x_old = L.domain.element()
+    y_new = L.range.element()
+
+    # Images of the current and previous iterates under L and L^*
+    Lx = L(x)
+    Lx_old = L.range.element()
+    Lty = L.adjoint(y)
+    Lty_new = L.domain.element()
+
+    # Temporaries
+    primal_tmp = L.domain.element()
+    dual_tmp = L.range.element()
+
+    theta = 1.0
+    sqrt_beta = np.sqrt(beta)
+
+    for k in range(niter):
+        # Primal step x = prox[tau * f](x - tau * L^*(y))
+        x_old.assign(x)
+        primal_tmp.lincomb(1, x, -tau, Lty)
+        proximal_primal(tau)(primal_tmp, out=x)
+        Lx, Lx_old = Lx_old, Lx
+        L(x, out=Lx)
+
+        # Linesearch for the new step size, starting with an increase
+        tau_old = tau
+        tau *= np.sqrt(1 + theta)
+        while True:
+            theta = tau / tau_old
+            sigma = beta * tau
+
+            # y_new = prox[sigma * g^*](y + sigma * L(x_bar)), where
+            # L(x_bar) = (1 + theta) * L(x) - theta * L(x_old)
+            dual_tmp.lincomb(1 + theta, Lx, -theta, Lx_old)
+            dual_tmp.lincomb(1, y, sigma, dual_tmp)
+            proximal_dual(sigma)(dual_tmp, out=y_new)
+
+            L.adjoint(y_new, out=Lty_new)
+            primal_tmp.lincomb(1, Lty_new, -1, Lty)
+            dual_tmp.lincomb(1, y_new, -1, y)
+            if (sqrt_beta * tau * primal_tmp.norm() <=
+                    delta * dual_tmp.norm()):
+                break
+            tau *= mu
+
+        y.assign(y_new)
+        Lty, Lty_new = Lty_new, Lty
+
+        if callback is not None:
+            callback(x)
+
+        if stopping is not None and stopping.is_due(k):
+            # dual_tmp holds the change of y
+            primal_tmp.lincomb(1, x, -1, x_old)
+            if stopping([primal_tmp.norm(), dual_tmp.norm()],
+                        [x.norm(), y.norm()]):
+                break
+
 
 def pdhg_stepsize(L, tau=None, sigma=None):
     r"""Default step sizes for `pdhg`.
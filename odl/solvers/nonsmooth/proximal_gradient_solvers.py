@@ -147,6 +147,32 @@ def accelerated_proximal_gradient(x, f, g, gamma, niter, callback=None,
     callback : callable, optional
         Function called with the current iterate after each iteration.
 
+    Other Parameters
+    ----------------
+    restart : {None, 'function', 'gradient'}, optional
+        Adaptive restart scheme of [OC2015]. The momentum is reset when
+        it points in a bad direction, which prevents the oscillations
+        of the plain method and gives fast convergence on (locally)
+        strongly convex problems.
+
+        - ``None``: No restart.
+        - ``'function'``: Restart if the objective ``f(x) + g(x)``
+          increases. This needs one evaluation of ``f`` and ``g`` per
+          iteration.
+        - ``'gradient'``: Restart if the gradient step and the last
+          change of ``x`` form an acute angle. This is computed from
+          temporaries and needs no additional evaluations.
+
+        Default: ``None``
+    backtrack : float, optional
+        If given, ``gamma`` is only the initial step size, and it is
+        multiplied by ``backtrack`` until the sufficient decrease
+        condition of `[Beck2009]`_ holds. This needs no knowledge of the
+        Lipschitz constant of ``g.gradient``, but costs one evaluation
+        of ``g`` per trial step and one more per iteration. Must satisfy
+        ``0 < backtrack < 1``.
+        Default: ``None``
+
     Notes
     -----
     The problem of interest is
@@ -164,9 +190,24 @@ def accelerated_proximal_gradient(x, f, g, gamma, niter, callback=None,
     .. math::
        0 < \\gamma < 2 \\beta.
 
+    With backtracking, the step length :math:`\\gamma_k` in iteration
+    :math:`k` is the largest value :math:`\\gamma_{k-1} \\eta^i`,
+    :math:`i = 0, 1, \\dots`, with :math:`\\eta` = ``backtrack``, such
+    that the new iterate
+    :math:`x_k = \\mathrm{prox}_{\\gamma_k f}(y_k - \\gamma_k \\nabla g(y_k))`
+    satisfies
+
+    .. math::
+        g(x_k) \\leq g(y_k) + \\langle \\nabla g(y_k), x_k - y_k \\rangle
+        + \\frac{1}{2 \\gamma_k} \\|x_k - y_k\\|^2.
+
     References
     ----------
     .. _[Beck2009]: http://epubs.siam.org/doi/abs/10.1137/080716542
+
+    [OC2015] O'Donoghue, B, and Candes, E. *Adaptive restart for
+    accelerated gradient schemes*. Foundations of Computational
+    Mathematics, 15 (2015), pp 715-732.
     """
     # Get and validate input
     if x not in f.domain:
@@ -183,13 +224,33 @@ def accelerated_proximal_gradient(x, f, g, gamma, niter, callback=None,
     if int(niter) != niter:
         raise ValueError('`niter` {} not understood'.format(niter))
 
+    restart = kwargs.pop('restart', None)
+    if restart not in (None, 'function', 'gradient'):
+        raise ValueError('`restart` {!r} not understood'.format(restart))
+
+    backtrack = kwargs.pop('backtrack', None)
+    if backtrack is not None:
+        backtrack, backtrack_in = float(backtrack), backtrack
+        if not 0 < backtrack < 1:
+            raise ValueError('`backtrack` {} not in (0, 1)'
+                             ''.format(backtrack_in))
+
     # Get the proximal
     f_prox = f.proximal(gamma)
     g_grad = g.gradient
 
-    # Create temporary
+    # Create temporaries. The previous value of x is stored in y unless
+    # y is still needed after the update of x.
     tmp = x.space.element()
     y = x.copy()
+    if backtrack is not None or restart == 'gradient':
+        x_old = x.space.element()
+    else:
+        x_old = y
+    if backtrack is not None:
+        grad_y = x.space.element()
+    if restart == 'function':
+        obj_old = f(x) + g(x)
     t = 1
 
     for k in range(niter):
@@ -197,17 +258,56 @@ def accelerated_proximal_gradient(x, f, g, gamma, niter, callback=None,
         t, t_old = (1 + np.sqrt(1 + 4 * t ** 2)) / 2, t
         alpha = (t_old - 1) / t
 
-        # x - gamma grad_g (y)
-        tmp.lincomb(1, y, -gamma, g_grad(y))
-
-        # Store old x value in y
-        y.assign(x)
-
-        # Update x
-        f_prox(tmp, out=x)
-
-        # Update y
-        y.lincomb(1 + alpha, x, -alpha, y)
+        if backtrack is None:
+            # x - gamma grad_g (y)
+            g_grad(y, out=tmp)
+            tmp.lincomb(1, y, -gamma, tmp)
+
+            # Store old x value and update x
+            x_old.assign(x)
+            f_prox(tmp, out=x)
+
+            if restart == 'gradient':
+                tmp.lincomb(1, y, -1, x)
+        else:
+            g_grad(y, out=grad_y)
+            g_y = g(y)
+            x_old.assign(x)
+
+            # Reduce gamma until the quadratic model at y majorizes g at x
+            while True:
+                tmp.lincomb(1, y, -gamma, grad_y)
+                f.proximal(gamma)(tmp, out=x)
+
+                tmp.lincomb(1, y, -1, x)
+                g_x = g(x)
+                g_model = (g_y - grad_y.inner(tmp) +
+                           tmp.norm() ** 2 / (2 * gamma))
+                # Allow for rounding errors when x is close to y
+                if g_x <= g_model + 1e-12 * abs(g_y):
+                    break
+                gamma *= backtrack
+
+        # Here, tmp contains y - x if it is needed for the restart test
+        if restart == 'function':
+            obj = f(x) + (g(x) if backtrack is None else g_x)
+            do_restart = obj > obj_old
+            obj_old = obj
+        elif restart == 'gradient':
+            # y is not needed anymore, use it for x - x_old
+            y.lincomb(1, x, -1, x_old)
+            do_restart = tmp.inner(y) > 0
+        else:
+            do_restart = False
+
+        # Update y, resetting the momentum on restart
+        if do_restart:
+            t = 1
+            y.assign(x)
+        elif restart == 'gradient':
+            y.lincomb(1, x, alpha, y)
+        else:
+            y.lincomb(1 + alpha, x, -alpha, x_old)
 
         if callback is not None:
             callback(x)
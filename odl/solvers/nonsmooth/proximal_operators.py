@@ -29,6 +29,7 @@ from odl.operator import (Operator, IdentityOperator, ScalingOperator,
                           MultiplyOperator)
 from odl.space import ProductSpace
 from odl.set.space import LinearSpaceElement
+from odl.util.numerics import _apply_blockwise
 
 
 __all__ = ('combine_proximals', 'proximal_convex_conj', 'proximal_translation',
@@ -42,7 +43,7 @@ __all__ = ('combine_proximals', 'proximal_convex_conj', 'proximal_translation',
            'proximal_l2_squared', 'proximal_convex_conj_l2_squared',
            'proximal_l1_l2', 'proximal_convex_conj_l1_l2',
            'proximal_convex_conj_kl', 'proximal_convex_conj_kl_cross_entropy',
-           'proximal_huber')
+           'proximal_huber', 'proximal_total_variation')
 
 
 def combine_proximals(*factory_list):
@@ -1929,6 +1930,258 @@ def proximal_huber(space, gamma):
     return ProximalHuber
 
 
+def proximal_total_variation(space, lam=1, g=None, isotropic=True, grad=None,
+                             niter=200, tol=1e-6, dual=None):
+    r"""Proximal operator factory of the total variation functional.
+
+    Implements the proximal operator of the functional ::
+
+        F(x) = lam || |grad(x - g)| ||_1
+
+    with ``x`` and ``g`` elements in ``space``, a gradient operator
+    ``grad`` and scaling factor ``lam``. Here, ``|.|`` is the pointwise
+    Euclidean norm for ``isotropic=True`` and the pointwise 1-norm
+    otherwise.
+
+    The proximal operator has no closed form, it is evaluated with the
+    fast gradient projection (FGP) method on the dual problem, see
+    [BT2009]. The result is hence inexact, with an accuracy controlled by
+    ``niter`` and ``tol``.
+
+    Parameters
+    ----------
+    space : `DiscreteLp`
+        Domain of the functional F.
+    lam : positive float, optional
+        Scaling factor or regularization parameter.
+    g : ``space`` element, optional
+        Element to which the TV distance is taken.
+        Default: ``space.zero``.
+    isotropic : bool, optional
+        If ``True``, use the isotropic variant with pointwise Euclidean
+        norm, otherwise the anisotropic one.
+    grad : `Operator`, optional
+        Linear operator with adjoint that maps ``space`` to a power space,
+        used in place of the gradient.
+        Default: forward differences with symmetric padding.
+    niter : positive int, optional
+        Maximum number of dual iterations per evaluation.
+    tol : positive float, optional
+        Stop as soon as the relative change of the dual variable is
+        smaller than ``tol``. For ``None``, ``niter`` iterations are
+        always run.
+    dual : ``grad.range`` element, optional
+        Dual variable used as starting point, which is updated in-place
+        with the final iterate. Passing the same element to repeated
+        evaluations warm-starts the iteration. Default: ``grad.range.zero()``
+        for each evaluation.
+
+    Returns
+    -------
+    prox_factory : function
+        Factory for the proximal operator to be initialized.
+
+    Notes
+    -----
+    For a step size :math:`\sigma`, the proximal point
+    :math:`\mathrm{prox}_{\sigma F}(y)` is given by
+    :math:`x = y - s \nabla^* p` with :math:`s = \sigma \lambda`, where
+    :math:`p` solves the dual problem
+
+    .. math::
+        \min_{|p| \leq 1} \|y - g - s \nabla^* p\|_2^2,
+
+    with the pointwise constraint on :math:`p`. FGP performs projected
+    gradient steps with step size :math:`1 / (s \|\nabla\|^2)` and
+    Nesterov momentum. Adding the scaled gradient, projecting and the
+    momentum step are done in one block-wise pass over the dual variable,
+    and all intermediate elements are allocated once per factory, i.e.,
+    they are shared by the operators for different ``sigma``.
+
+    FGP converges with rate :math:`O(1/k^2)` in the objective of the dual
+    problem, which can be slow for the primal point: starting from
+    :math:`p = 0`, a few hundred iterations are typically needed for a
+    relative error of 1%. In iterative schemes, warm-starting from the
+    previous dual variable (parameter ``dual``) reduces the number of
+    iterations considerably.
+
+    References
+    ----------
+    [BT2009] Beck, A, and Teboulle, M. *Fast gradient-based algorithms for
+    constrained total variation image denoising and deblurring problems*.
+    IEEE Transactions on Image Processing, 18.11 (2009), pp 2419-2434.
+    """
+    if grad is None:
+        from odl.discr.diff_ops import Gradient
+        grad = Gradient(space, method='forward', pad_mode='symmetric')
+        # Bound for forward differences, ||grad||^2 <= 4 * sum(1 / dx^2)
+        grad_norm_sq = 4 * float(np.sum(1 / space.cell_sides ** 2))
+    else:
+        if grad.domain != space:
+            raise ValueError('`grad.domain` {!r} not equal to `space` {!r}'
+                             ''.format(grad.domain, space))
+        grad_norm_sq = grad.norm(estimate=True) ** 2
+
+    if not isinstance(grad.range, ProductSpace):
+        raise TypeError('`grad.range` must be a `ProductSpace`, got {!r}'
+                        ''.format(grad.range))
+    if not space.is_real:
+        raise ValueError('`space` must be real, got {!r}'.format(space))
+
+    lam = float(lam)
+    niter, niter_in = int(niter), niter
+    if niter != niter_in or niter < 1:
+        raise ValueError('`niter` must be a positive integer, got {}'
+                         ''.format(niter_in))
+    tol = None if tol is None else float(tol)
+
+    if g is not None and g not in space:
+        raise TypeError('{!r} is not an element of {!r}'.format(g, space))
+    if dual is not None and dual not in grad.range:
+        raise TypeError('{!r} is not an element of {!r}'
+                        ''.format(dual, grad.range))
+
+    # Intermediate elements, shared by all operators created by the factory
+    buffers = []
+
+    class ProximalTotalVariation(Operator):
+
+        """Proximal operator of the total variation functional."""
+
+        def __init__(self, sigma):
+            """Initialize a new instance.
+
+            Parameters
+            ----------
+            sigma : positive float
+                Step size parameter
+            """
+            super(ProximalTotalVariation, self).__init__(
+                domain=space, range=space, linear=False)
+            self.sigma = float(sigma)
+
+        def _call(self, x, out):
+            """Return ``self(x, out=out)``."""
+            step = self.sigma * lam
+            if step == 0:
+                out.assign(x)
+                return out
+
+            if not buffers:
+                buffers.extend([space.element(), grad.range.element(),
+                                grad.range.element(), grad.range.element()])
+            y_buf, p, p_new, q = buffers
+
+            # y = x - g, the proximal of the translated functional. A copy
+            # is needed if `out` is `x`, since `out` is overwritten in each
+            # iteration.
+            if g is not None:
+                y = y_buf
+                y.lincomb(1, x, -1, g)
+            elif out is x:
+                y = y_buf
+                y.assign(x)
+            else:
+                y = x
+
+            if dual is None:
+                p.set_zero()
+            else:
+                p.assign(dual)
+            q.assign(p)
+
+            factor = 1 / (step * grad_norm_sq)
+            t = 1.0
+            for _ in range(niter):
+                # out = y - step * grad^*(q)
+                grad.adjoint(q, out=out)
+                out.lincomb(1, y, -step, out)
+
+                # p_new = proj(q + factor * grad(out)), momentum step on q
+                grad(out, out=p_new)
+                t_new = (1 + np.sqrt(1 + 4 * t ** 2)) / 2
+                change = _tv_dual_update(p_new, q, p, factor,
+                                         (t - 1) / t_new, isotropic)
+                p, p_new = p_new, p
+                t = t_new
+
+                if tol is not None and change <= tol:
+                    break
+
+            grad.adjoint(p, out=out)
+            out.lincomb(1, y, -step, out)
+            if g is not None:
+                out += g
+
+            if dual is not None:
+                dual.assign(p)
+
+            return out
+
+    return ProximalTotalVariation
+
+
+def _tv_dual_update(p_new, q, p, factor, momentum, isotropic):
+    """Fused projected gradient and momentum step of FGP.
+
+    With ``p_new`` containing the gradient of the current primal iterate,
+    compute in-place ::
+
+        p_new = proj(q + factor * p_new)
+        q = p_new + momentum * (p_new - p)
+
+    where ``proj`` is the pointwise projection onto the unit ball of the
+    Euclidean norm for ``isotropic=True``, or onto ``[-1, 1]`` otherwise.
+    All components are processed block by block in a single pass.
+
+    Returns
+    -------
+    change : float
+        Relative change ``||p_new - p|| / ||p_new||`` of the dual variable.
+    """
+    ncomp = len(p_new)
+    # Squared norms of `p_new - p` and `p_new`, summed over the blocks
+    sq_norms = [0.0, 0.0]
+
+    def kernel(p_blks, out_blks, tmps):
+        new_blks, q_blks = out_blks[:ncomp], out_blks[ncomp:]
+        norm_blk, tmp_blk = tmps
+
+        for new_blk, q_blk in zip(new_blks, q_blks):
+            new_blk *= factor
+            new_blk += q_blk
+
+        if isotropic:
+            # Divide by max(|p|_2, 1) pointwise
+            norm_blk.fill(0)
+            for new_blk in new_blks:
+                np.multiply(new_blk, new_blk, out=tmp_blk)
+                norm_blk += tmp_blk
+            np.sqrt(norm_blk, out=norm_blk)
+            np.maximum(norm_blk, 1, out=norm_blk)
+            for new_blk in new_blks:
+                new_blk /= norm_blk
+        else:
+            for new_blk in new_blks:
+                np.clip(new_blk, -1, 1, out=new_blk)
+
+        for new_blk, q_blk, p_blk in zip(new_blks, q_blks, p_blks):
+            # q = p_new + momentum * (p_new - p)
+            np.subtract(new_blk, p_blk, out=tmp_blk)
+            sq_norms[0] += np.dot(tmp_blk, tmp_blk)
+            sq_norms[1] += np.dot(new_blk, new_blk)
+            np.multiply(tmp_blk, momentum, out=q_blk)
+            q_blk += new_blk
+
+    _apply_blockwise(kernel, list(p), list(p_new) + list(q), num_tmp=2)
+
+    diff_sq, new_sq = sq_norms
+    if new_sq == 0:
+        return 0.0 if diff_sq == 0 else float('inf')
+    else:
+        return float(np.sqrt(diff_sq / new_sq))
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()
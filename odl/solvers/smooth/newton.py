@@ -15,60 +15,242 @@ from odl.solvers.util import ConstantLineSearch
 from odl.solvers.iterative.iterative import conjugate_gradient
 
 
-__all__ = ('newtons_method', 'bfgs_method', 'broydens_method')
+__all__ = ('newtons_method', 'newton_cg_method', 'bfgs_method',
+           'lbfgs_method', 'broydens_method')
 
 
-def _bfgs_direction(s, y, x, hessinv_estimate=None):
-    """Compute ``Hn^-1(x)`` for the L-BFGS method.
+class _LBFGSMemory(object):
+
+    """Storage of the correction pairs of the (L-)BFGS method.
+
+    The pairs ``(s_i, y_i)`` are kept in a ring buffer. Their elements
+    are allocated once and reused when the buffer is full, and the
+    inner products ``rho_i = 1 / <y_i, s_i>`` are computed only once when
+    a pair is stored. A new pair is computed in separate elements and
+    only swapped into the buffer by `commit`, such that rejecting it
+    leaves the stored pairs intact.
+    """
+
+    def __init__(self, space, num_store=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        space : `LinearSpace`
+            Space of the correction pairs.
+        num_store : positive int, optional
+            Maximum number of pairs. For ``None``, all pairs are kept.
+        """
+        self.space = space
+        self.num_store = num_store
+        self.s = []
+        self.y = []
+        self.rho = []
+        self.alpha = []
+        self.start = 0
+        self.size = 0
+        self.gamma = 1.0
+        self.tmp = None
+        self.s_new = None
+        self.y_new = None
+
+    def _next_index(self):
+        """Index of the slot that is written next."""
+        if self.size < len(self.s):
+            return (self.start + self.size) % len(self.s)
+        elif self.num_store is None or len(self.s) < self.num_store:
+            return len(self.s)
+        else:
+            return self.start
+
+    def slot(self):
+        """Return the elements ``(s, y)`` to be filled with the next pair.
+
+        The pair is only used after calling `commit`.
+        """
+        if self.s_new is None:
+            self.s_new = self.space.element()
+            self.y_new = self.space.element()
+        return self.s_new, self.y_new
+
+    def commit(self, y_inner_s):
+        """Store the pair from `slot`, given ``<y, s>``.
+
+        When the buffer is full, the oldest pair is replaced.
+        """
+        i = self._next_index()
+        if i == len(self.s):
+            self.s.append(self.s_new)
+            self.y.append(self.y_new)
+            self.rho.append(0.0)
+            self.alpha.append(0.0)
+            self.s_new = self.y_new = None
+        else:
+            # Swap elements, the old ones are reused for the next pair
+            self.s[i], self.s_new = self.s_new, self.s[i]
+            self.y[i], self.y_new = self.y_new, self.y[i]
+
+        self.rho[i] = 1.0 / y_inner_s
+        # Scaling of the initial inverse Hessian, see [NW2006], (7.20)
+        self.gamma = y_inner_s / self.y[i].inner(self.y[i])
+        if self.num_store is None or self.size < self.num_store:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % self.num_store
+
+    def reset(self):
+        """Forget all pairs, keeping the allocated elements."""
+        self.start = 0
+        self.size = 0
+        self.gamma = 1.0
+
+    def apply_hessinv(self, x, out, hessinv_estimate=None, scale=False):
+        """Compute ``out = Hn^-1(x)`` with the two-loop recursion.
+
+        Parameters
+        ----------
+        x : ``space`` element
+            Point in which to evaluate the product.
+        out : ``space`` element
+            Element to which the result is written. Must not be ``x``.
+        hessinv_estimate : `Operator`, optional
+            Initial estimate of the hessian ``H0^-1``.
+        scale : bool, optional
+            If ``True`` and no ``hessinv_estimate`` is given, use a
+            multiple of the identity estimated from the newest pair.
+
+        Notes
+        -----
+        :math:`H_n^{-1}` is defined recursively as
+
+        .. math::
+            H_{n+1}^{-1} =
+            \\left(I - \\frac{ s_n y_n^T}{y_n^T s_n} \\right)
+            H_{n}^{-1}
+            \\left(I - \\frac{ y_n s_n^T}{y_n^T s_n} \\right) +
+            \\frac{s_n s_n^T}{y_n^T \, s_n}
+
+        With :math:`H_0^{-1}` given by ``hessinv_estimate``.
+        """
+        indices = [(self.start + j) % len(self.s) for j in range(self.size)]
+        s, y, rho, alpha = self.s, self.y, self.rho, self.alpha
+
+        out.assign(x)
+        for i in reversed(indices):
+            alpha[i] = rho[i] * s[i].inner(out)
+            out.lincomb(1, out, -alpha[i], y[i])
+
+        if hessinv_estimate is not None:
+            if self.tmp is None:
+                self.tmp = self.space.element()
+            self.tmp.assign(out)
+            hessinv_estimate(self.tmp, out=out)
+        elif scale and self.size > 0:
+            out *= self.gamma
+
+        for i in indices:
+            beta = rho[i] * y[i].inner(out)
+            out.lincomb(1, out, alpha[i] - beta, s[i])
+
+
+def _strong_wolfe_line_search(f, grad, x, direction, f_x, dir_deriv, x_new,
+                              grad_new, step=1.0, c1=1e-4, c2=0.9,
+                              maxiter=20):
+    """Find a step length satisfying the strong Wolfe conditions.
+
+    This is Algorithm 3.5 in [NW2006] with quadratic interpolation in the
+    zoom phase. The gradient is only evaluated at trial points that
+    satisfy the sufficient decrease condition.
 
     Parameters
     ----------
-    s : sequence of `LinearSpaceElement`
-        The ``s`` coefficients in the BFGS update, see Notes.
-    y : sequence of `LinearSpaceElement`
-        The ``y`` coefficients in the BFGS update, see Notes.
-    x : `LinearSpaceElement`
-        Point in which to evaluate the product.
-    hessinv_estimate : `Operator`, optional
-        Initial estimate of the hessian ``H0^-1``.
+    f : `Functional`
+        Function to minimize.
+    grad : `Operator`
+        Gradient of ``f``.
+    x : ``f.domain`` element
+        Current point.
+    direction : ``f.domain`` element
+        Descent direction.
+    f_x : float
+        Value ``f(x)``.
+    dir_deriv : float
+        Directional derivative ``<grad(x), direction>``, must be negative.
+    x_new, grad_new : ``f.domain`` element
+        Elements to which the accepted point ``x + step * direction`` and
+        its gradient are written.
+    step : positive float, optional
+        Initial trial step length.
+    c1, c2 : float, optional
+        Parameters of the sufficient decrease and the curvature
+        condition, ``0 < c1 < c2 < 1``.
+    maxiter : int, optional
+        Maximum number of trial steps in each phase.
 
     Returns
     -------
-    r : ``x.space`` element
-        The result of ``Hn^-1(x)``.
-
-    Notes
-    -----
-    :math:`H_n^{-1}` is defined recursively as
-
-    .. math::
-        H_{n+1}^{-1} =
-        \\left(I - \\frac{ s_n y_n^T}{y_n^T s_n} \\right)
-        H_{n}^{-1}
-        \\left(I - \\frac{ y_n s_n^T}{y_n^T s_n} \\right) +
-        \\frac{s_n s_n^T}{y_n^T \, s_n}
-
-    With :math:`H_0^{-1}` given by ``hess_estimate``.
+    step : float
+        Accepted step length, 0 if no step with sufficient decrease was
+        found.
+    f_new : float
+        Value ``f(x_new)``.
     """
-    assert len(s) == len(y)
-
-    r = x.copy()
-    alphas = np.zeros(len(s))
-    rhos = np.zeros(len(s))
+    def value(a):
+        x_new.lincomb(1, x, a, direction)
+        return f(x_new)
+
+    def derivative():
+        grad(x_new, out=grad_new)
+        return grad_new.inner(direction)
+
+    def zoom(lo, f_lo, g_lo, hi, f_hi):
+        for _ in range(maxiter):
+            # Minimizer of the quadratic interpolant, safeguarded to the
+            # inner part of the interval
+            delta = hi - lo
+            denom = 2 * (f_hi - f_lo - g_lo * delta)
+            if denom > 0:
+                a = lo - g_lo * delta ** 2 / denom
+            else:
+                a = lo + delta / 2
+            a = min(max(a, min(lo, hi) + 0.1 * abs(delta)),
+                    max(lo, hi) - 0.1 * abs(delta))
 
-    for i in reversed(range(len(s))):
-        rhos[i] = 1.0 / y[i].inner(s[i])
-        alphas[i] = rhos[i] * (s[i].inner(r))
-        r.lincomb(1, r, -alphas[i], y[i])
+            f_a = value(a)
+            if f_a > f_x + c1 * a * dir_deriv or f_a >= f_lo:
+                hi, f_hi = a, f_a
+            else:
+                g_a = derivative()
+                if abs(g_a) <= -c2 * dir_deriv:
+                    return a, f_a
+                if g_a * delta >= 0:
+                    hi, f_hi = lo, f_lo
+                lo, f_lo, g_lo = a, f_a, g_a
+
+        # No point satisfying both conditions found, use the best one
+        if lo > 0:
+            f_lo = value(lo)
+            derivative()
+        return lo, f_lo
+
+    a_prev, f_prev, g_prev = 0.0, f_x, dir_deriv
+    a = float(step)
+    for i in range(maxiter):
+        f_a = value(a)
+        if f_a > f_x + c1 * a * dir_deriv or (i > 0 and f_a >= f_prev):
+            return zoom(a_prev, f_prev, g_prev, a, f_a)
 
-    if hessinv_estimate is not None:
-        r = hessinv_estimate(r)
+        g_a = derivative()
+        if abs(g_a) <= -c2 * dir_deriv:
+            return a, f_a
+        if g_a >= 0:
+            return zoom(a, f_a, g_a, a_prev, f_prev)
 
-    for i in range(len(s)):
-        beta = rhos[i] * (y[i].inner(r))
-        r.lincomb(1, r, alphas[i] - beta, s[i])
+        a_prev, f_prev, g_prev = a, f_a, g_a
+        a *= 2
 
-    return r
+    # The step is increased in each trial, so the last point is fine
+    return a_prev, f_prev
 
 
 def _broydens_direction(s, y, x, hessinv_estimate=None, impl='first'):
@@ -124,6 +306,79 @@ def _broydens_direction(s, y, x, hessinv_estimate=None, impl='first'):
     return r
 
 
+def _truncated_cg(hessian, grad_x, eta, maxiter, step, resid, cg_dir,
+                  hess_dir, hess_step=None, radius=None):
+    """Approximately solve ``hessian(step) = -grad_x`` in-place.
+
+    The conjugate gradient iteration starts from ``step = 0`` and stops
+    when the relative residual is below ``eta``, at negative curvature,
+    or, if ``radius`` is given, when the step reaches the trust region
+    boundary. At negative curvature in the first iteration, the steepest
+    descent direction is returned.
+
+    If ``hess_step`` is given, ``hessian(step)`` is written to it.
+    ``resid``, ``cg_dir`` and ``hess_dir`` are used as temporaries.
+    """
+    step.set_zero()
+    if hess_step is not None:
+        hess_step.set_zero()
+    resid.assign(grad_x)                    # resid = H step + grad
+    cg_dir.lincomb(-1, resid)
+    resid_sq = resid.norm() ** 2
+    tol_sq = eta ** 2 * resid_sq
+
+    for i in range(maxiter):
+        hessian(cg_dir, out=hess_dir)
+        curvature = cg_dir.inner(hess_dir)
+
+        if curvature <= 0:
+            # Negative curvature: go to the boundary of the trust region,
+            # or use the last step
+            if radius is not None:
+                tau = _to_boundary(step, cg_dir, radius)
+            elif i == 0:
+                tau = 1.0
+            else:
+                return
+            step.lincomb(1, step, tau, cg_dir)
+            if hess_step is not None:
+                hess_step.lincomb(1, hess_step, tau, hess_dir)
+            return
+
+        alpha = resid_sq / curvature
+        if radius is not None:
+            # ||step + alpha * cg_dir|| >= radius: stop at the boundary
+            step_sq = step.norm() ** 2
+            new_sq = (step_sq + 2 * alpha * step.inner(cg_dir) +
+                      alpha ** 2 * cg_dir.norm() ** 2)
+            if new_sq >= radius ** 2:
+                alpha = _to_boundary(step, cg_dir, radius)
+                step.lincomb(1, step, alpha, cg_dir)
+                hess_step.lincomb(1, hess_step, alpha, hess_dir)
+                return
+
+        step.lincomb(1, step, alpha, cg_dir)
+        if hess_step is not None:
+            hess_step.lincomb(1, hess_step, alpha, hess_dir)
+        resid.lincomb(1, resid, alpha, hess_dir)
+
+        resid_sq_new = resid.norm() ** 2
+        if resid_sq_new <= tol_sq:
+            return
+
+        beta = resid_sq_new / resid_sq
+        resid_sq = resid_sq_new
+        cg_dir.lincomb(-1, resid, beta, cg_dir)
+
+
+def _to_boundary(step, direction, radius):
+    """Return ``tau >= 0`` with ``||step + tau * direction|| = radius``."""
+    a = direction.norm() ** 2
+    b = 2 * step.inner(direction)
+    c = step.norm() ** 2 - radius ** 2
+    return (-b + np.sqrt(max(b ** 2 - 4 * a * c, 0))) / (2 * a)
+
+
 def newtons_method(f, x, line_search=1.0, maxiter=1000, tol=1e-16,
                    cg_iter=None, callback=None):
     """Newton's method for minimizing a functional.
@@ -187,6 +442,10 @@ def newtons_method(f, x, line_search=1.0, maxiter=1000, tol=1e-16,
     callback : callable, optional
         Object executing code per iteration, e.g. plotting each iterate
 
+    See Also
+    --------
+    newton_cg_method : Inexact Newton method for large problems
+
     References
     ----------
     [BV2004] Boyd, S, and Vandenberghe, L. *Convex optimization*.
@@ -209,35 +468,205 @@ def newtons_method(f, x, line_search=1.0, maxiter=1000, tol=1e-16,
         # iterations to solve with cg
         cg_iter = grad.domain.size
 
-    # TODO: optimize by using lincomb and avoiding to create copies
+    search_direction = x.space.element()
+    neg_deriv = x.space.element()
     for _ in range(maxiter):
 
         # Initialize the search direction to 0
-        search_direction = x.space.zero()
+        search_direction.set_zero()
 
         # Compute hessian (as operator) and gradient in the current point
         hessian = grad.derivative(x)
-        deriv_in_point = grad(x)
+        grad(x, out=neg_deriv)
+        neg_deriv *= -1
 
         # Solving A*x = b for x, in this case f''(x)*p = -f'(x)
         # TODO: Let the user provide/choose method for how to solve this?
         try:
             hessian_inverse = hessian.inverse
         except NotImplementedError:
-            conjugate_gradient(hessian, search_direction,
-                               -deriv_in_point, cg_iter)
+            conjugate_gradient(hessian, search_direction, neg_deriv, cg_iter)
         else:
-            hessian_inverse(-deriv_in_point, out=search_direction)
+            hessian_inverse(neg_deriv, out=search_direction)
 
         # Computing step length
-        dir_deriv = search_direction.inner(deriv_in_point)
+        dir_deriv = -search_direction.inner(neg_deriv)
         if np.abs(dir_deriv) <= tol:
             return
 
         step_length = line_search(x, search_direction, dir_deriv)
 
         # Updating
-        x += step_length * search_direction
+        x.lincomb(1, x, step_length, search_direction)
+
+        if callback is not None:
+            callback(x)
+
+
+def newton_cg_method(f, x, maxiter=100, tol=1e-15, cg_maxiter=50,
+                     trust_region=False, callback=None, **kwargs):
+    """Inexact (truncated) Newton method with conjugate gradient steps.
+
+    The Newton equation ``H(x) p = -grad(x)`` for the search direction is
+    solved only approximately by conjugate gradient iterations, using
+    Hessian-vector products ``f.gradient.derivative(x)(d)``. The Hessian
+    is never inverted or stored, and the accuracy of the inner solve is
+    adapted to the progress of the outer iteration by the Eisenstat-Walker
+    forcing sequence. Hence far-from-optimal iterates cost only a few
+    Hessian-vector products, while the fast local convergence of Newton's
+    method is retained, see [NW2006], Chapter 7.1.
+
+    The inner iteration stops at directions of negative curvature, so the
+    method can also be applied to nonconvex functionals. All work vectors
+    are allocated once.
+
+    Parameters
+    ----------
+    f : `Functional`
+        Goal functional. Needs to have ``f.gradient`` and
+        ``f.gradient.derivative``.
+    x : ``f.domain`` element
+        Starting point of the iteration, updated in-place.
+    maxiter : int, optional
+        Maximum number of (outer) iterations.
+    tol : float, optional
+        The iteration stops when the norm of the gradient is smaller
+        than ``tol``.
+    cg_maxiter : positive int, optional
+        Maximum number of conjugate gradient iterations per step.
+    trust_region : bool, optional
+        If ``True``, the step is restricted to a trust region whose
+        radius is adapted to the agreement of the function with its
+        quadratic model (Steihaug-CG, [NW2006], Algorithm 7.2).
+        Otherwise, the step length is chosen by a line search satisfying
+        the strong Wolfe conditions.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    Other Parameters
+    ----------------
+    radius : positive float, optional
+        Initial radius of the trust region.
+        Default: 1.0
+    eta_max : float, optional
+        Upper bound for the relative residual ``eta`` of the inner
+        iteration, ``0 < eta_max < 1``.
+        Default: 0.9
+
+    Notes
+    -----
+    In iteration :math:`k`, the conjugate gradient method stops as soon
+    as :math:`\\|H(x_k) p + \\nabla f(x_k)\\| \\leq \\eta_k
+    \\|\\nabla f(x_k)\\|`, where the forcing term is chosen by
+    [EW1996], Choice 2:
+
+    .. math::
+        \\eta_k = \\min\\left(\\eta_{max}, 0.9 \\left(
+        \\frac{\\|\\nabla f(x_k)\\|}{\\|\\nabla f(x_{k-1})\\|}
+        \\right)^2 \\right),
+
+    safeguarded from below by :math:`0.9 \\eta_{k-1}^2` if this value
+    exceeds 0.1.
+
+    See Also
+    --------
+    newtons_method : Newton's method with exact solution of the Newton
+        equation
+    lbfgs_method : Quasi-Newton method without Hessian-vector products
+
+    References
+    ----------
+    [NW2006] Nocedal, J, and Wright, S. *Numerical optimization*.
+    Springer, 2006.
+
+    [EW1996] Eisenstat, S C, and Walker, H F. *Choosing the forcing terms
+    in an inexact Newton method*. SIAM Journal on Scientific Computing,
+    17 (1996), pp 16-32.
+    """
+    grad = f.gradient
+    if x not in grad.domain:
+        raise TypeError('`x` {!r} is not in the domain of `f` {!r}'
+                        ''.format(x, grad.domain))
+
+    cg_maxiter, cg_maxiter_in = int(cg_maxiter), cg_maxiter
+    if cg_maxiter < 1 or cg_maxiter != cg_maxiter_in:
+        raise ValueError('`cg_maxiter` must be a positive integer, got {}'
+                         ''.format(cg_maxiter_in))
+
+    radius = float(kwargs.pop('radius', 1.0))
+    if radius <= 0:
+        raise ValueError('`radius` must be positive, got {}'.format(radius))
+    eta_max = float(kwargs.pop('eta_max', 0.9))
+    if not 0 < eta_max < 1:
+        raise ValueError('`eta_max` {} not in (0, 1)'.format(eta_max))
+    if kwargs:
+        raise TypeError('got unexpected keyword arguments: {}'.format(kwargs))
+
+    # Work vectors of the conjugate gradient method and the outer iteration
+    space = x.space
+    step = space.element()
+    resid = space.element()
+    cg_dir = space.element()
+    hess_dir = space.element()
+    hess_step = space.element() if trust_region else None
+    x_new = space.element()
+    grad_new = space.element()
+
+    f_x = f(x)
+    grad_x = grad(x)
+    grad_norm_old = None
+    eta = 0.5
+
+    for _ in range(maxiter):
+        grad_norm = grad_x.norm()
+        if grad_norm <= tol:
+            return
+
+        # Eisenstat-Walker forcing term, choice 2
+        if grad_norm_old is not None:
+            eta_safe = 0.9 * eta ** 2
+            eta = 0.9 * (grad_norm / grad_norm_old) ** 2
+            if eta_safe > 0.1:
+                eta = max(eta, eta_safe)
+            eta = min(eta, eta_max)
+
+        hessian = grad.derivative(x)
+        _truncated_cg(hessian, grad_x, eta, cg_maxiter, step, resid, cg_dir,
+                      hess_dir, hess_step,
+                      radius=radius if trust_region else None)
+
+        if trust_region:
+            # Compare the actual decrease with the decrease of the model
+            # m(p) = f(x) + <grad(x), p> + <p, H(x) p> / 2
+            pred = -(step.inner(grad_x) + step.inner(hess_step) / 2)
+            x_new.lincomb(1, x, 1, step)
+            f_new = f(x_new)
+            ratio = (f_x - f_new) / pred if pred > 0 else -1.0
+
+            step_norm = step.norm()
+            if ratio < 0.25:
+                radius *= 0.25
+            elif ratio > 0.75 and step_norm >= 0.99 * radius:
+                radius *= 2
+
+            if ratio <= 0.1:
+                # Reject the step
+                if radius <= np.finfo(float).eps * max(1.0, x.norm()):
+                    return  # no further decrease possible
+                continue
+
+            x.assign(x_new)
+            grad(x, out=grad_new)
+        else:
+            step_length, f_new = _strong_wolfe_line_search(
+                f, grad, x, step, f_x, step.inner(grad_x), x_new, grad_new)
+            if step_length == 0:
+                return  # no further decrease possible
+            x.assign(x_new)
+
+        grad_x, grad_new = grad_new, grad_x
+        f_x = f_new
+        grad_norm_old = grad_norm
 
         if callback is not None:
             callback(x)
@@ -299,6 +728,10 @@ Goldfarb%E2%80%93Shanno_algorithm>`_
     callback : callable, optional
         Object executing code per iteration, e.g. plotting each iterate.
 
+    See Also
+    --------
+    lbfgs_method : Limited memory BFGS method with strong Wolfe line search
+
     References
     ----------
     [GNS2009] Griva, I, Nash, S G, and Sofer, A. *Linear and nonlinear
@@ -312,26 +745,33 @@ Goldfarb%E2%80%93Shanno_algorithm>`_
     if not callable(line_search):
         line_search = ConstantLineSearch(line_search)
 
-    ys = []
-    ss = []
+    memory = _LBFGSMemory(x.space, num_store)
+
+    # Reusable temporaries
+    search_dir = x.space.element()
+    grad_new = x.space.element()
 
     grad_x = grad(x)
     for i in range(maxiter):
         # Determine a stepsize using line search
-        search_dir = -_bfgs_direction(ss, ys, grad_x, hessinv_estimate)
+        memory.apply_hessinv(grad_x, out=search_dir,
+                             hessinv_estimate=hessinv_estimate)
+        search_dir *= -1
         dir_deriv = search_dir.inner(grad_x)
         if np.abs(dir_deriv) == 0:
             return  # we found an optimum
         step = line_search(x, direction=search_dir, dir_derivative=dir_deriv)
 
-        # Update x
-        x_update = search_dir
-        x_update *= step
+        # Update x, storing the update and the gradient difference in the
+        # next slot of the memory
+        x_update, grad_diff = memory.slot()
+        x_update.lincomb(step, search_dir)
         x += x_update
 
-        grad_x, grad_diff = grad(x), grad_x
+        grad(x, out=grad_new)
         # grad_diff = grad(x) - grad(x_old)
-        grad_diff.lincomb(-1, grad_diff, 1, grad_x)
+        grad_diff.lincomb(1, grad_new, -1, grad_x)
+        grad_x, grad_new = grad_new, grad_x
 
         y_inner_s = grad_diff.inner(x_update)
 
@@ -341,17 +781,145 @@ Goldfarb%E2%80%93Shanno_algorithm>`_
                 return
             else:
                 # Reset if needed
-                ys = []
-                ss = []
+                memory.reset()
                 continue
 
         # Update Hessian
-        ys.append(grad_diff)
-        ss.append(x_update)
-        if num_store is not None:
-            # Throw away factors if they are too many.
-            ss = ss[-num_store:]
-            ys = ys[-num_store:]
+        memory.commit(y_inner_s)
+
+        if callback is not None:
+            callback(x)
+
+
+def lbfgs_method(f, x, maxiter=1000, tol=1e-15, num_store=10,
+                 hessinv_estimate=None, callback=None, **kwargs):
+    """Limited-memory BFGS method with strong Wolfe line search.
+
+    This is an implementation of the L-BFGS method as described in
+    [NW2006], Algorithm 7.5. Compared to `bfgs_method` with ``num_store``,
+    it is designed for large problems where a gradient evaluation is
+    the dominant cost:
+
+    - The correction pairs are stored in a ring buffer of ``num_store``
+      preallocated elements, and their inner products are only computed
+      once.
+    - The search direction is computed in-place by the two-loop
+      recursion, using a scaled identity as initial Hessian estimate.
+    - The step length is chosen by a line search satisfying the strong
+      Wolfe conditions, which guarantees that the BFGS update is well
+      defined. The gradient in the accepted point is reused for the next
+      iteration.
+
+    Hence, besides function and gradient evaluations, an iteration costs
+    about ``4 * num_store + 10`` passes over the elements of
+    ``f.domain``.
+
+    Parameters
+    ----------
+    f : `Functional`
+        Functional with ``f.gradient``.
+    x : ``f.domain`` element
+        Starting point of the iteration, updated in-place.
+    maxiter : int, optional
+        Maximum number of iterations.
+    tol : float, optional
+        The iteration stops when the norm of the gradient is smaller
+        than ``tol``.
+    num_store : positive int, optional
+        Number of correction pairs to store.
+    hessinv_estimate : `Operator`, optional
+        Initial estimate of the inverse of the Hessian operator. Needs to
+        be an operator from ``f.domain`` to ``f.domain``.
+        Default: Scaled identity on ``f.domain``, see [NW2006], (7.20).
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    Other Parameters
+    ----------------
+    c1 : float, optional
+        Parameter of the sufficient decrease condition in the line
+        search.
+        Default: 1e-4
+    c2 : float, optional
+        Parameter of the curvature condition in the line search,
+        ``c1 < c2 < 1``.
+        Default: 0.9
+
+    See Also
+    --------
+    bfgs_method : BFGS method with user-defined line search
+
+    References
+    ----------
+    [NW2006] Nocedal, J, and Wright, S. *Numerical optimization*.
+    Springer, 2006.
+    """
+    grad = f.gradient
+    if x not in grad.domain:
+        raise TypeError('`x` {!r} is not in the domain of `grad` {!r}'
+                        ''.format(x, grad.domain))
+
+    num_store, num_store_in = int(num_store), num_store
+    if num_store < 1 or num_store != num_store_in:
+        raise ValueError('`num_store` must be a positive integer, got {}'
+                         ''.format(num_store_in))
+
+    c1 = float(kwargs.pop('c1', 1e-4))
+    c2 = float(kwargs.pop('c2', 0.9))
+    if not 0 < c1 < c2 < 1:
+        raise ValueError('`c1` and `c2` must satisfy 0 < c1 < c2 < 1, got '
+                         '{} and {}'.format(c1, c2))
+    if kwargs:
+        raise TypeError('got unexpected keyword arguments: {}'.format(kwargs))
+
+    memory = _LBFGSMemory(x.space, num_store)
+
+    # Reusable temporaries
+    search_dir = x.space.element()
+    x_new = x.space.element()
+    grad_new = x.space.element()
+
+    f_x = f(x)
+    grad_x = grad(x)
+    for _ in range(maxiter):
+        grad_norm = grad_x.norm()
+        if grad_norm <= tol:
+            return
+
+        memory.apply_hessinv(grad_x, out=search_dir,
+                             hessinv_estimate=hessinv_estimate, scale=True)
+        search_dir *= -1
+        dir_deriv = search_dir.inner(grad_x)
+        if dir_deriv >= 0:
+            # No descent direction due to rounding, restart
+            memory.reset()
+            search_dir.lincomb(-1, grad_x)
+            dir_deriv = -grad_norm ** 2
+
+        # Without information on the scaling, start with a moderate step
+        if memory.size == 0 and hessinv_estimate is None:
+            step = min(1.0, 1.0 / grad_norm)
+        else:
+            step = 1.0
+
+        step, f_new = _strong_wolfe_line_search(
+            f, grad, x, search_dir, f_x, dir_deriv, x_new, grad_new,
+            step=step, c1=c1, c2=c2)
+        if step == 0:
+            return  # no further decrease possible
+
+        # Store the new correction pair
+        s, y = memory.slot()
+        s.lincomb(1, x_new, -1, x)
+        y.lincomb(1, grad_new, -1, grad_x)
+        y_inner_s = y.inner(s)
+
+        x.assign(x_new)
+        grad_x, grad_new = grad_new, grad_x
+        f_x = f_new
+
+        if y_inner_s > 0:
+            memory.commit(y_inner_s)
 
         if callback is not None:
             callback(x)
@@ -15,3 +15,6 @@ __all__ += callback.__all__
 
 from .steplen import *
 __all__ += steplen.__all__
+
+from .stopping import *
+__all__ += stopping.__all__
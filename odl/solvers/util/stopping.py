@@ -0,0 +1,176 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Stopping criteria for early termination of iterative methods."""
+
+from __future__ import print_function, division, absolute_import
+from builtins import object
+
+from odl.util import signature_string
+
+__all__ = ('StoppingCriterion', 'RelativeChange')
+
+
+class StoppingCriterion(object):
+
+    """Abstract base class for stopping criteria of iterative methods.
+
+    A solver supporting stopping criteria checks `is_due` after each
+    iteration. If the criterion is due, the solver computes the norms
+    of the last change of its variables (e.g. primal and dual variable),
+    as well as the norms of their current values, from quantities it
+    holds anyway, and stops if the criterion returns ``True``. Hence
+    checking a criterion never costs additional operator evaluations.
+    """
+
+    def __init__(self, check_every=1):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        check_every : positive int, optional
+            Evaluate the criterion only every ``check_every`` iterations.
+            Since evaluating the criterion needs a few extra passes over
+            the variables, checking rarely is cheaper for fast iterations.
+        """
+        check_every, check_every_in = int(check_every), check_every
+        if check_every < 1 or check_every != check_every_in:
+            raise ValueError('`check_every` must be a positive integer, '
+                             'got {}'.format(check_every_in))
+        self.__check_every = check_every
+
+    @property
+    def check_every(self):
+        """Number of iterations between two evaluations."""
+        return self.__check_every
+
+    def is_due(self, iteration):
+        """Return ``True`` if the criterion is evaluated in ``iteration``.
+
+        Parameters
+        ----------
+        iteration : int
+            Index of the current iteration, starting from 0.
+
+        Examples
+        --------
+        >>> stop = StoppingCriterion(check_every=3)
+        >>> [stop.is_due(i) for i in range(6)]
+        [False, False, True, False, False, True]
+        """
+        return (iteration + 1) % self.check_every == 0
+
+    def __call__(self, changes, norms):
+        """Return ``True`` if the iteration should stop.
+
+        Parameters
+        ----------
+        changes : sequence of floats
+            Norms of the changes of the variables in the last iteration.
+        norms : sequence of floats
+            Norms of the current values of the variables, in the same
+            order as ``changes``.
+
+        Returns
+        -------
+        converged : bool
+        """
+        raise NotImplementedError('abstract method')
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        optargs = [('check_every', self.check_every, 1)]
+        inner_str = signature_string([], optargs)
+        return '{}({})'.format(self.__class__.__name__, inner_str)
+
+
+class RelativeChange(StoppingCriterion):
+
+    """Stop when all variables change little relative to their size.
+
+    The criterion is satisfied if ``changes[i] <= tol * norms[i]`` for
+    all variables ``i``. For primal-dual methods, the changes of the
+    primal and the dual variable are (scaled) primal and dual residuals,
+    see e.g. [GLY2015].
+
+    References
+    ----------
+    [GLY2015] Goldstein, T, Li, M, and Yuan, X. *Adaptive primal-dual
+    splitting methods for statistical learning and image processing*.
+    Advances in Neural Information Processing Systems 28 (2015),
+    pp 2089-2097.
+    """
+
+    def __init__(self, tol, check_every=1):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        tol : nonnegative float
+            Tolerance for the relative changes.
+        check_every : positive int, optional
+            Evaluate the criterion only every ``check_every`` iterations.
+
+        Examples
+        --------
+        >>> stop = RelativeChange(1e-3)
+        >>> stop([1e-4, 1e-2], [1.0, 20.0])
+        True
+        >>> stop([1e-4, 1e-1], [1.0, 20.0])
+        False
+        """
+        super(RelativeChange, self).__init__(check_every)
+        self.__tol = float(tol)
+        if self.tol < 0:
+            raise ValueError('`tol` must be nonnegative, got {}'.format(tol))
+
+    @property
+    def tol(self):
+        """Tolerance for the relative changes."""
+        return self.__tol
+
+    def __call__(self, changes, norms):
+        """Return ``True`` if all relative changes are below `tol`."""
+        return all(change <= self.tol * norm
+                   for change, norm in zip(changes, norms))
+
+    def __repr__(self):
+        """Return ``repr(self)``.
+
+        Examples
+        --------
+        >>> RelativeChange(1e-3, check_every=10)
+        RelativeChange(0.001, check_every=10)
+        """
+        posargs = [self.tol]
+        optargs = [('check_every', self.check_every, 1)]
+        inner_str = signature_string(posargs, optargs)
+        return '{}({})'.format(self.__class__.__name__, inner_str)
+
+
+def _normalized_stopping(tol, stopping):
+    """Return the stopping criterion given by ``tol`` or ``stopping``.
+
+    ``None`` is returned if both are ``None``, and a `RelativeChange`
+    criterion if only ``tol`` is given.
+    """
+    if stopping is None:
+        if tol is None:
+            return None
+        return RelativeChange(tol)
+    elif tol is not None:
+        raise ValueError('cannot give both `tol` and `stopping`')
+    elif not isinstance(stopping, StoppingCriterion):
+        raise TypeError('`stopping` must be a `StoppingCriterion`, got {!r}'
+                        ''.format(stopping))
+    return stopping
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
@@ -14,6 +14,7 @@ import pytest
 
 import odl
 from odl.deform import LinDeformFixedTempl, LinDeformFixedDisp
+from odl.deform import linearized
 from odl.space.entry_points import tensor_space_impl
 from odl.util.testutils import simple_fixture
 
@@ -314,5 +315,28 @@ def test_fixed_disp_adj(space):
     assert inner1 == pytest.approx(inner2, abs=.1)
 
 
+def test_linear_deform_blockwise(space, monkeypatch):
+    """Test block-wise deformation against the generic interpolation."""
+    template = space.element(template_function)
+    disp_field = space.real_space.tangent_bundle.element(
+        disp_field_factory(space.ndim))
+    # Make some points leave the domain
+    disp_field *= 8
+
+    image_pts = space.points()
+    for i, vi in enumerate(disp_field):
+        image_pts[:, i] += vi.asarray().ravel()
+    expected = template.interpolation(image_pts.T, bounds_check=False)
+    expected = expected.reshape(space.shape)
+
+    monkeypatch.setattr(odl.util.numerics, '_BLOCK_SIZE', 7)
+    result = linearized.linear_deform(template, disp_field)
+    assert np.allclose(result, expected)
+
+    out = space.element()
+    linearized.linear_deform(template, disp_field, out=out)
+    assert np.allclose(out, expected)
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -356,6 +356,47 @@ def test_gradient(space, method, padding):
                         pad_const=pad_const)
         grad(dom_vec)
 
+
+def test_diff_ops_blockwise(method, monkeypatch):
+    """Verify the slab-wise evaluation against `finite_diff`."""
+    monkeypatch.setattr(odl.util.numerics, '_BLOCK_SIZE', 10)
+    space = odl.uniform_discr([0, 0], [1, 1], (13, 4))
+    pad_modes = ['constant', 'symmetric', 'symmetric_adjoint', 'periodic',
+                 'order0', 'order0_adjoint', 'order1', 'order1_adjoint',
+                 'order2', 'order2_adjoint']
+
+    for pad_mode in pad_modes:
+        grad = Gradient(space, method=method, pad_mode=pad_mode)
+        div = Divergence(range=space, method=method, pad_mode=pad_mode)
+        x = noise_element(space)
+        y = noise_element(grad.range)
+
+        grad_x = grad(x)
+        div_y = div(y)
+        true_div = 0
+        for axis, dx in enumerate(space.cell_sides):
+            assert all_almost_equal(
+                grad_x[axis],
+                finite_diff(x.asarray(), axis=axis, dx=dx, method=method,
+                            pad_mode=pad_mode))
+            true_div = true_div + finite_diff(
+                y[axis].asarray(), axis=axis, dx=dx, method=method,
+                pad_mode=pad_mode)
+        assert all_almost_equal(div_y, true_div)
+
+    for pad_mode in ['constant', 'symmetric', 'periodic']:
+        lap = Laplacian(space, pad_mode=pad_mode)
+        x = noise_element(space)
+        true_lap = 0
+        for axis, dx in enumerate(space.cell_sides):
+            true_lap = true_lap + (
+                finite_diff(x.asarray(), axis=axis, dx=dx ** 2,
+                            method='forward', pad_mode=pad_mode) -
+                finite_diff(x.asarray(), axis=axis, dx=dx ** 2,
+                            method='backward', pad_mode=pad_mode))
+        assert all_almost_equal(lap(x), true_lap)
+
+
 # --- Divergence --- #
 
 
@@ -16,7 +16,7 @@ import odl
 from odl.discr.grid import sparse_meshgrid
 from odl.discr.discr_mappings import (
     PointCollocation, NearestInterpolation, LinearInterpolation,
-    PerAxisInterpolation)
+    PerAxisInterpolation, PreparedInterpolation)
 from odl.util.testutils import all_almost_equal, all_equal
 
 
@@ -340,5 +340,70 @@ def test_collocation_interpolation_identity():
         assert all_almost_equal(ident_values, values)
 
 
+@pytest.mark.parametrize('schemes', [['linear', 'linear'],
+                                     ['nearest', 'nearest'],
+                                     ['nearest', 'linear']])
+def test_prepared_interpolation(schemes):
+    """Test interpolation with precomputed indices and weights."""
+    part = odl.uniform_partition([0, 0], [1, 2], (4, 5))
+    fspace = odl.FunctionSpace(part.set)
+    tspace = odl.rn(part.shape)
+    interp_op = PerAxisInterpolation(fspace, part, tspace, schemes=schemes)
+    values = np.random.rand(*part.shape)
+    function = interp_op(values)
+
+    # Points partly outside the grid
+    points = np.random.uniform(-0.5, 2.5, size=(2, 20))
+    prepared = PreparedInterpolation(part.grid, points, schemes)
+    assert prepared.out_shape == (20,)
+    expected = function(points, bounds_check=False)
+    assert all_almost_equal(prepared(values), expected)
+    out = np.empty(20)
+    prepared(values, out=out)
+    assert all_almost_equal(out, expected)
+
+    mesh = sparse_meshgrid([-0.2, 0.3, 0.75], [0.1, 1.3, 1.9, 2.2])
+    prepared_mesh = PreparedInterpolation(part.grid, mesh, schemes)
+    assert prepared_mesh.out_shape == (3, 4)
+    assert all_almost_equal(prepared_mesh(values),
+                            function(mesh, bounds_check=False))
+
+    # Transpose and matrix
+    for prep in (prepared, prepared_mesh):
+        y = np.random.rand(*prep.out_shape)
+        assert prep.transpose(y).shape == part.shape
+        assert np.vdot(prep(values), y) == pytest.approx(
+            np.vdot(values, prep.transpose(y)))
+        assert all_almost_equal(prep.matrix.dot(values.ravel()),
+                                prep(values).ravel())
+
+
+@pytest.mark.parametrize('num_threads', [1, 3])
+def test_collocation_blockwise(num_threads):
+    """Test evaluation of functions in blocks of grid points."""
+    def func_vec(x):
+        return np.sin(x[0]) * x[-1] + x[0]
+
+    def func_nonvec(x):
+        return x[0] * 2 if x[-1] > 0.5 else x[0]
+
+    for shape in [(23,), (15, 4, 3)]:
+        ndim = len(shape)
+        part = odl.uniform_partition([0] * ndim, [1] * ndim, shape)
+        fspace = odl.FunctionSpace(part.set)
+        tspace = odl.rn(part.shape)
+        coll_op = PointCollocation(fspace, part, tspace)
+        coll_op_block = PointCollocation(fspace, part, tspace, block_size=7,
+                                         num_threads=num_threads)
+
+        for func in [fspace.element(func_vec),
+                     fspace.element(func_nonvec, vectorized=False)]:
+            expected = coll_op(func)
+            assert all_equal(coll_op_block(func), expected)
+            out = tspace.element()
+            coll_op_block(func, out=out)
+            assert all_equal(out, expected)
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -16,7 +16,7 @@ import odl
 from odl.discr.discr_ops import _SUPPORTED_RESIZE_PAD_MODES
 from odl.space.entry_points import tensor_space_impl
 from odl.util import is_numeric_dtype, is_real_floating_dtype
-from odl.util.testutils import noise_element, dtype_tol
+from odl.util.testutils import noise_element, dtype_tol, all_almost_equal
 
 
 # --- pytest fixtures --- #
@@ -281,5 +281,29 @@ def test_resizing_op_mixed_uni_nonuni():
     assert inner1 == pytest.approx(inner2)
 
 
+@pytest.mark.parametrize('interp', ['nearest', 'linear'])
+def test_resampling_precomputed(interp):
+    """Test precomputed resampling against the sampling-based one."""
+    coarse = odl.uniform_discr([0, -1], [1, 1], (5, 6), interp=interp)
+    fine = odl.uniform_discr([0, -1], [1, 1], (8, 13), interp=interp)
+
+    for dom, ran in [(coarse, fine), (fine, coarse)]:
+        resampling = odl.Resampling(dom, ran)
+        resampling_pre = odl.Resampling(dom, ran, precomputed=True)
+        assert resampling_pre.precomputed
+
+        x = noise_element(dom)
+        assert all_almost_equal(resampling_pre(x), resampling(x))
+        out = ran.element()
+        resampling_pre(x, out=out)
+        assert all_almost_equal(out, resampling(x))
+
+        # The adjoint is exact
+        y = noise_element(ran)
+        assert resampling_pre(x).inner(y) == pytest.approx(
+            x.inner(resampling_pre.adjoint(y)))
+        assert resampling_pre.adjoint.adjoint is resampling_pre
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
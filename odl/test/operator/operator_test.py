@@ -12,7 +12,7 @@ import numpy as np
 import sys
 
 import odl
-from odl import (Operator, OperatorSum, OperatorComp,
+from odl import (Operator, OperatorSum, OperatorComp, OperatorLinComb,
                  OperatorLeftScalarMult, OperatorRightScalarMult,
                  FunctionalLeftVectorMult, OperatorRightVectorMult,
                  MatrixOperator, OperatorLeftVectorMult,
@@ -294,6 +294,51 @@ def test_linear_operator_addition(dom_eq_ran):
                y, np.dot(mat1.T, yarr) + np.dot(mat2.T, yarr))
 
 
+def test_operator_lincomb(dom_eq_ran):
+    """Check call, adjoint and derivative of a linear combination."""
+    if dom_eq_ran:
+        mats = [np.random.rand(3, 3) for _ in range(3)]
+    else:
+        mats = [np.random.rand(4, 3) for _ in range(3)]
+    scalars = [2.0, -1.0, 0.5]
+
+    # Linear case
+    ops = [MatrixOperator(mat) for mat in mats]
+    xarr, x = noise_elements(ops[0].domain)
+    yarr, y = noise_elements(ops[0].range)
+
+    lincomb_op = OperatorLinComb(ops, scalars)
+    assert lincomb_op.is_linear
+    check_call(lincomb_op, x,
+               sum(s * np.dot(mat, xarr) for s, mat in zip(scalars, mats)))
+    check_call(lincomb_op.adjoint, y,
+               sum(s * np.dot(mat.T, yarr) for s, mat in zip(scalars, mats)))
+
+    # Single term
+    check_call(OperatorLinComb(ops[:1], scalars[:1]), x,
+               scalars[0] * np.dot(mats[0], xarr))
+
+    # Nonlinear case
+    ops = [MultiplyAndSquareOp(mat) for mat in mats]
+    lincomb_op = OperatorLinComb(ops, scalars)
+    assert not lincomb_op.is_linear
+    check_call(lincomb_op, x,
+               sum(s * mult_sq_np(mat, xarr)
+                   for s, mat in zip(scalars, mats)))
+    deriv = lincomb_op.derivative(x)
+    check_call(deriv, x,
+               sum(2 * s * np.dot(mat, xarr)
+                   for s, mat in zip(scalars, mats)))
+
+    # Bad input
+    with pytest.raises(ValueError):
+        OperatorLinComb([])
+    with pytest.raises(ValueError):
+        OperatorLinComb(ops, scalars[:2])
+    with pytest.raises(OpTypeError):
+        OperatorLinComb([ops[0], MultiplyAndSquareOp(mats[0][:, :-1])])
+
+
 def test_linear_operator_scaling(dom_eq_ran):
     """Check call and adjoint of a scaled linear operator."""
     if dom_eq_ran:
@@ -395,6 +440,79 @@ def test_linear_operator_composition(dom_eq_ran):
     check_call((op1 * op2).adjoint, y, np.dot(mat2.T, np.dot(mat1.T, yarr)))
 
 
+def test_composite_operator_tmp_cache():
+    """Check that temporaries of composite operators are reused."""
+    space = odl.rn(3)
+    allocated = []
+
+    class RecordingOp(Operator):
+        """Identity operator recording its arguments."""
+
+        def __init__(self):
+            super(RecordingOp, self).__init__(space, space, linear=True)
+
+        def _call(self, x, out):
+            allocated.extend([x, out])
+            out.assign(x)
+
+    rec = RecordingOp()
+    x = noise_element(space)
+    out = space.element()
+
+    for cache_tmp in [True, False]:
+        ops = [OperatorComp(rec, rec, cache_tmp=cache_tmp),
+               OperatorSum(rec, rec, cache_tmp=cache_tmp),
+               OperatorLinComb([rec, rec, rec], cache_tmp=cache_tmp),
+               OperatorRightScalarMult(rec, 2.0, cache_tmp=cache_tmp)]
+        for op in ops:
+            assert op.cache_tmp == cache_tmp
+
+            del allocated[:]
+            op(x, out=out)
+            tmps_first = [t for t in allocated
+                          if t is not x and t is not out]
+            del allocated[:]
+            op(x, out=out)
+            tmps_second = [t for t in allocated
+                           if t is not x and t is not out]
+
+            assert tmps_first
+            same = all(t1 is t2 for t1, t2 in zip(tmps_first, tmps_second))
+            assert same == cache_tmp
+
+    # Flag is propagated to derived operators
+    matop = MatrixOperator(np.eye(3))
+    op = OperatorComp(matop, matop, cache_tmp=False)
+    assert not op.adjoint.cache_tmp
+    op = OperatorSum(matop, matop, cache_tmp=False)
+    assert not op.adjoint.cache_tmp
+
+
+def test_composite_operator_tmp_cache_threads():
+    """Check that cached temporaries are not shared between threads."""
+    import threading
+
+    mat1 = np.random.rand(10, 10)
+    mat2 = np.random.rand(10, 10)
+    op = OperatorComp(MatrixOperator(mat1), MatrixOperator(mat2))
+    xs = [noise_element(op.domain) for _ in range(4)]
+    outs = [op.range.element() for _ in xs]
+
+    def evaluate(i):
+        for _ in range(50):
+            op(xs[i], out=outs[i])
+
+    threads = [threading.Thread(target=evaluate, args=(i,))
+               for i in range(len(xs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for x, out in zip(xs, outs):
+        assert all_almost_equal(out, np.dot(mat1, np.dot(mat2, x)))
+
+
 def test_type_errors():
     r3 = odl.rn(3)
     r4 = odl.rn(4)
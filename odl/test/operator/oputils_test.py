@@ -11,9 +11,11 @@ import numpy as np
 import pytest
 
 import odl
-from odl.operator.oputils import matrix_representation, power_method_opnorm
+from odl.operator.oputils import (
+    as_scipy_operator, cached, lanczos_opnorm, matrix_representation,
+    power_method_opnorm, simplify)
 from odl.operator.pspace_ops import ProductSpaceOperator
-from odl.util.testutils import all_almost_equal
+from odl.util.testutils import all_almost_equal, noise_element
 
 
 def test_matrix_representation():
@@ -141,6 +143,36 @@ def test_matrix_representation_wrong_range():
         matrix_representation(nonlin_op)
 
 
+def test_matrix_representation_sparse():
+    """Verify that sparse and dense matrix representations agree."""
+    space = odl.uniform_discr([0, 0], [1, 1], (5, 6))
+    grad = odl.Gradient(space, pad_mode='order1')
+    sampling = odl.SamplingOperator(space, [[0, 1, 4, 1], [2, 3, 5, 3]],
+                                    variant='integrate')
+    ops = [grad,
+           grad.adjoint,
+           grad.adjoint * grad + 2 * odl.IdentityOperator(space),
+           odl.Laplacian(space, pad_mode='symmetric'),
+           odl.Gradient(space, pad_mode='periodic'),
+           sampling,
+           odl.MatrixOperator(np.random.rand(4, 5))]
+
+    for op in ops:
+        dense = matrix_representation(op)
+        sparse = matrix_representation(op, sparse=True)
+        assert sparse.shape == (op.range.size, op.domain.size)
+        assert all_almost_equal(sparse.toarray(),
+                                dense.reshape(sparse.shape))
+
+    # Column-wise evaluation with several threads
+    op = odl.MatrixOperator(np.random.rand(4, 5))
+    sparse = matrix_representation(op, sparse=True, num_threads=3)
+    assert all_almost_equal(sparse.toarray(), op.matrix)
+
+    with pytest.raises(ValueError):
+        matrix_representation(op, sparse=True, num_threads=0)
+
+
 def test_power_method_opnorm_symm():
     """Test the power method on a symmetrix matrix operator"""
     # Test matrix with eigenvalues 1 and -2
@@ -212,5 +244,275 @@ def test_power_method_opnorm_exceptions():
         power_method_opnorm(op, maxiter=1, xstart=op.domain.one())
 
 
+def test_lanczos_opnorm():
+    """Test the Lanczos method against known operator norms."""
+    # Singular values 5.5 and 6
+    mat = np.array([[-1.52441557, 5.04276365],
+                    [1.90246927, 2.54424763],
+                    [5.32935411, 0.04573162]])
+    op = odl.MatrixOperator(mat)
+    opnorm_est, vec = lanczos_opnorm(op, return_vector=True)
+    assert opnorm_est == pytest.approx(6, rel=1e-5)
+    assert vec.norm() == pytest.approx(1)
+    assert op(vec).norm() == pytest.approx(6, rel=1e-5)
+
+    # Larger problem that needs restarts
+    mat = np.random.rand(50, 40) + 1j * np.random.rand(50, 40)
+    op = odl.MatrixOperator(mat)
+    opnorm_est = lanczos_opnorm(op, krylov_dim=3, rtol=1e-8)
+    assert opnorm_est == pytest.approx(np.linalg.norm(mat, 2), rel=1e-5)
+
+    # Zero operator
+    op = odl.MatrixOperator(np.zeros((3, 2)))
+    assert lanczos_opnorm(op) == 0
+
+    with pytest.raises(ValueError):
+        lanczos_opnorm(op, maxiter=0)
+    with pytest.raises(ValueError):
+        lanczos_opnorm(op, krylov_dim=1)
+    with pytest.raises(ValueError):
+        lanczos_opnorm(op, xstart=op.domain.zero())
+
+
+def test_operator_norm_estimate_cached():
+    """Verify that estimated norms are stored on the operator."""
+    class CountingOp(odl.Operator):
+        def __init__(self, mat):
+            super(CountingOp, self).__init__(odl.rn(mat.shape[1]),
+                                             odl.rn(mat.shape[0]),
+                                             linear=True)
+            self.mat_op = odl.MatrixOperator(mat)
+            self.ncalls = 0
+
+        def _call(self, x):
+            self.ncalls += 1
+            return self.mat_op(x)
+
+        @property
+        def adjoint(self):
+            return self.mat_op.adjoint
+
+    mat = np.random.rand(20, 10)
+    op = CountingOp(mat)
+    opnorm = op.norm(estimate=True)
+    assert opnorm == pytest.approx(np.linalg.norm(mat, 2), rel=1e-4)
+    ncalls = op.ncalls
+    assert op.norm(estimate=True) == opnorm
+    assert op.ncalls == ncalls
+
+    # Recomputation with other parameters is warm-started
+    op.norm(estimate=True, rtol=1e-10)
+    assert op.ncalls - ncalls < ncalls
+
+    # The vector is public and warm-starts the estimate of a related
+    # operator
+    assert op.norm_vector in op.domain
+    related_op = CountingOp(mat * (1 + 1e-3 * np.random.rand(20, 10)))
+    assert related_op.norm_vector is None
+    related_op.norm(estimate=True, xstart=op.norm_vector)
+    assert related_op.ncalls < ncalls
+
+
+def test_as_scipy_operator():
+    """Verify the scipy wrapper for single and multiple vectors."""
+    space = odl.uniform_discr([0, 0], [1, 1], (4, 5))
+    mat_op = odl.MatrixOperator(np.random.rand(20, 20))
+    for op in [odl.Gradient(space),
+               2 * mat_op * mat_op + odl.IdentityOperator(mat_op.domain)]:
+        matrix = matrix_representation(op, sparse=True).toarray()
+        scipy_op = as_scipy_operator(op)
+        x = np.random.rand(op.domain.size, 3)
+        y = np.random.rand(op.range.size, 3)
+
+        assert all_almost_equal(scipy_op.matvec(x[:, 0]),
+                                matrix.dot(x[:, 0]))
+        assert all_almost_equal(scipy_op.rmatvec(y[:, 0]),
+                                matrix.T.dot(y[:, 0]))
+        assert all_almost_equal(scipy_op.matmat(x), matrix.dot(x))
+        assert all_almost_equal(scipy_op.H.matmat(y), matrix.T.dot(y))
+
+    with pytest.raises(ValueError):
+        as_scipy_operator(odl.PowerOperator(odl.rn(3), 2))
+
+
+def test_is_batchable():
+    """Verify that batched evaluation is only used for whole trees."""
+    from odl.operator.oputils import _is_batchable
+
+    mat_op = odl.MatrixOperator(np.random.rand(20, 20))
+    ident = odl.IdentityOperator(mat_op.domain)
+    other = odl.PowerOperator(mat_op.domain, 1)
+    assert _is_batchable(2 * mat_op * mat_op + ident)
+    assert _is_batchable(odl.OperatorLinComb([mat_op, ident], [1, -1]))
+    assert not _is_batchable(other * mat_op)
+    assert not _is_batchable(mat_op + 3 * other)
+    assert not _is_batchable(odl.OperatorLinComb([mat_op, other], [1, 1]))
+
+    # Partly batchable trees are evaluated column by column
+    op = 2 * (other * mat_op) + mat_op
+    x = np.random.rand(20, 3)
+    expected = np.stack([op(col) for col in x.T], axis=1)
+    assert all_almost_equal(as_scipy_operator(op).matmat(x), expected)
+
+
+def test_simplify_scalars():
+    """Verify that scalars, scaling and zero operators are folded."""
+    space = odl.rn(3)
+    A = odl.MatrixOperator(np.random.rand(3, 3))
+    B = odl.MatrixOperator(np.random.rand(3, 3))
+    x = noise_element(space)
+
+    op = 2 * (3 * (A.adjoint * A)) + 0 * B
+    simplified = simplify(op)
+    assert isinstance(simplified, odl.OperatorLeftScalarMult)
+    assert simplified.scalar == 6
+    assert all_almost_equal(simplified(x), op(x))
+
+    # Scaling operators inside compositions are pulled out
+    scal = odl.ScalingOperator(space, 2.0)
+    op = scal * A * odl.IdentityOperator(space) * scal * B
+    simplified = simplify(op)
+    assert isinstance(simplified, odl.OperatorLeftScalarMult)
+    assert simplified.scalar == 4
+    assert all_almost_equal(simplified(x), op(x))
+
+    # Double adjoint with sign flips collapses
+    grad = odl.Gradient(odl.uniform_discr(0, 1, 5))
+    assert isinstance(simplify(grad.adjoint.adjoint), odl.Gradient)
+
+    # Zeros
+    assert isinstance(simplify(0 * A), odl.ZeroOperator)
+    assert isinstance(simplify(A * odl.ZeroOperator(space) * B),
+                      odl.ZeroOperator)
+    assert isinstance(simplify(A - A), odl.ZeroOperator)
+    assert simplify(A + 0 * B) is A
+
+
+def test_simplify_sum():
+    """Verify that sums are flattened into linear combinations."""
+    space = odl.rn(3)
+    A = odl.MatrixOperator(np.random.rand(3, 3))
+    B = odl.MatrixOperator(np.random.rand(3, 3))
+    C = odl.MatrixOperator(np.random.rand(3, 3))
+    x = noise_element(space)
+
+    op = A + 2 * (B + 3 * (C - A)) + odl.IdentityOperator(space)
+    simplified = simplify(op)
+    assert isinstance(simplified, odl.OperatorLinComb)
+    assert len(simplified.operators) == 4
+    assert simplified.operators[:3] == (A, B, C)
+    assert simplified.scalars[:3] == (-5, 2, 6)
+    assert all_almost_equal(simplified(x), op(x))
+    assert all_almost_equal(simplified.adjoint(x), op.adjoint(x))
+
+    out = space.element()
+    simplified(x, out=out)
+    assert all_almost_equal(out, op(x))
+
+
+def test_simplify_nonlinear():
+    """Verify that scalars are not moved through nonlinear operators."""
+    space = odl.rn(3)
+    A = odl.MatrixOperator(np.random.rand(3, 3))
+    N = odl.PowerOperator(space, 2)
+    x = noise_element(space)
+
+    for op in [2 * (N * (3 * A)),
+               (N * 2) * (A * 3),
+               N * odl.ZeroOperator(space),
+               A * (0 * N) + N * 0]:
+        simplified = simplify(op)
+        assert all_almost_equal(simplified(x), op(x))
+
+    # Functional arithmetic is left untouched
+    func = odl.solvers.L2NormSquared(space)
+    assert isinstance(simplify(2 * func), odl.solvers.Functional)
+
+
+class CountingOp(odl.Operator):
+
+    """Nonlinear operator ``x -> x ** 2`` counting its evaluations."""
+
+    def __init__(self, space):
+        super(CountingOp, self).__init__(space, space)
+        self.ncalls = 0
+        self.nderivs = 0
+
+    def _call(self, x, out):
+        self.ncalls += 1
+        x.ufuncs.square(out=out)
+
+    def derivative(self, point):
+        self.nderivs += 1
+        return odl.MultiplyOperator(2 * point)
+
+
+def test_cached_operator():
+    """Verify that cached operators evaluate only on cache misses."""
+    space = odl.rn(3)
+    op = CountingOp(space)
+    cop = cached(op, maxsize=2)
+    assert isinstance(cop, odl.CachedOperator)
+    x = noise_element(space)
+    y = noise_element(space)
+
+    result = cop(x)
+    assert all_almost_equal(result, x ** 2)
+    assert all_almost_equal(cop(x), x ** 2)
+    assert op.ncalls == 1
+
+    # Returned results are copies
+    result[:] = 0
+    assert all_almost_equal(cop(x), x ** 2)
+
+    # In-place evaluation is served from the cache as well
+    out = space.element()
+    cop(x, out=out)
+    assert all_almost_equal(out, x ** 2)
+    assert op.ncalls == 1
+
+    # Modifying the point in-place invalidates the match
+    x[0] += 1
+    assert all_almost_equal(cop(x), x ** 2)
+    assert op.ncalls == 2
+
+    # The least recently used entry is evicted
+    cop(y)
+    z = noise_element(space)
+    cop(z)
+    assert op.ncalls == 4
+    cop(y)
+    assert op.ncalls == 4
+    cop(x)
+    assert op.ncalls == 5
+
+    # Derivatives are memoized per point
+    deriv = cop.derivative(y)
+    assert cop.derivative(y.copy()) is deriv
+    assert op.nderivs == 1
+
+    cop.clear_cache()
+    cop(y)
+    assert op.ncalls == 6
+
+    with pytest.raises(ValueError):
+        cached(op, maxsize=0)
+
+
+def test_cached_functional():
+    """Verify that cached functionals memoize values and gradients."""
+    space = odl.rn(3)
+    func = odl.solvers.L2NormSquared(space)
+    cfunc = cached(func)
+    assert isinstance(cfunc, odl.solvers.Functional)
+    x = noise_element(space)
+
+    assert cfunc(x) == pytest.approx(func(x))
+    assert all_almost_equal(cfunc.gradient(x), func.gradient(x))
+    assert cfunc.gradient is cfunc.gradient
+    assert all_almost_equal(cfunc.proximal(1.0)(x), func.proximal(1.0)(x))
+    assert (cfunc + func)(x) == pytest.approx(2 * func(x))
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
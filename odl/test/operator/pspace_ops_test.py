@@ -7,10 +7,11 @@
 # obtain one at https://mozilla.org/MPL/2.0/.
 
 from __future__ import division
+import numpy as np
 import pytest
 
 import odl
-from odl.util.testutils import all_almost_equal, simple_fixture
+from odl.util.testutils import all_almost_equal, noise_element, simple_fixture
 
 
 base_op = simple_fixture(
@@ -22,6 +23,8 @@ base_op = simple_fixture(
      ],
     fmt=' {name}={value.__class__.__name__}')
 
+executor = simple_fixture('executor', [None, 'threads'])
+
 
 def test_pspace_op_init(base_op):
     """Test initialization with different base operators."""
@@ -162,6 +165,132 @@ def test_pspace_op_swap_call():
     assert result == op(z, out=op.range.element())
 
 
+def test_pspace_op_executor_call(executor):
+    """Test concurrent evaluation against sequential evaluation."""
+    space = odl.uniform_discr([0, 0], [1, 1], (4, 5))
+    grad = odl.Gradient(space)
+    A = odl.ScalingOperator(space, 2.0)
+    B = odl.IdentityOperator(space)
+    C = odl.MultiplyOperator(noise_element(space))
+    ops = [[A, B, C, 0],
+           [0, 0, 0, 0],
+           [C, 0, A, B]]
+
+    seq_op = odl.ProductSpaceOperator(ops, range=space ** 3)
+    op = odl.ProductSpaceOperator(ops, range=space ** 3, executor=executor)
+    assert op.executor == executor
+    if executor is None:
+        assert op.adjoint.executor is None
+    else:
+        # Derived operators share the pool
+        assert op.adjoint.executor is op._pool()
+
+    x = noise_element(op.domain)
+    assert all_almost_equal(op(x), seq_op(x))
+    out = noise_element(op.range)
+    op(x, out=out)
+    assert all_almost_equal(out, seq_op(x))
+    assert all_almost_equal(op.adjoint(out), seq_op.adjoint(out))
+
+    # Derived operators
+    bcast_op = odl.BroadcastOperator(grad, A, executor=executor)
+    y = noise_element(space)
+    assert all_almost_equal(bcast_op(y), [grad(y), A(y)])
+    assert all_almost_equal(bcast_op.adjoint(bcast_op(y)),
+                            grad.adjoint(grad(y)) + A(A(y)))
+
+    red_op = odl.ReductionOperator(*[odl.ScalingOperator(space, i)
+                                     for i in range(5)], executor=executor)
+    z = noise_element(red_op.domain)
+    expected = sum(i * z[i] for i in range(5))
+    assert all_almost_equal(red_op(z), expected)
+    assert all_almost_equal(red_op(z, out=space.element()), expected)
+
+    diag_op = odl.DiagonalOperator(A, B, executor=executor)
+    assert diag_op.executor == executor
+    assert all_almost_equal(diag_op(x[:2]), [A(x[0]), B(x[1])])
+
+    for pspace_op in [op, bcast_op, red_op, diag_op]:
+        pspace_op.close()
+
+
+def test_pspace_op_close():
+    """Test that `close` shuts down only pools created by the operator."""
+    futures = pytest.importorskip('concurrent.futures')
+    space = odl.rn(3)
+    ident = odl.IdentityOperator(space)
+
+    with odl.DiagonalOperator(ident, 2 * ident, executor='threads') as op:
+        x = op.domain.one()
+        assert all_almost_equal(op.adjoint(op(x)), [[1] * 3, [4] * 3])
+        pool = op._pool()
+        assert op.adjoint.executor is pool
+        assert op.adjoint.adjoint.executor is pool
+    with pytest.raises(RuntimeError):
+        pool.submit(abs, 1)
+
+    # The operator creates a new pool on the next concurrent evaluation
+    assert all_almost_equal(op(x), [[1] * 3, [2] * 3])
+    op.close()
+
+    with futures.ThreadPoolExecutor(max_workers=2) as user_pool:
+        with odl.BroadcastOperator(ident, ident, executor=user_pool) as op:
+            op(space.one())
+        assert user_pool.submit(abs, -1).result() == 1
+
+
+def test_pspace_op_processes():
+    """Test evaluation in a process pool, which pickles operators."""
+    futures = pytest.importorskip('concurrent.futures')
+    space = odl.rn(3)
+    A = odl.ScalingOperator(space, 2.0)
+    B = odl.IdentityOperator(space)
+    M = odl.MatrixOperator(np.random.rand(3, 3))
+    ops = [[A, B, 0],
+           [0, M, A]]
+    seq_op = odl.ProductSpaceOperator(ops)
+
+    with odl.ProductSpaceOperator(ops, executor='processes') as op:
+        assert isinstance(op._pool(), futures.ProcessPoolExecutor)
+        x = noise_element(op.domain)
+        assert all_almost_equal(op(x), seq_op(x))
+        out = op.range.element()
+        op(x, out=out)
+        assert all_almost_equal(out, seq_op(x))
+
+        # The adjoint uses the same process pool
+        assert op.adjoint.executor is op._pool()
+        y = noise_element(op.range)
+        assert all_almost_equal(op.adjoint(y), seq_op.adjoint(y))
+
+    with odl.BroadcastOperator(A, M, executor='processes') as op:
+        z = noise_element(space)
+        assert all_almost_equal(op(z), [A(z), M(z)])
+        assert all_almost_equal(op.adjoint(op(z)), A(A(z)) + M.adjoint(M(z)))
+
+
+def test_pspace_op_executor_instance():
+    """Test evaluation with a user-provided executor."""
+    futures = pytest.importorskip('concurrent.futures')
+    space = odl.rn(10)
+    mats = [np.random.rand(10, 10) for _ in range(4)]
+    ops = [odl.MatrixOperator(mat) for mat in mats]
+
+    with futures.ThreadPoolExecutor(max_workers=2) as pool:
+        op = odl.ReductionOperator(*ops, executor=pool)
+        assert op.prod_op.executor is pool
+        x = noise_element(op.domain)
+        expected = sum(np.dot(mat, xi) for mat, xi in zip(mats, x))
+        assert all_almost_equal(op(x), expected)
+
+    with pytest.raises(ValueError):
+        odl.ProductSpaceOperator([ops], executor='gpus')
+    with pytest.raises(TypeError):
+        odl.ProductSpaceOperator([ops], executor=1)
+    with pytest.raises(TypeError):
+        odl.BroadcastOperator(ops[0], space=space)
+
+
 def test_comp_proj():
     r3 = odl.rn(3)
     r3xr3 = odl.ProductSpace(r3, 2)
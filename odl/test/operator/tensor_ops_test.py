@@ -11,7 +11,7 @@
 from __future__ import division
 import pytest
 import numpy as np
-import scipy
+import scipy.sparse
 
 import odl
 from odl.operator.tensor_ops import (
@@ -139,6 +139,34 @@ def test_pointwise_norm_real(exponent):
     assert all_almost_equal(out, true_norm)
 
 
+def test_pointwise_norm_blockwise(exponent, monkeypatch):
+    """Verify the blocked evaluation with several (incomplete) blocks."""
+    monkeypatch.setattr(odl.util.numerics, '_BLOCK_SIZE', 7)
+    fspace = odl.uniform_discr([0, 0], [1, 1], (5, 6))
+    vfspace = ProductSpace(fspace, 3)
+    weights = [1.0, 2.0, 0.5]
+    pwnorm = PointwiseNorm(vfspace, exponent, weighting=weights)
+
+    testarr, func = noise_elements(vfspace)
+    if exponent == float('inf'):
+        true_norm = np.max(np.abs(testarr) *
+                           np.array(weights)[:, None, None], axis=0)
+    else:
+        true_norm = np.sum(np.abs(testarr) ** exponent *
+                           np.array(weights)[:, None, None],
+                           axis=0) ** (1 / exponent)
+
+    assert all_almost_equal(pwnorm(func), true_norm)
+    out = fspace.element()
+    pwnorm(func, out=out)
+    assert all_almost_equal(out, true_norm)
+
+    pwinner = PointwiseInner(vfspace, vecfield=func, weighting=weights)
+    true_inner = np.sum(testarr ** 2 * np.array(weights)[:, None, None],
+                        axis=0)
+    assert all_almost_equal(pwinner(func), true_inner)
+
+
 def test_pointwise_norm_complex(exponent):
     fspace = odl.uniform_discr([0, 0], [1, 1], (2, 2), dtype=complex)
     vfspace = ProductSpace(fspace, 3)
@@ -679,6 +707,37 @@ def test_matrix_op_call_explicit():
         assert np.allclose(result, true_result)
 
 
+def test_matrix_op_call_sparse_threads():
+    """Verify threaded in-place evaluation with sparse matrices."""
+    sparse_matrix = scipy.sparse.random(50, 40, density=0.1, format='csr')
+    true_adjoint = sparse_matrix.T.toarray()
+
+    for num_threads in [1, 3, 100]:
+        mat_op = MatrixOperator(sparse_matrix, num_threads=num_threads)
+        xarr, x = noise_elements(mat_op.domain)
+        true_result = sparse_matrix.dot(xarr)
+        assert all_almost_equal(mat_op(x), true_result)
+        out = mat_op.range.element()
+        mat_op(x, out=out)
+        assert all_almost_equal(out, true_result)
+
+        yarr, y = noise_elements(mat_op.range)
+        assert all_almost_equal(mat_op.adjoint(y), true_adjoint.dot(yarr))
+        # Adjoint (with transposed matrix) is only computed once
+        assert mat_op.adjoint is mat_op.adjoint
+        assert mat_op.adjoint.adjoint is mat_op
+
+    # Aliased input and output
+    mat_op = MatrixOperator(scipy.sparse.eye(5, format='csr') * 2)
+    x = noise_element(mat_op.domain)
+    true_result = 2 * x.asarray()
+    mat_op(x, out=x)
+    assert all_almost_equal(x, true_result)
+
+    with pytest.raises(ValueError):
+        MatrixOperator(sparse_matrix, num_threads=0)
+
+
 def test_matrix_op_adjoint(matrix):
     """Test if the adjoint of matrix operators is correct."""
     dense_matrix = matrix
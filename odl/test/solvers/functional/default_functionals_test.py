@@ -668,5 +668,60 @@ def test_bregman_functional_l2_squared(space, sigma):
     assert all_almost_equal(prox_bregman_dist(x), prox_expected_func(x))
 
 
+@pytest.mark.parametrize('isotropic', [True, False])
+def test_total_variation(isotropic):
+    """Test the total variation functional and its proximal."""
+    space = odl.uniform_discr([0, 0], [1, 1], [12, 10])
+    tv = odl.solvers.TotalVariation(space, isotropic=isotropic,
+                                    prox_niter=500, prox_tol=None)
+    exponent = 2 if isotropic else 1
+    grad = odl.Gradient(space, pad_mode='symmetric')
+    tv_expected = odl.solvers.GroupL1Norm(grad.range, exponent) * grad
+
+    z = noise_element(space)
+    assert tv(z) == pytest.approx(tv_expected(z))
+    assert tv(space.one()) == pytest.approx(0)
+
+    # The proximal point minimizes 1/2 ||x - z||^2 + sigma * TV(x)
+    sigma = 0.01
+    x = tv.proximal(sigma)(z)
+
+    def objective(y):
+        return 0.5 * (y - z).norm() ** 2 + sigma * tv(y)
+
+    for _ in range(5):
+        assert objective(x) <= objective(x + 1e-3 * noise_element(space))
+
+    # Warm-started evaluation with early exit gives the same result
+    tv_warm = odl.solvers.TotalVariation(space, isotropic=isotropic,
+                                         prox_niter=500, prox_tol=1e-8)
+    tv_warm.proximal(sigma)(z)
+    x_warm = tv_warm.proximal(sigma)(z)
+    assert all_almost_equal(x_warm, x, ndigits=4)
+    assert tv_warm.dual.norm() > 0
+
+    # The factory is built once, and its operators for different step
+    # sizes share the buffers
+    assert tv.proximal is tv.proximal
+    x_large = tv.proximal(10 * sigma)(z)
+    assert all_almost_equal(tv.proximal(sigma)(z), x)
+    assert tv(x_large) < tv(x)
+
+    # Translated proximal
+    g = noise_element(space)
+    prox_transl = odl.solvers.proximal_total_variation(
+        space, isotropic=isotropic, g=g, niter=500, tol=None)(sigma)
+    assert all_almost_equal(prox_transl(z + g), x + g, ndigits=4)
+
+    # In-place evaluation with `out` aliasing the input, as in many solvers
+    for g_alias in [None, g]:
+        prox = odl.solvers.proximal_total_variation(
+            space, isotropic=isotropic, g=g_alias, niter=50)(sigma)
+        expected = prox(z)
+        y = z.copy()
+        prox(y, out=y)
+        assert all_almost_equal(y, expected)
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
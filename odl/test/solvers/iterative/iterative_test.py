@@ -22,9 +22,15 @@ import numpy as np
                         'landweber',
                         'conjugate_gradient',
                         'conjugate_gradient_normal',
+                        'lsqr',
+                        'lsmr',
+                        'minres',
                         'mlem',
                         'osmlem',
-                        'kaczmarz'])
+                        'osmlem_blocks',
+                        'kaczmarz',
+                        'sirt',
+                        'sart'])
 def iterative_solver(request):
     """Return a solver given by a name with interface solve(op, x, rhs)."""
     solver_name = request.param
@@ -51,17 +57,38 @@ def iterative_solver(request):
     elif solver_name == 'conjugate_gradient_normal':
         def solver(op, x, rhs):
             odl.solvers.conjugate_gradient_normal(op, x, rhs, niter=10)
+    elif solver_name == 'lsqr':
+        def solver(op, x, rhs):
+            odl.solvers.lsqr(op, x, rhs, niter=10)
+    elif solver_name == 'lsmr':
+        def solver(op, x, rhs):
+            odl.solvers.lsmr(op, x, rhs, niter=10)
+    elif solver_name == 'minres':
+        def solver(op, x, rhs):
+            odl.solvers.minres(op, x, rhs, niter=10)
     elif solver_name == 'mlem':
         def solver(op, x, rhs):
             odl.solvers.mlem(op, x, rhs, niter=10)
     elif solver_name == 'osmlem':
         def solver(op, x, rhs):
             odl.solvers.osmlem([op, op], x, [rhs, rhs], niter=10)
+    elif solver_name == 'osmlem_blocks':
+        def solver(op, x, rhs):
+            odl.solvers.osmlem([op] * 5, x, [rhs] * 5, niter=5,
+                               order='golden_angle', block_size=2,
+                               executor='threads')
     elif solver_name == 'kaczmarz':
         def solver(op, x, rhs):
             norm2 = op.adjoint(op(x)).norm() / x.norm()
             odl.solvers.kaczmarz([op, op], x, [rhs, rhs], niter=20,
                                  omega=0.5 / norm2)
+    elif solver_name == 'sirt':
+        def solver(op, x, rhs):
+            odl.solvers.sirt(op, x, rhs, niter=20)
+    elif solver_name == 'sart':
+        def solver(op, x, rhs):
+            odl.solvers.sart([op] * 4, x, [rhs] * 4, niter=10, block_size=2,
+                             order='golden_angle', executor='threads')
     else:
         raise ValueError('solver not valid')
 
@@ -126,5 +153,338 @@ def test_steepst_descent():
     assert all_almost_equal(x, [1, 1, 1], ndigits=2)
 
 
+def test_multilevel_solve():
+    """Test the coarse-to-fine driver."""
+    space = odl.uniform_discr([0, 0], [1, 1], [16, 12])
+    x_true = space.element(lambda x: x[0] ** 2 + x[1])
+
+    def op_factory(level_space):
+        return odl.ScalingOperator(level_space, 2.0)
+
+    def solver(op, x, niter):
+        # Right-hand side for the level
+        rhs = op(op.domain.element(lambda x: x[0] ** 2 + x[1]))
+        odl.solvers.landweber(op, x, rhs, niter, omega=0.1)
+
+    shapes = []
+    x = space.zero()
+    spaces = odl.solvers.multilevel_solve(
+        op_factory, solver, x, niter=[100, 20, 5], factor=(2, 3),
+        callback=lambda x: shapes.append(x.shape))
+
+    assert [sp.shape for sp in spaces] == [(4, 2), (8, 4), (16, 12)]
+    assert spaces[-1] == space
+    assert shapes == [(4, 2), (8, 4), (16, 12)]
+    # The fine level is warm-started from the coarse solution, hence
+    # the result is better than with the fine level alone
+    x_single = space.zero()
+    solver(op_factory(space), x_single, 5)
+    assert (x - x_true).norm() < 0.5 * (x_single - x_true).norm()
+
+
+def test_multilevel_solve_blur():
+    """Test the coarse-to-fine driver with a discretized blur operator."""
+    space = odl.uniform_discr(0, 1, 64)
+
+    # Gaussian blur on the finest level, applied to the prolongation of
+    # the coarse level elements, such that data is the same on all levels
+    pts = space.points()[:, 0]
+    width = 0.03
+    kernel = np.exp(-(pts[:, None] - pts[None, :]) ** 2 / (2 * width ** 2))
+    kernel *= space.cell_volume / (np.sqrt(2 * np.pi) * width)
+    blur = odl.MatrixOperator(kernel, domain=space, range=space)
+
+    def op_factory(level_space):
+        return blur * odl.Resampling(level_space, space, precomputed=True)
+
+    x_true = space.element(lambda x: np.sin(np.pi * x) + x)
+    data = blur(x_true)
+
+    def solver(op, x, niter):
+        odl.solvers.conjugate_gradient_normal(op, x, data, niter)
+
+    x = space.zero()
+    odl.solvers.multilevel_solve(op_factory, solver, x, niter=[10, 10, 2])
+
+    # Same number of iterations on the finest level only
+    x_single = space.zero()
+    solver(blur, x_single, 2)
+
+    assert (x - x_true).norm() < 0.75 * (x_single - x_true).norm()
+    assert ((blur(x) - data).norm() <
+            0.5 * (blur(x_single) - data).norm())
+
+
+def test_conjugate_gradient_preconditioned():
+    """Test CG and CG on the normal equations with preconditioner."""
+    rng = np.random.RandomState(0)
+    n = 30
+    diag = np.logspace(0, 3, n)
+    mat = rng.randn(n, n) / n + np.diag(diag)
+    mat = (mat + mat.T) / 2
+    op = odl.MatrixOperator(mat)
+    rhs = op.range.element(rng.randn(n))
+    x_true = np.linalg.solve(mat, rhs)
+
+    # Jacobi preconditioner, very good for this diagonal dominant matrix
+    precon = odl.MatrixOperator(np.diag(1 / np.diag(mat)))
+    x = op.domain.zero()
+    odl.solvers.conjugate_gradient(op, x, rhs, niter=10,
+                                   preconditioner=precon)
+    assert all_almost_equal(x, x_true)
+
+    x = op.domain.zero()
+    x_cg = op.domain.zero()
+    precon_normal = odl.MatrixOperator(np.diag(1 / np.sum(mat ** 2, 0)))
+    odl.solvers.conjugate_gradient_normal(op, x, rhs, niter=10,
+                                          preconditioner=precon_normal)
+    odl.solvers.conjugate_gradient_normal(op, x_cg, rhs, niter=10)
+    assert (np.linalg.norm(x - x_true) <
+            0.1 * np.linalg.norm(x_cg - x_true))
+
+
+@pytest.mark.parametrize('solver', ['lsqr', 'lsmr'])
+def test_least_squares_damped(solver):
+    """Test LSQR and LSMR against a direct least-squares solution."""
+    mat = np.random.RandomState(0).rand(8, 5)
+    op = odl.MatrixOperator(mat)
+    rhs = op.range.element(np.arange(8.0))
+    damp = 0.5
+
+    # Damping acts on the difference to the initial value
+    x = op.domain.one()
+    getattr(odl.solvers, solver)(op, x, rhs, niter=20, damp=damp,
+                                 atol=1e-12, btol=1e-12)
+
+    mat_damped = np.vstack([mat, damp * np.eye(5)])
+    rhs_damped = np.concatenate([rhs.asarray() - mat.sum(axis=1),
+                                 np.zeros(5)])
+    expected = 1 + np.linalg.lstsq(mat_damped, rhs_damped, rcond=None)[0]
+    assert all_almost_equal(x, expected)
+
+    # Stop early if the tolerance is reached
+    niter = []
+    x = op.domain.zero()
+    getattr(odl.solvers, solver)(op, x, rhs, niter=100, atol=1e-6,
+                                 btol=1e-6, callback=lambda x: niter.append(1))
+    assert len(niter) < 100
+
+
+def test_minres_indefinite():
+    """Test MINRES with a symmetric indefinite operator."""
+    mat = np.diag([-3.0, -1.0, 2.0, 4.0]) + 0.1
+    op = odl.MatrixOperator(mat)
+    rhs = op.range.element([1, 2, 3, 4])
+
+    x = op.domain.zero()
+    odl.solvers.minres(op, x, rhs, niter=10)
+    assert all_almost_equal(x, np.linalg.solve(mat, rhs.asarray()))
+
+
+def test_conjugate_gradient_block():
+    """Test block CG for several right-hand sides."""
+    rng = np.random.RandomState(0)
+    n = 30
+    num_rhs = 3
+    mat = rng.randn(n, n)
+    mat = mat.T.dot(mat) / n + np.diag(np.logspace(0, 2, n))
+    op = odl.MatrixOperator(mat)
+    block_space = op.domain ** num_rhs
+    rhs = block_space.element([rng.randn(n) for _ in range(num_rhs)])
+    x_true = [np.linalg.solve(mat, rhs_j) for rhs_j in rhs]
+
+    x = block_space.zero()
+    odl.solvers.conjugate_gradient_block(op, x, rhs, niter=n)
+    assert all_almost_equal(x, x_true)
+
+    # With preconditioner and in threads
+    x = block_space.zero()
+    precon = odl.MatrixOperator(np.diag(1 / np.diag(mat)))
+    odl.solvers.conjugate_gradient_block(op, x, rhs, niter=n,
+                                         preconditioner=precon,
+                                         executor='threads')
+    assert all_almost_equal(x, x_true)
+
+    # Fewer iterations needed than for separate CG
+    niter = n // 2
+    x_block = block_space.zero()
+    odl.solvers.conjugate_gradient_block(op, x_block, rhs, niter)
+    x_sep = block_space.zero()
+    for x_j, rhs_j in zip(x_sep, rhs):
+        odl.solvers.conjugate_gradient(op, x_j, rhs_j, niter)
+    assert ((x_block - block_space.element(x_true)).norm() <
+            (x_sep - block_space.element(x_true)).norm())
+
+
+def test_sart_blocks():
+    """Test SART with blocks against SIRT and a least-squares solution."""
+    rng = np.random.RandomState(0)
+    mats = [rng.rand(6, 5) for _ in range(4)]
+    ops = [odl.MatrixOperator(mat) for mat in mats]
+    full_op = odl.MatrixOperator(np.vstack(mats))
+    x_true = full_op.domain.element(rng.rand(5))
+    rhs = [op(x_true) for op in ops]
+
+    # A single block of all subsets is SIRT on the stacked operator
+    x_sirt = full_op.domain.zero()
+    odl.solvers.sirt(full_op, x_sirt, full_op(x_true), niter=10)
+    for executor in [None, 'threads']:
+        x = full_op.domain.zero()
+        odl.solvers.sart(ops, x, rhs, niter=10, block_size=4,
+                         executor=executor)
+        assert all_almost_equal(x, x_sirt)
+
+    # Consistent problem, subsets and blocks converge to the solution
+    for block_size, order in [(1, 'sequential'), (2, 'random')]:
+        x = full_op.domain.zero()
+        odl.solvers.sart(ops, x, rhs, niter=500, block_size=block_size,
+                         order=order, tol=1e-12)
+        assert all_almost_equal(x, x_true, ndigits=5)
+
+    # Cached row and column sums give the same result
+    for _ in range(2):
+        x = full_op.domain.zero()
+        odl.solvers.sart(ops, x, rhs, niter=10, block_size=4,
+                         cache_sums=True)
+        assert all_almost_equal(x, x_sirt)
+
+    with pytest.raises(ValueError):
+        odl.solvers.sart(ops, x, rhs, niter=1, block_size=0)
+    with pytest.raises(ValueError):
+        odl.solvers.sart(ops, x, rhs, niter=1, block_size=2,
+                         executor='process')
+
+
+def test_subset_blocks():
+    """Test the blocks of subsets shared by the ordered subset methods."""
+    from odl.solvers.iterative.statistical import _SubsetBlocks
+
+    blocks = _SubsetBlocks(5, block_size=2, order=[4, 3, 2, 1, 0])
+    assert [list(block) for block in blocks.blocks()] == [[4, 3], [2, 1], [0]]
+
+    # Random order reshuffles the subsets, not only the blocks
+    np.random.seed(0)
+    blocks = _SubsetBlocks(6, block_size=2, order='random')
+    block_sets = set()
+    for _ in range(20):
+        passed = blocks.blocks()
+        assert all_almost_equal(np.sort(np.concatenate(passed)),
+                                np.arange(6))
+        block_sets.update(tuple(sorted(block)) for block in passed)
+    assert len(block_sets) > 3
+
+    # Evaluation in a pool that is shut down at the end
+    results = [None] * 4
+
+    def func(i, out):
+        results[out] = i
+
+    with _SubsetBlocks(4, block_size=4, executor='threads') as blocks:
+        for block in blocks.blocks():
+            blocks.map(func, block, range(4))
+    assert results == [0, 1, 2, 3]
+
+    with pytest.raises(ValueError):
+        _SubsetBlocks(3, block_size=1.5)
+    with pytest.raises(ValueError):
+        _SubsetBlocks(3, order='backwards')
+
+
+def test_subset_order():
+    """Test the orderings of subsets for ordered subset methods."""
+    assert all_almost_equal(odl.solvers.subset_order(4), [0, 1, 2, 3])
+    assert all_almost_equal(odl.solvers.subset_order(3, [2, 0, 1]),
+                            [2, 0, 1])
+    for order in ['golden_angle', 'random']:
+        for num in [1, 7, 64]:
+            perm = odl.solvers.subset_order(num, order)
+            assert all_almost_equal(np.sort(perm), np.arange(num))
+
+    # Golden angle ordering does not visit neighboring subsets in a row
+    perm = odl.solvers.subset_order(64, 'golden_angle')
+    assert np.min(np.abs(np.diff(perm))) > 1
+
+    with pytest.raises(ValueError):
+        odl.solvers.subset_order(3, 'backwards')
+    with pytest.raises(ValueError):
+        odl.solvers.subset_order(3, [0, 1, 1])
+
+
+def test_osmlem_blocks():
+    """Test that OSEM with all subsets in one block is MLEM."""
+    rng = np.random.RandomState(0)
+    mats = [rng.rand(4, 5) for _ in range(3)]
+    ops = [odl.MatrixOperator(mat) for mat in mats]
+    full_op = odl.MatrixOperator(np.vstack(mats))
+    x_true = full_op.domain.element(rng.rand(5))
+    data = [op(x_true) for op in ops]
+
+    x_mlem = full_op.domain.one()
+    odl.solvers.mlem(full_op, x_mlem, full_op(x_true), niter=5)
+
+    for executor in [None, 'threads']:
+        x = full_op.domain.one()
+        odl.solvers.osmlem(ops, x, data, niter=5, block_size=3,
+                           executor=executor)
+        assert all_almost_equal(x, x_mlem)
+
+    # User-provided thread pool
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        x = full_op.domain.one()
+        odl.solvers.osmlem(ops, x, data, niter=5, block_size=3,
+                           executor=pool)
+        assert all_almost_equal(x, x_mlem)
+
+    # Invalid executors are rejected before the iteration
+    x = full_op.domain.one()
+    with pytest.raises(ValueError):
+        odl.solvers.osmlem(ops, x, data, niter=1, block_size=2,
+                           executor='processes')
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        with pytest.raises(ValueError):
+            odl.solvers.osmlem(ops, x, data, niter=1, block_size=2,
+                               executor=pool)
+    with pytest.raises(TypeError):
+        odl.solvers.osmlem(ops, x, data, niter=1, block_size=2,
+                           executor=2)
+    assert all_almost_equal(x, full_op.domain.one())
+
+
+def test_osmlem_sensitivity_cache(tmpdir):
+    """Test caching of the sensitivities in memory and on disk."""
+    from odl.solvers.iterative.statistical import _SENSITIVITY_CACHE
+    op = odl.MatrixOperator(np.eye(3) * 2 + 1)
+    rhs = op(op.domain.element([1, 2, 3]))
+
+    # Caching is opt-in
+    x = op.domain.one()
+    odl.solvers.mlem(op, x, rhs, niter=5)
+    assert op not in _SENSITIVITY_CACHE
+    odl.solvers.mlem(op, x, rhs, niter=5, cache_sensitivities=True)
+    assert op in _SENSITIVITY_CACHE
+
+    # Large operators that only differ in one entry, whose reprs are
+    # equal, do not share their cache files if the keys differ
+    cache_dir = str(tmpdir)
+    mat = np.ones((200, 200))
+    mat_mod = mat.copy()
+    mat_mod[100, 100] = 6
+    rhs = odl.rn(200).one()
+    for matrix, key in [(mat, 'a'), (mat_mod, 'b'), (mat_mod, 'b')]:
+        op = odl.MatrixOperator(matrix)
+        x = op.domain.one()
+        odl.solvers.mlem(op, x, rhs, niter=2, cache_dir=cache_dir,
+                         cache_key=key)
+        x_expected = op.domain.one()
+        odl.solvers.mlem(op, x_expected, rhs, niter=2)
+        assert all_almost_equal(x, x_expected)
+
+    assert len(tmpdir.listdir()) == 2
+
+    with pytest.raises(ValueError):
+        odl.solvers.mlem(op, x, rhs, niter=1, cache_dir=cache_dir)
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -133,5 +133,30 @@ def test_pdhg_product_space():
     assert all_almost_equal(discr_vec, vec_expl, PLACES)
 
 
+def test_pdhg_linesearch():
+    """Test PDHG with linesearch against a closed-form solution."""
+    space = odl.uniform_discr(0, 1, DATA.size)
+    op = odl.ScalingOperator(space, 2.0)
+
+    # Minimize ||x - b||^2 + ||2 x||_1 / 2, solved by soft thresholding
+    b = space.element(DATA - 2.5)
+    f = odl.solvers.L2NormSquared(space).translated(b)
+    g = 0.5 * odl.solvers.L1Norm(space)
+    expected = b - 0.5 * np.sign(b)
+
+    # A far too large initial step size is reduced by the linesearch
+    x = space.zero()
+    y = space.zero()
+    odl.solvers.pdhg_linesearch(x, f, g, op, niter=200, tau=100, y=y)
+    assert all_almost_equal(x, expected, PLACES)
+
+    # The dual variable is a solution of the dual problem
+    assert all_almost_equal(y, 0.5 * np.sign(b), PLACES)
+
+    # Resuming from the solution does not change it
+    odl.solvers.pdhg_linesearch(x, f, g, op, niter=5, y=y)
+    assert all_almost_equal(x, expected, PLACES)
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -0,0 +1,89 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Test for the (accelerated) proximal gradient solvers."""
+
+from __future__ import division
+import numpy as np
+import pytest
+
+import odl
+from odl.util.testutils import all_almost_equal, simple_fixture
+
+
+# --- pytest fixtures --- #
+
+
+restart = simple_fixture('restart', [None, 'function', 'gradient'])
+backtrack = simple_fixture('backtrack', [None, 0.5])
+
+
+# --- Tests --- #
+
+
+def test_accelerated_proximal_gradient(restart, backtrack):
+    """Test FISTA with restart and backtracking on a lasso-type problem."""
+    space = odl.rn(5)
+
+    # Minimize ||x - b||^2 + ||x||_1 / 2, solved by soft thresholding
+    b = space.element([1, -2, 3, -0.2, 0.5])
+    f = 0.5 * odl.solvers.L1Norm(space)
+    g = odl.solvers.L2NormSquared(space).translated(b)
+    expected = np.sign(b) * np.maximum(np.abs(b) - 0.25, 0)
+
+    # The Lipschitz constant of g.gradient is 2; with backtracking, a too
+    # large step size is given
+    gamma = 0.4 if backtrack is None else 10.0
+    x = space.zero()
+    odl.solvers.accelerated_proximal_gradient(
+        x, f, g, gamma, niter=100, restart=restart, backtrack=backtrack)
+    assert all_almost_equal(x, expected)
+
+
+def test_accelerated_proximal_gradient_restart_faster():
+    """Test that adaptive restart speeds up a strongly convex problem."""
+    mat = np.random.RandomState(0).randn(30, 20)
+    op = odl.MatrixOperator(mat)
+    rhs = op.range.element(np.arange(30.0))
+    f = 0.1 * odl.solvers.L1Norm(op.domain)
+    g = odl.solvers.L2NormSquared(op.range).translated(rhs) * op
+    gamma = 1 / (2 * np.linalg.norm(mat, 2) ** 2)
+
+    x_ref = op.domain.zero()
+    odl.solvers.accelerated_proximal_gradient(x_ref, f, g, gamma, niter=2000,
+                                              restart='gradient')
+    obj_ref = (f + g)(x_ref)
+
+    errors = {}
+    for restart in [None, 'function', 'gradient']:
+        x = op.domain.zero()
+        odl.solvers.accelerated_proximal_gradient(x, f, g, gamma, niter=100,
+                                                  restart=restart)
+        errors[restart] = (f + g)(x) - obj_ref
+
+    assert errors['function'] < 1e-2 * errors[None]
+    assert errors['gradient'] < 1e-2 * errors[None]
+
+
+def test_accelerated_proximal_gradient_input():
+    """Test input checking of FISTA."""
+    space = odl.rn(3)
+    f = odl.solvers.L1Norm(space)
+    g = odl.solvers.L2NormSquared(space)
+    x = space.zero()
+
+    with pytest.raises(ValueError):
+        odl.solvers.accelerated_proximal_gradient(x, f, g, 0.1, 10,
+                                                  restart='always')
+    with pytest.raises(ValueError):
+        odl.solvers.accelerated_proximal_gradient(x, f, g, 0.1, 10,
+                                                  backtrack=1.5)
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
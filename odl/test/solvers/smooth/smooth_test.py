@@ -12,10 +12,13 @@ from __future__ import division
 import pytest
 import odl
 from odl.operator import OpNotImplementedError
+from odl.util.testutils import all_almost_equal
 
 
 nonlinear_cg_beta = odl.util.testutils.simple_fixture('nonlinear_cg_beta',
                                                       ['FR', 'PR', 'HS', 'DY'])
+trust_region = odl.util.testutils.simple_fixture('trust_region',
+                                                 [False, True])
 
 
 @pytest.fixture(scope="module", params=['l2_squared', 'l2_squared_scaled',
@@ -90,6 +93,31 @@ def test_newton_solver(functional_and_linesearch):
     assert functional(x) < 1e-3
 
 
+def test_newton_cg_method(functional, trust_region):
+    """Test the inexact Newton-CG solver."""
+    try:
+        # Test if derivative exists
+        functional.gradient.derivative(functional.domain.zero())
+    except OpNotImplementedError:
+        return
+
+    x = functional.domain.one()
+    odl.solvers.newton_cg_method(functional, x, tol=1e-6,
+                                 trust_region=trust_region)
+    assert functional(x) < 1e-6
+
+
+def test_newton_cg_method_negative_curvature(trust_region):
+    """Test Newton-CG started in a point with indefinite Hessian."""
+    rosenbrock = odl.solvers.RosenbrockFunctional(odl.rn(2))
+
+    # The Hessian in [0, 1] has the eigenvalues -398 and 200
+    x = rosenbrock.domain.element([0, 1])
+    odl.solvers.newton_cg_method(rosenbrock, x, tol=1e-10, cg_maxiter=5,
+                                 trust_region=trust_region)
+    assert all_almost_equal(x, rosenbrock.domain.one())
+
+
 def test_bfgs_solver(functional_and_linesearch):
     """Test the BFGS quasi-Newton solver."""
     functional, line_search = functional_and_linesearch
@@ -112,6 +140,49 @@ def test_lbfgs_solver(functional_and_linesearch):
     assert functional(x) < 1e-3
 
 
+def test_lbfgs_method(functional):
+    """Test the L-BFGS solver with strong Wolfe line search."""
+    x = functional.domain.one()
+    odl.solvers.lbfgs_method(functional, x, tol=1e-6)
+    assert functional(x) < 1e-6
+
+
+def test_lbfgs_method_ring_buffer():
+    """Test L-BFGS with more iterations than stored correction pairs."""
+    rosenbrock = odl.solvers.RosenbrockFunctional(odl.rn(5), scale=10)
+
+    x = rosenbrock.domain.zero()
+    niter = []
+    odl.solvers.lbfgs_method(rosenbrock, x, tol=1e-10, num_store=2,
+                             callback=lambda x: niter.append(1))
+    assert len(niter) > 2
+    assert all_almost_equal(x, rosenbrock.domain.one())
+
+
+def test_lbfgs_memory_rejected_pair():
+    """Test that a rejected correction pair leaves the memory intact."""
+    from odl.solvers.smooth.newton import _LBFGSMemory
+    space = odl.rn(3)
+    memory = _LBFGSMemory(space, num_store=2)
+    for s_vec, y_vec in [([1, 0, 0], [2, 0, 1]), ([0, 1, 0], [0, 3, 1])]:
+        s, y = memory.slot()
+        s.assign(space.element(s_vec))
+        y.assign(space.element(y_vec))
+        memory.commit(y.inner(s))
+
+    x = space.element([1, 2, 3])
+    expected = space.element()
+    memory.apply_hessinv(x, out=expected, scale=True)
+
+    # Pair with <y, s> <= 0 is filled in, but not committed
+    s, y = memory.slot()
+    s.assign(space.element([1, 1, 1]))
+    y.assign(space.element([-1, -1, -1]))
+    result = space.element()
+    memory.apply_hessinv(x, out=result, scale=True)
+    assert all_almost_equal(result, expected)
+
+
 def test_broydens_method(broyden_impl, functional_and_linesearch):
     """Test the ``broydens_method`` quasi-Newton solver."""
     functional, line_search = functional_and_linesearch
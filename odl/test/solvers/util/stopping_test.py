@@ -0,0 +1,116 @@
+# Copyright 2014-2017 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Test for the stopping criteria of iterative solvers."""
+
+from __future__ import division
+import numpy as np
+import pytest
+
+import odl
+from odl.util.testutils import all_almost_equal, simple_fixture
+
+
+# --- pytest fixtures --- #
+
+
+solver = simple_fixture('solver',
+                        ['pdhg', 'douglas_rachford_pd', 'forward_backward_pd',
+                         'admm_linearized', 'landweber', 'osmlem'])
+
+
+def run_solver(name, niter, callback, **kwargs):
+    """Run solver ``name`` on a small problem, return result and solution.
+
+    The nonsmooth solvers minimize ``||x - b||^2 + ||x||_1 / 2``, whose
+    solution is given by soft thresholding, the others solve a linear
+    system.
+    """
+    space = odl.rn(4)
+    b = space.element([1, -2, 3, -0.5])
+    l2 = odl.solvers.L2NormSquared(space).translated(b)
+    l1 = 0.5 * odl.solvers.L1Norm(space)
+    ident = odl.IdentityOperator(space)
+    x = space.zero()
+
+    if name == 'pdhg':
+        odl.solvers.pdhg(x, l2, l1, ident, niter, tau=0.5, sigma=0.5,
+                         callback=callback, **kwargs)
+    elif name == 'douglas_rachford_pd':
+        odl.solvers.douglas_rachford_pd(x, l2, [l1], [ident], niter,
+                                        tau=0.5, sigma=[1.0],
+                                        callback=callback, **kwargs)
+    elif name == 'forward_backward_pd':
+        odl.solvers.forward_backward_pd(x, odl.solvers.ZeroFunctional(space),
+                                        [l1], [ident], l2, niter=niter,
+                                        tau=0.2, sigma=[1.0],
+                                        callback=callback, **kwargs)
+    elif name == 'admm_linearized':
+        odl.solvers.admm_linearized(x, l2, l1, ident, niter=niter, tau=0.5,
+                                    sigma=1.0, callback=callback, **kwargs)
+    else:
+        mat = np.eye(4) * 3 + np.ones((4, 4))
+        op = odl.MatrixOperator(mat)
+        expected = space.element([1, 2, 3, 0.5])
+        x = space.one()
+        if name == 'landweber':
+            odl.solvers.landweber(op, x, op(expected), niter, omega=0.03,
+                                  callback=callback, **kwargs)
+        else:
+            odl.solvers.osmlem([op], x, [op(expected)], niter,
+                               callback=callback, **kwargs)
+        return x, expected
+
+    expected = b - 0.25 * np.sign(b)
+    return x, expected
+
+
+# --- Tests --- #
+
+
+def test_relative_change():
+    """Test the basic properties of `RelativeChange`."""
+    stop = odl.solvers.RelativeChange(0.1, check_every=2)
+    assert stop.tol == 0.1
+    assert stop.check_every == 2
+    assert [stop.is_due(i) for i in range(4)] == [False, True, False, True]
+    assert stop([0.05, 0.0], [1.0, 0.0])
+    assert not stop([0.05, 0.2], [1.0, 1.0])
+
+    with pytest.raises(ValueError):
+        odl.solvers.RelativeChange(-1)
+    with pytest.raises(ValueError):
+        odl.solvers.RelativeChange(0.1, check_every=0)
+
+
+def test_solver_tol(solver):
+    """Test that solvers stop early with ``tol`` and ``stopping``."""
+    niter = 2000
+
+    iters = []
+    result, expected = run_solver(solver, niter,
+                                  callback=lambda x: iters.append(1),
+                                  tol=1e-10)
+    assert len(iters) < niter
+    assert all_almost_equal(result, expected, ndigits=5)
+
+    # Checking only every 7 iterations stops at a multiple of 7, later
+    # than checking in every iteration
+    iters_every = []
+    stop = odl.solvers.RelativeChange(1e-10, check_every=7)
+    run_solver(solver, niter, callback=lambda x: iters_every.append(1),
+               stopping=stop)
+    assert len(iters_every) % 7 == 0
+    assert len(iters) <= len(iters_every) < len(iters) + 7
+
+    with pytest.raises(ValueError):
+        run_solver(solver, niter, callback=None, tol=1e-10, stopping=stop)
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
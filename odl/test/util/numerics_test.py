@@ -13,7 +13,8 @@ import pytest
 import odl
 from odl.util import (
     apply_on_boundary, fast_1d_tensor_mult, resize_array, is_real_dtype)
-from odl.util.numerics import _SUPPORTED_RESIZE_PAD_MODES
+from odl.util.numerics import (
+    _SUPPORTED_RESIZE_PAD_MODES, _apply_blockwise, _block_slices)
 from odl.util.testutils import all_equal, dtype_tol, simple_fixture
 
 
@@ -482,5 +483,42 @@ def test_resize_array_raise():
         resize_array(small_arr, (3, 4), offset=(0, 1), pad_mode='periodic')
 
 
+def test_block_slices():
+    """Test the splitting of a range into blocks."""
+    assert (_block_slices(7, block_size=3) ==
+            [slice(0, 3), slice(3, 6), slice(6, 7)])
+    assert _block_slices(6, block_size=3) == [slice(0, 3), slice(3, 6)]
+    assert _block_slices(0, block_size=3) == []
+
+    # Rows of 2 entries, and rows larger than a block
+    assert _block_slices(4, unit_size=2, block_size=5) == [slice(0, 2),
+                                                           slice(2, 4)]
+    assert len(_block_slices(3, unit_size=10, block_size=5)) == 3
+
+
+@pytest.mark.parametrize('order', ['C', 'F'])
+def test_apply_blockwise(order):
+    """Test block-wise evaluation with several outputs and temporaries."""
+    space = odl.rn((300, 500))
+    x = odl.phantom.white_noise(space)
+    y = odl.phantom.white_noise(space)
+    out1 = space.element(order=order)
+    out2 = space.element(order=order)
+    out2[:] = 1
+    max_block = []
+
+    def kernel(in_blocks, out_blocks, tmps):
+        np.multiply(in_blocks[0], in_blocks[1], out=tmps[0])
+        np.add(in_blocks[0], tmps[0], out=out_blocks[0])
+        out_blocks[1] += tmps[0]
+        max_block.append(tmps[0].size)
+
+    _apply_blockwise(kernel, [x, y], [out1, out2])
+    assert all_equal(out1, x + x * y)
+    assert all_equal(out2, 1 + x * y)
+    assert max(max_block) < space.size
+    assert out1.asarray().flags[order + '_CONTIGUOUS']
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
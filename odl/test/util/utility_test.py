@@ -10,9 +10,10 @@ from __future__ import division
 import odl
 import numpy as np
 
+from odl.util.testutils import all_almost_equal
 from odl.util.utility import (
     is_numeric_dtype, is_real_dtype, is_real_floating_dtype,
-    is_complex_floating_dtype)
+    is_complex_floating_dtype, _thread_pool)
 
 
 real_float_dtypes = np.sctypes['float']
@@ -49,5 +50,25 @@ def test_is_complex_floating_dtype():
         assert is_complex_floating_dtype(dtype)
 
 
+# ---- Parallel helpers ---- #
+
+
+def test_thread_pool():
+    """Test that the thread pool is created once and shared."""
+    pool = _thread_pool()
+    assert _thread_pool() is pool
+    assert pool.submit(sum, [1, 2]).result() == 3
+
+    # Repeated multi-threaded evaluations use the same pool
+    part = odl.uniform_partition(0, 1, 50)
+    fspace = odl.FunctionSpace(part.set)
+    coll_op = odl.PointCollocation(fspace, part, odl.rn(50), block_size=5,
+                                   num_threads=2)
+    func = fspace.element(lambda x: x ** 2)
+    for _ in range(3):
+        assert all_almost_equal(coll_op(func), part.grid.coord_vectors[0] ** 2)
+    assert _thread_pool() is pool
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -21,6 +21,11 @@ __all__ = ('apply_on_boundary', 'fast_1d_tensor_mult', 'resize_array',
 _SUPPORTED_RESIZE_PAD_MODES = ('constant', 'symmetric', 'periodic',
                                'order0', 'order1')
 
+# Number of array entries processed at once by block-wise kernels. The
+# blocks of all arrays and temporaries of a kernel should fit into the
+# L2 cache.
+_BLOCK_SIZE = 2 ** 16
+
 
 def apply_on_boundary(array, func, only_once=True, which_boundaries=None,
                       axis_order=None, out=None):
@@ -836,6 +841,72 @@ def zscore(arr):
     return arr
 
 
+def _block_slices(size, unit_size=1, block_size=None):
+    """Return slices ``start:stop`` covering ``range(size)`` in blocks.
+
+    Each index stands for ``unit_size`` array entries, e.g. a row of a
+    multi-dimensional array, and a block comprises at most
+    ``block_size`` entries, but at least one index. The default
+    ``None`` means `_BLOCK_SIZE`.
+    """
+    if block_size is None:
+        block_size = _BLOCK_SIZE
+    step = max(1, block_size // max(unit_size, 1))
+    return [slice(start, min(start + step, size))
+            for start in range(0, size, step)]
+
+
+def _apply_blockwise(kernel, inputs, outputs, num_tmp=1):
+    """Evaluate a point-wise ``kernel`` block by block.
+
+    Point-wise operations over several components usually need one
+    pass over memory per component and elementary operation. Doing all
+    of them block-wise reduces memory traffic since the blocks stay in
+    the cache between the operations.
+
+    Parameters
+    ----------
+    kernel : callable
+        Function with signature ``kernel(in_blocks, out_blocks, tmps)``,
+        where ``in_blocks`` and ``out_blocks`` are the lists of
+        one-dimensional blocks of the input and output arrays, and
+        ``tmps`` is a list of ``num_tmp`` temporary arrays of the same
+        size with the data type of ``outputs[0]``. The output blocks are
+        modified in-place and may also be read.
+    inputs : sequence of `Tensor` or `DiscreteLpElement`
+        Input functions, all with the same shape as the outputs.
+    outputs : sequence of `Tensor` or `DiscreteLpElement`
+        Elements to which the results are written.
+    num_tmp : nonnegative int, optional
+        Number of temporary arrays passed to ``kernel``.
+    """
+    out_arrs = [out.asarray() for out in outputs]
+    # Flatten all arrays consistently with the memory layout of the
+    # first output
+    if (out_arrs[0].flags.f_contiguous and
+            not out_arrs[0].flags.c_contiguous):
+        order = 'F'
+    else:
+        order = 'C'
+    out_flat = [arr.ravel(order) for arr in out_arrs]
+    in_flat = [x.asarray().ravel(order) for x in inputs]
+
+    blocks = _block_slices(out_flat[0].size)
+    tmp_size = blocks[0].stop if blocks else 0
+    tmps = [np.empty(tmp_size, dtype=out_flat[0].dtype)
+            for _ in range(num_tmp)]
+    for blk in blocks:
+        n = blk.stop - blk.start
+        kernel([x[blk] for x in in_flat], [x[blk] for x in out_flat],
+               [tmp[:n] for tmp in tmps])
+
+    for out, arr, arr_flat in zip(outputs, out_arrs, out_flat):
+        if not (np.may_share_memory(arr_flat, arr) and
+                np.may_share_memory(arr, out.asarray())):
+            # Results are in a copy, write them back
+            out[:] = arr_flat.reshape(arr.shape, order=order)
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()
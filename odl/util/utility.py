@@ -12,6 +12,7 @@ from __future__ import absolute_import, division, print_function
 
 import inspect
 import sys
+import threading
 from builtins import object
 from collections import OrderedDict
 from functools import wraps
@@ -1611,6 +1612,36 @@ def unique(seq):
         return unique_values
 
 
+def _cpu_count():
+    """Return the number of CPUs."""
+    try:
+        from os import cpu_count
+    except ImportError:  # Python 2
+        from multiprocessing import cpu_count
+    return cpu_count() or 1
+
+
+_THREAD_POOL = None
+_THREAD_POOL_LOCK = threading.Lock()
+
+
+def _thread_pool():
+    """Return a thread pool shared by the multi-threaded kernels.
+
+    The pool has one worker per CPU. It is created on first use and
+    kept alive, such that repeated evaluations do not start and stop
+    threads. Callers that may run inside a task of this pool should
+    leave at least one worker free, e.g. by doing part of the work in
+    the calling thread.
+    """
+    global _THREAD_POOL
+    with _THREAD_POOL_LOCK:
+        if _THREAD_POOL is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _THREAD_POOL = ThreadPoolExecutor(max_workers=_cpu_count())
+    return _THREAD_POOL
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()